@@ -0,0 +1,65 @@
+"""
+Bot input benchmark.
+
+Time of a swarm input tick for many aiming bots, with the nearest asteroid found
+by the shared spatial grid and, for comparison, by a scan of all the world objects.
+
+Run from the project root:
+    python benchmarks/bench_bots.py
+"""
+
+import common
+from common import create_world, measure, print_table
+
+import math
+import random
+
+from bots import BotSwarm, AimAtNearestAsteroidStrategy
+
+WORLD_SIZE = (4000, 4000)
+REPEAT = 5
+
+
+class ScanNearestGrid(object):
+    """ The same query of SpatialHashGrid.query_nearest, scanning every asteroid """
+
+    def __init__(self, world):
+        self._world = world
+
+    def query_nearest(self, x, y, max_radius):
+        best_id = None
+        best_distance = max_radius
+        for object_id, world_object in self._world.get_objects_list().items():
+            if type(world_object).__name__ != 'Asteroid':
+                continue
+            distance = math.hypot(world_object.position.x - x, world_object.position.y - y)
+            if distance <= best_distance:
+                best_id = object_id
+                best_distance = distance
+        return best_id
+
+
+def run(num_bots, num_asteroids):
+    world, game_object_factory, _ = create_world(num_asteroids, seed=num_bots, world_size=WORLD_SIZE)
+    rng = random.Random(num_bots)
+    swarm = BotSwarm(world)
+    strategy = AimAtNearestAsteroidStrategy()
+    for _ in range(num_bots):
+        starship = game_object_factory.create_starship(rng.uniform(-1900, 1900), rng.uniform(-1900, 1900))
+        swarm.add_bot(starship, strategy)
+
+    grid_time = measure(swarm.handle_input, REPEAT)
+
+    scan = ScanNearestGrid(world)
+    scan_time = measure(lambda: [bot.apply_strategy(scan) for bot in swarm.bots], REPEAT)
+
+    return [num_bots, num_asteroids, "%.2f" % (scan_time * 1000), "%.2f" % (grid_time * 1000)]
+
+
+def main():
+    rows = [run(bots, asteroids) for (bots, asteroids) in ((100, 200), (1000, 200), (1000, 1000))]
+    print_table(["bots", "asteroids", "scan ms/tick", "grid ms/tick"], rows)
+
+
+if __name__ == "__main__":
+    main()
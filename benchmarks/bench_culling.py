@@ -0,0 +1,82 @@
+"""
+Visibility culling benchmark.
+
+Cost of the world cull with the bounding-box test of all the slots at once, on
+the slot arrays of the positions and the radii, versus:
+    - transforming the vertexes of every object (the vertexes test that is now
+      kept for the objects across a bound)
+    - the same bounding-box test on an (x, y, radius) array rebuilt from the
+      objects at every tick (the baseline)
+The slot arrays are written by World.process() as the objects move. That cost
+is measured as a loop over the objects doing only the writes (an upper bound:
+process() already iterates the objects), and is added to the cull time of the
+slot arrays in the speedup. The whole process() tick is reported too, with the
+share of the writes.
+
+Run from the project root:
+    python benchmarks/bench_culling.py
+"""
+
+import common
+from common import create_world, measure, print_table
+
+import unittest.mock
+
+import numpy as np
+
+from handles import INDEX_MASK
+
+REPEAT = 200
+
+
+def run(num_asteroids):
+    world, _, _ = create_world(num_asteroids, seed=num_asteroids)
+    # Keep the object count stable: no spawn during the measure
+    world.asteroid_generator = unittest.mock.MagicMock()
+    world.asteroid_generator.get_new_asteroid.return_value = None
+    objects_list = world.get_objects_list()
+    objects = list(objects_list.values())
+
+    def vertexes_cull():
+        return [graphic_object for graphic_object in objects if not world._is_object_visible(graphic_object)]
+
+    def rebuilt_boxes_cull():
+        keys = np.fromiter(objects_list.keys(), dtype=np.int64, count=len(objects_list))
+        boxes = np.array([(graphic_object.position.x, graphic_object.position.y,
+                           np.nan if graphic_object.bounding_radius is None else graphic_object.bounding_radius)
+                          for graphic_object in objects_list.values()], dtype=np.float64)
+        x, y, radius = boxes[:, 0], boxes[:, 1], boxes[:, 2]
+        inside = ((x - radius > world._x_min) & (x + radius < world._x_max)
+                  & (y - radius > world._y_min) & (y + radius < world._y_max))
+        beyond = ((x + radius <= world._x_min) | (x - radius >= world._x_max)
+                  | (y + radius <= world._y_min) | (y - radius >= world._y_max))
+        return keys[beyond].tolist(), keys[~(inside | beyond)].tolist()
+
+    def slot_writes():
+        slot_x, slot_y = world._slot_x, world._slot_y
+        for key, graphic_object in objects_list.items():
+            position = graphic_object.position
+            slot_x[key & INDEX_MASK] = position.x
+            slot_y[key & INDEX_MASK] = position.y
+
+    # Nothing is culled or moved: the objects are inside the bounds and the ticks last 0 seconds,
+    # so every run does the same work
+    slots_time = measure(world._remove_objects_not_visible, REPEAT)
+    rebuilt_time = measure(rebuilt_boxes_cull, REPEAT)
+    vertexes_time = measure(vertexes_cull, REPEAT)
+    writes_time = measure(slot_writes, REPEAT)
+    process_time = measure(lambda: world.process(0), REPEAT)
+    return [num_asteroids, "%.1f" % (vertexes_time * 1000000), "%.1f" % (rebuilt_time * 1000000),
+            "%.1f" % (slots_time * 1000000), "%.1f" % (writes_time * 1000000),
+            "%.1fx" % (rebuilt_time / (slots_time + writes_time)), "%.1f" % (process_time * 1000000),
+            "%.1f%%" % (writes_time / process_time * 100)]
+
+
+def main():
+    rows = [run(asteroids) for asteroids in (10, 100, 1000, 5000)]
+    print_table(["objects", "vertexes us", "rebuilt boxes us", "slot arrays us", "slot writes us",
+                 "speedup", "process() us", "writes in process()"], rows)
+
+
+if __name__ == "__main__":
+    main()
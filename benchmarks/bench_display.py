@@ -0,0 +1,62 @@
+"""
+Display benchmark.
+
+Draws a world of moving asteroids on the dummy (offscreen) SDL video driver,
+pushing the whole window each frame versus only the dirty rectangles, and
+reports the pixels pushed and the draw + update time per frame.
+
+Run from the project root:
+    python benchmarks/bench_display.py
+"""
+
+import os
+
+# An offscreen window: the measure does not depend on a desktop
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import common
+from common import create_world, print_table
+
+import time
+
+import pygame
+
+from display import Display
+
+FRAMES = 100
+TICK_SECONDS = 1 / 30
+WORLD_SIZE = (800, 600)
+
+
+def run(num_asteroids, dirty_rects):
+    world, _, _ = create_world(num_asteroids, seed=num_asteroids, world_size=WORLD_SIZE)
+    surface = pygame.display.set_mode(WORLD_SIZE)
+    display_obj = Display(WORLD_SIZE[0], WORLD_SIZE[1], surface, dirty_rects)
+    pixels = 0
+    elapsed = 0.0
+    for _ in range(FRAMES):
+        world.process(TICK_SECONDS)
+        world_objects = world.get_world_objects_list()
+        start = time.perf_counter()
+        display_obj.begin_frame()
+        for world_object in world_objects:
+            display_obj.draw_world_vertexes(world_object.vertexes, world_object.color)
+        pixels += display_obj.end_frame()
+        elapsed += time.perf_counter() - start
+    return pixels / FRAMES, elapsed / FRAMES
+
+
+def main():
+    pygame.display.init()
+    rows = []
+    for asteroids in (5, 20, 100, 500):
+        full_pixels, full_time = run(asteroids, False)
+        dirty_pixels, dirty_time = run(asteroids, True)
+        rows.append([asteroids, "%d" % full_pixels, "%d" % dirty_pixels,
+                     "%.3f" % (full_time * 1000), "%.3f" % (dirty_time * 1000)])
+    pygame.display.quit()
+    print_table(["asteroids", "full px/frame", "dirty px/frame", "full ms/frame", "dirty ms/frame"], rows)
+
+
+if __name__ == "__main__":
+    main()
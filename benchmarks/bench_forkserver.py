@@ -0,0 +1,69 @@
+"""
+Match start latency benchmark: cold process versus pre-forked worker.
+
+The cold start launches a new interpreter that imports the game, parses the
+configuration, builds the factories and creates the World. The pre-forked
+start hands the match to an idle worker of a PreforkServer. Both are measured
+until the World of the match is ready.
+
+Run from the project root:
+    python benchmarks/bench_forkserver.py
+"""
+
+import common
+from common import print_table
+
+import os
+import subprocess
+import sys
+import time
+
+from forkserver import PreforkServer
+
+STARTS = 10
+
+COLD_START_CODE = """
+import sys
+sys.path[:0] = [%r, %r]
+from server import SharedResources
+SharedResources().create_world()
+"""
+
+
+def _empty_match(world, match_spec):
+    return None
+
+
+def cold_start():
+    src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+    code = COLD_START_CODE % (src_dir, os.path.join(src_dir, 'Main'))
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='1')
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], check=True, env=env)
+    return time.perf_counter() - start
+
+
+def main():
+    cold = sorted(cold_start() for _ in range(STARTS))
+
+    server = PreforkServer(_empty_match, pool_size=2)
+    server.start()
+    prefork = []
+    for _ in range(STARTS):
+        start = time.perf_counter()
+        worker = server.start_match()
+        worker.wait_ready()
+        prefork.append(time.perf_counter() - start)
+        # The replacement worker is forked out of the start path
+        server.refill()
+        worker.join()
+    server.shutdown()
+    prefork.sort()
+
+    rows = [["cold process", "%.1f" % (cold[len(cold) // 2] * 1000), "%.1f" % (cold[-1] * 1000)],
+            ["pre-forked", "%.1f" % (prefork[len(prefork) // 2] * 1000), "%.1f" % (prefork[-1] * 1000)]]
+    print_table(["start", "median ms", "max ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Garbage collector benchmark.
+
+Runs a stress scenario as a paced frame loop with the default collector and
+with the control mode (frozen startup objects, raised thresholds, full
+collections in the idle time), and reports the collection pauses that fell
+inside the frames.
+
+Run from the project root:
+    python benchmarks/bench_gc.py
+"""
+
+import common
+from common import create_scenario_world, print_table
+
+import time
+
+from gccontrol import GarbageCollectorControl
+from soak import percentile
+
+FRAMES = 300
+FRAME_SECONDS = 1 / 30
+
+
+def run(control):
+    world, driver = create_scenario_world('dense_clusters')
+    gc_control = GarbageCollectorControl(control, full_collection_frames=100)
+    gc_control.start()
+    pauses = []
+    try:
+        for _ in range(FRAMES):
+            frame_start = time.perf_counter()
+            gc_control.frame_started()
+            driver.handle_input()
+            world.process(FRAME_SECONDS)
+            world.get_world_objects_list()
+            # No sleep: the idle time is only given to the collector
+            gc_control.run_idle(FRAME_SECONDS - (time.perf_counter() - frame_start))
+            pauses.append(gc_control.frame_finished())
+    finally:
+        gc_control.close()
+    pauses.sort()
+    return ["control" if control else "default", sum(1 for pause in pauses if pause > 0),
+            "%.3f" % (percentile(pauses, 0.99) * 1000), "%.3f" % (pauses[-1] * 1000)]
+
+
+def main():
+    rows = [run(False), run(True)]
+    print_table(["collector", "frames with gc", "p99 pause ms", "max pause ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Keyboard input benchmark: polling versus events.
+
+Replays the same scripted key presses (half short taps, half held keys) on a
+virtual clock at 30 ticks per second, through the polling KeyboardInputHandler
+(pygame.key.get_pressed() returns the scripted state) and the EventInputHandler
+(it gets the scripted KEYDOWN/KEYUP events), and reports:
+    - the presses that gave no action at all (the taps between two ticks, when polling)
+    - the latency from the scripted press to the tick applying its first action,
+      over all the presses acted on, and over the presses both handlers acted on
+    - the cost of reading the input once per frame, with the real pygame
+      (dummy video driver, no key pressed)
+
+Run from the project root:
+    python benchmarks/bench_input.py
+"""
+
+import os
+
+# An offscreen window: the measure does not depend on a desktop
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import common
+from common import measure, print_table
+
+import random
+import statistics
+import unittest.mock
+
+import pygame
+
+from graphicobjects import StarShip
+from input_handler import KeyboardInputHandler, EventInputHandler
+import constants
+
+PRESSES = 2000
+FPS = 30
+REPEAT = 20000
+
+
+class ScriptedWorld(object):
+    """ The part of the World the input handlers use """
+
+    def __init__(self):
+        self.starship = StarShip(0, 0, constants.WHITE)
+        self.tick = 0
+
+    def add_object(self, game_object):
+        pass
+
+
+def create_presses(seed=0):
+    """ The (press time, release time) of the D key, one at a time """
+    rng = random.Random(seed)
+    presses = []
+    now = 0.0
+    for index in range(PRESSES):
+        now += rng.uniform(0.02, 0.1)
+        duration = rng.uniform(0.01, 0.03) if index % 2 else rng.uniform(0.06, 0.3)
+        presses.append((now, now + duration))
+        now += duration
+    return presses
+
+
+def replay(handler_class, presses):
+    """ Run the ticks of the presses through a handler
+    :return: press index -> seconds from the press to its first action, for the presses acted on
+    """
+    clock = [0.0]
+    world = ScriptedWorld()
+    handler = handler_class(world, clock=lambda: clock[0])
+    command_handler = handler.get_command_handler()
+    command_handler.history = []
+    events = []
+    for press, release in presses:
+        events.append((press, pygame.event.Event(pygame.KEYDOWN, key=pygame.K_d)))
+        events.append((release, pygame.event.Event(pygame.KEYUP, key=pygame.K_d)))
+    keys = [False] * 512
+
+    def get_pressed():
+        return keys
+
+    first_actions = {}
+    next_event = 0
+    end = presses[-1][1] + 1
+    tick = 0
+    with unittest.mock.patch('pygame.key.get_pressed', get_pressed):
+        while clock[0] < end:
+            now = clock[0] = tick / FPS
+            # The events of the frame, and the key state they leave
+            frame_events = []
+            while next_event < len(events) and events[next_event][0] <= now:
+                frame_events.append(events[next_event][1])
+                keys[pygame.K_d] = events[next_event][1].type == pygame.KEYDOWN
+                next_event += 1
+            handler.handle_events(frame_events)
+            applied = len(command_handler.history)
+            handler.handle_input()
+            # The presses are one at a time: an action is of the last press started
+            last_press = (next_event - 1) // 2
+            if len(command_handler.history) > applied and last_press not in first_actions:
+                first_actions[last_press] = now - presses[last_press][0]
+            world.tick += 1
+            tick += 1
+    return first_actions
+
+
+def read_polling(handler):
+    pygame.event.get()
+    handler.sample_input()
+
+
+def read_events(handler):
+    handler.handle_events(pygame.event.get())
+    handler.sample_input()
+
+
+def main():
+    pygame.display.init()
+    pygame.display.set_mode((100, 100))
+    presses = create_presses()
+    handlers = (("polling", KeyboardInputHandler, read_polling), ("events", EventInputHandler, read_events))
+    first_actions = [replay(handler_class, presses) for _, handler_class, _ in handlers]
+    both = set(first_actions[0]).intersection(first_actions[1])
+    rows = []
+    for (name, handler_class, read), latencies in zip(handlers, first_actions):
+        handler = handler_class(ScriptedWorld())
+        cost = measure(lambda: read(handler), REPEAT)
+        rows.append([name, "%d / %d" % (PRESSES - len(latencies), PRESSES),
+                     "%.1f" % (statistics.mean(latencies.values()) * 1000),
+                     "%.1f" % (statistics.mean(latencies[index] for index in both) * 1000),
+                     "%.1f" % (max(latencies.values()) * 1000), "%.2f" % (cost * 1e6)])
+    pygame.display.quit()
+    print_table(["input", "presses missed", "press to action ms", "same presses ms", "max ms",
+                 "read us/frame"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Input command queue benchmark.
+
+Compares the lock-free SPSCQueue with queue.Queue for the input commands:
+the cost of pushing a command and draining it at the start of a tick, on
+one thread, and the throughput with a producer thread and a consumer thread.
+
+Run from the project root:
+    python benchmarks/bench_inputcommands.py
+"""
+
+import common
+from common import measure, print_table
+
+import queue
+import threading
+import time
+
+from inputcommands import InputCommand, SPSCQueue
+
+REPEAT = 200000
+THREADED_ITEMS = 200000
+COMMAND = InputCommand(0.0, 10, True)
+
+
+def spsc_round_trip(commands):
+    commands.push(COMMAND)
+    commands.drain()
+
+
+def queue_round_trip(commands):
+    commands.put_nowait(COMMAND)
+    try:
+        while True:
+            commands.get_nowait()
+    except queue.Empty:
+        pass
+
+
+def spsc_threaded():
+    commands = SPSCQueue(capacity=1024)
+
+    def produce():
+        for _ in range(THREADED_ITEMS):
+            while not commands.push(COMMAND):
+                time.sleep(0)
+
+    producer = threading.Thread(target=produce)
+    start = time.perf_counter()
+    producer.start()
+    received = 0
+    while received < THREADED_ITEMS:
+        received += len(commands.drain())
+        time.sleep(0)
+    producer.join()
+    return time.perf_counter() - start
+
+
+def queue_threaded():
+    commands = queue.Queue(maxsize=1024)
+
+    def produce():
+        for _ in range(THREADED_ITEMS):
+            commands.put(COMMAND)
+
+    producer = threading.Thread(target=produce)
+    start = time.perf_counter()
+    producer.start()
+    for _ in range(THREADED_ITEMS):
+        commands.get()
+    producer.join()
+    return time.perf_counter() - start
+
+
+def main():
+    spsc = SPSCQueue()
+    locked = queue.Queue(maxsize=256)
+    rows = [["SPSCQueue", "%.2f" % (measure(lambda: spsc_round_trip(spsc), REPEAT) * 1e6),
+             "%.0f" % (THREADED_ITEMS / spsc_threaded())],
+            ["queue.Queue", "%.2f" % (measure(lambda: queue_round_trip(locked), REPEAT) * 1e6),
+             "%.0f" % (THREADED_ITEMS / queue_threaded())]]
+    print_table(["queue", "push + drain us", "threaded commands/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Interest management benchmark.
+
+The world grows while the density of asteroids stays the same. The per-client
+encoding cost with the interest set should stay flat, while the cost of sending
+the whole world grows with its size.
+
+Run from the project root:
+    python benchmarks/bench_interest.py
+"""
+
+import common
+from common import create_world, print_table
+
+import random
+import time
+
+from snapshot import SnapshotEncoder
+from interest import InterestManager
+
+CLIENTS = 4
+TICKS = 20
+TICK_SECONDS = 1 / 30
+# Asteroids per 100x100 pixels
+DENSITY = 1
+INTEREST_RADIUS = 400
+# Coarse quantization, so that the large worlds fit in int16
+POSITION_SCALE = 2
+
+
+def run(world_side):
+    num_asteroids = DENSITY * (world_side // 100) ** 2
+    world, game_object_factory, _ = create_world(num_asteroids, seed=world_side,
+                                                 world_size=(world_side, world_side))
+    rng = random.Random(world_side)
+    interest_manager = InterestManager(world, INTEREST_RADIUS)
+    full_encoder = SnapshotEncoder(world, POSITION_SCALE)
+    interest_encoder = SnapshotEncoder(world, POSITION_SCALE)
+    for client_id in range(CLIENTS):
+        half_side = world_side / 2 - INTEREST_RADIUS
+        starship = game_object_factory.create_starship(rng.uniform(-half_side, half_side),
+                                                       rng.uniform(-half_side, half_side))
+        world.add_object(starship)
+        interest_manager.register_client(client_id, starship)
+        full_encoder.add_client(client_id)
+        interest_encoder.add_client(client_id)
+
+    objects = list(world.get_objects_list().values())
+    full_time = 0
+    interest_time = 0
+    update_time = 0
+    full_bytes = 0
+    interest_bytes = 0
+    for tick in range(TICKS):
+        for obj in objects:
+            obj.process(TICK_SECONDS)
+
+        full_encoder.begin_tick(tick)
+        start = time.perf_counter()
+        for client_id in range(CLIENTS):
+            full_bytes += len(full_encoder.encode_for_client(client_id))
+            full_encoder.acknowledge(client_id, tick)
+        full_time += time.perf_counter() - start
+
+        interest_encoder.begin_tick(tick)
+        start = time.perf_counter()
+        interest_manager.update()
+        update_time += time.perf_counter() - start
+        start = time.perf_counter()
+        for client_id in range(CLIENTS):
+            object_ids = interest_manager.get_interest_set(client_id)
+            interest_bytes += len(interest_encoder.encode_for_client(client_id, object_ids))
+            interest_encoder.acknowledge(client_id, tick)
+        interest_time += time.perf_counter() - start
+
+    per_client = TICKS * CLIENTS
+    return [world_side, len(objects),
+            "%.3f" % (full_time / per_client * 1000),
+            "%.3f" % (interest_time / per_client * 1000),
+            "%.3f" % (update_time / TICKS * 1000),
+            full_bytes // per_client,
+            interest_bytes // per_client]
+
+
+def main():
+    rows = [run(side) for side in (2000, 6000, 10000)]
+    print_table(["world side", "objects", "full ms/client", "interest ms/client",
+                 "grid update ms/tick", "full bytes/client", "interest bytes/client"], rows)
+
+
+if __name__ == "__main__":
+    main()
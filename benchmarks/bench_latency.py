@@ -0,0 +1,120 @@
+"""
+Input-to-photon latency benchmark.
+
+Runs the engine at 30 frames per second on the dummy (offscreen) SDL video
+driver, sequentially and in the pipelined mode, while a thread posts key
+presses on the pygame event queue at random times. The EventInputHandler
+stamps each press when the engine pumps it, and the InputLatencyTracker times
+it up to the display update of the first frame showing its effect. The present
+takes PRESENT_SECONDS without holding the GIL, as a window waiting the vertical
+sync or the compositor does. It reports the input-to-action (the wait for the
+tick) and the input-to-photon percentiles of each mode.
+
+Run from the project root:
+    python benchmarks/bench_latency.py
+"""
+
+import os
+
+# An offscreen window: the measure does not depend on a desktop
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import common
+from common import create_world, print_table
+
+import random
+import threading
+import time
+import unittest.mock
+
+import pygame
+
+from display import Display
+from engines import Engine
+from input_handler import EventInputHandler
+from latency import InputLatencyTracker
+from pipeline import SimulationLoop
+
+FPS = 30
+SECONDS = 6
+ASTEROIDS = 100
+WORLD_SIZE = (800, 600)
+PRESENT_SECONDS = 0.005
+
+
+class PresentingDisplay(Display):
+    """ A Display whose window takes PRESENT_SECONDS to present a frame, without holding the GIL """
+
+    def end_frame(self):
+        pixels = super().end_frame()
+        time.sleep(PRESENT_SECONDS)
+        return pixels
+
+
+def press_keys(stop, seed=0):
+    """ Post presses of the D key at random times until stop is set """
+    rng = random.Random(seed)
+    while not stop.wait(rng.uniform(0.05, 0.15)):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_d))
+        time.sleep(rng.uniform(0.01, 0.05))
+        pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_d))
+
+
+def create_engine(surface):
+    world, _, _ = create_world(ASTEROIDS, seed=ASTEROIDS, world_size=WORLD_SIZE)
+    # Keep the object count stable: no spawn during the measure
+    world.asteroid_generator = unittest.mock.MagicMock()
+    world.asteroid_generator.get_new_asteroid.return_value = None
+    input_handler = EventInputHandler(world)
+    input_latency = InputLatencyTracker()
+    input_handler.get_command_handler().input_latency = input_latency
+    display_obj = PresentingDisplay(WORLD_SIZE[0], WORLD_SIZE[1], surface)
+    return Engine(display_obj, world, input_handler, input_latency=input_latency), input_handler
+
+
+def run_sequential(engine, input_handler, font):
+    fps_clock = pygame.time.Clock()
+    for _ in range(SECONDS * FPS):
+        engine.run_frame(fps_clock, FPS, font)
+
+
+def run_pipelined(engine, input_handler, font):
+    simulation = SimulationLoop(engine.world, input_handler.get_command_handler(), FPS)
+    simulation.start()
+    end = time.perf_counter() + SECONDS
+    while time.perf_counter() < end:
+        engine.run_render_frame(simulation.frames, 1 / FPS, font)
+    simulation.stop()
+
+
+def measure_latency(run, surface, font):
+    engine, input_handler = create_engine(surface)
+    pygame.event.clear()
+    stop = threading.Event()
+    presser = threading.Thread(target=press_keys, args=(stop,))
+    presser.start()
+    try:
+        run(engine, input_handler, font)
+    finally:
+        stop.set()
+        presser.join()
+    return engine.input_latency
+
+
+def main():
+    pygame.display.init()
+    pygame.font.init()
+    surface = pygame.display.set_mode(WORLD_SIZE)
+    font = pygame.font.SysFont("arial", 15)
+    rows = []
+    for mode, run in (("sequential", run_sequential), ("pipelined", run_pipelined)):
+        input_latency = measure_latency(run, surface, font)
+        action, photon = input_latency.get_percentiles()
+        for stage, values in (("input to action", action), ("input to photon", photon)):
+            rows.append([mode, stage, len(input_latency.samples)] + ["%.1f" % (value * 1000) for value in values])
+    pygame.display.quit()
+    print_table(["mode", "stage", "inputs", "p50 ms", "p95 ms", "p99 ms", "max ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
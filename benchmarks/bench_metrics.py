@@ -0,0 +1,52 @@
+"""
+Metrics benchmark.
+
+Runs every shipped stress scenario and reports the hot-path counters per tick
+(the counter deltas divided by the ticks), then the cost of a counter increment
+compared to a Vector2D construction, the most frequent instrumented call.
+
+Run from the project root:
+    python benchmarks/bench_metrics.py
+"""
+
+import common
+from common import create_scenario_world, measure, print_table
+
+from geometrytransformation2d import Vector2D
+from metrics import MetricsRegistry, REGISTRY
+from scenario import list_scenarios
+
+TICKS = 100
+TICK_SECONDS = 1 / 30
+PER_TICK = ('collision_pair_tests_total', 'collision_intersecting_pairs_total', 'vectors_allocated_total',
+            'objects_spawned_total', 'objects_culled_total', 'bullets_fired_total')
+
+
+def run(name):
+    world, driver = create_scenario_world(name)
+    before = REGISTRY.get_values()
+    for _ in range(TICKS):
+        driver.handle_input()
+        world.process(TICK_SECONDS)
+    after = REGISTRY.get_values()
+    return [name] + ["%.1f" % ((after[(metric, ())] - before[(metric, ())]) / TICKS) for metric in PER_TICK]
+
+
+def increment_cost():
+    counter = MetricsRegistry().counter('increments_total', 'Increments')
+
+    def increment():
+        counter.value += 1
+    return measure(increment, 200000), measure(lambda: Vector2D(1, 2), 200000)
+
+
+def main():
+    rows = [run(name) for name in list_scenarios()]
+    print_table(["scenario", "pair tests", "intersecting", "vectors", "spawns", "culled", "fired"], rows)
+    increment, vector = increment_cost()
+    print("counter increment: %.3f us, Vector2D construction (counted): %.3f us"
+          % (increment * 1000000, vector * 1000000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Pipelined engine benchmark.
+
+Runs the same world update and draw sequentially on one thread, then with the
+world updated by a SimulationLoop thread while the main thread renders the
+latest snapshot, on the dummy (offscreen) SDL video driver. The simulation is
+not paced, so the frame time is the cost of a frame. It reports the time per
+rendered frame of each mode, and the ticks computed per rendered frame in the
+pipelined mode (more than 1 when the simulation runs ahead of the rendering).
+
+Both threads share the GIL: only the code releasing it overlaps. The dummy
+driver presents a frame for free, so each measure is repeated with a present
+of PRESENT_SECONDS that releases the GIL, as a window waiting the vertical
+sync or the compositor does.
+
+Run from the project root:
+    python benchmarks/bench_pipeline.py
+"""
+
+import os
+
+# An offscreen window: the measure does not depend on a desktop
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import common
+from common import create_world, print_table
+
+import time
+import unittest.mock
+
+import pygame
+
+from display import Display
+from engines import Engine
+from pipeline import SimulationLoop
+from rendercommands import RenderCommandBuffer
+
+FRAMES = 60
+TICK_SECONDS = 1 / 30
+WORLD_SIZE = (800, 600)
+# Fast enough that the simulation thread never sleeps
+UNPACED_FPS = 1000000
+PRESENT_SECONDS = 0.005
+
+
+class PresentingDisplay(Display):
+    """ A Display whose window takes PRESENT_SECONDS to present a frame, without holding the GIL """
+
+    def end_frame(self):
+        pixels = super().end_frame()
+        time.sleep(PRESENT_SECONDS)
+        return pixels
+
+
+def create_engine(num_asteroids, surface, display_class):
+    world, _, _ = create_world(num_asteroids, seed=num_asteroids, world_size=WORLD_SIZE)
+    # Keep the object count stable: no spawn during the measure
+    world.asteroid_generator = unittest.mock.MagicMock()
+    world.asteroid_generator.get_new_asteroid.return_value = None
+    input_handler = unittest.mock.MagicMock()
+    input_handler.is_exit_requested.return_value = False
+    display_obj = display_class(WORLD_SIZE[0], WORLD_SIZE[1], surface)
+    return Engine(display_obj, world, input_handler), display_obj, input_handler
+
+
+def run_sequential(num_asteroids, surface, font, display_class):
+    engine, display_obj, input_handler = create_engine(num_asteroids, surface, display_class)
+    commands = RenderCommandBuffer()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        pygame.event.get()
+        input_handler.handle_input()
+        engine.world.process(TICK_SECONDS)
+        engine.world.write_render_commands(commands)
+        display_obj.begin_frame()
+        display_obj.draw_commands(commands)
+        engine.show_number_of_objects_in_worlds(font)
+        display_obj.end_frame()
+    return (time.perf_counter() - start) / FRAMES
+
+
+def run_pipelined(num_asteroids, surface, font, display_class):
+    engine, _, input_handler = create_engine(num_asteroids, surface, display_class)
+    simulation = SimulationLoop(engine.world, input_handler, UNPACED_FPS)
+    simulation.start()
+    rendered = 0
+    start = time.perf_counter()
+    while rendered < FRAMES:
+        if engine.run_render_frame(simulation.frames, 1.0, font) is not None:
+            rendered += 1
+    elapsed = time.perf_counter() - start
+    simulation.stop()
+    return elapsed / FRAMES, simulation.ticks / FRAMES
+
+
+def main():
+    pygame.display.init()
+    pygame.font.init()
+    surface = pygame.display.set_mode(WORLD_SIZE)
+    font = pygame.font.SysFont("arial", 15)
+    rows = []
+    for present, display_class in (("free", Display), ("%d ms" % (PRESENT_SECONDS * 1000), PresentingDisplay)):
+        for asteroids in (20, 100, 300):
+            sequential = run_sequential(asteroids, surface, font, display_class)
+            pipelined, ticks_per_frame = run_pipelined(asteroids, surface, font, display_class)
+            rows.append([present, asteroids, "%.2f" % (sequential * 1000), "%.2f" % (pipelined * 1000),
+                         "%.2fx" % (sequential / pipelined), "%.2f" % ticks_per_frame])
+    pygame.display.quit()
+    print_table(["present", "asteroids", "sequential ms/frame", "pipelined ms/frame", "speedup", "ticks/frame"],
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Client prediction benchmark.
+
+Measures the cost of a reconciliation that re-simulates the pending inputs
+(a misprediction) for increasing round trips, and of a reconciliation that
+confirms the prediction.
+
+Run from the project root:
+    python benchmarks/bench_prediction.py
+"""
+
+import common
+from common import create_factories, measure, print_table
+
+from snapshot import EntityState, ENTITY_KINDS
+from prediction import ClientPrediction
+
+TICK_SECONDS = 1 / 30
+REPEAT = 2000
+
+
+def run(pending_ticks):
+    _, game_object_factory, _ = create_factories()
+    starship = game_object_factory.create_starship_at_origin()
+    prediction = ClientPrediction(starship, TICK_SECONDS)
+    kind = ENTITY_KINDS['StarShip']
+    state = {'tick': 0}
+
+    def fill_and_reconcile(server_state):
+        # Keep pending_ticks inputs waiting, then acknowledge the oldest one
+        while prediction.pending_inputs < pending_ticks + 1:
+            state['tick'] += 1
+            prediction.apply_input(state['tick'], 10, state['tick'] % 3 == 0)
+        prediction.reconcile(state['tick'] - pending_ticks, server_state)
+
+    wrong_state = EntityState(1, kind, 1.0, 0.0, 0, 0)
+    mispredicted = measure(lambda: fill_and_reconcile(wrong_state), REPEAT)
+
+    def confirmed():
+        while prediction.pending_inputs < pending_ticks + 1:
+            state['tick'] += 1
+            prediction.apply_input(state['tick'], 10, False)
+        acked = prediction._pending[0]
+        x, y, rotation_angle, head_angle = acked.predicted_state
+        prediction.reconcile(acked.tick, EntityState(1, kind, x, y, rotation_angle, head_angle))
+    confirmed_time = measure(confirmed, REPEAT)
+
+    return [pending_ticks,
+            "%.1f" % (mispredicted * 1e6),
+            "%.1f" % (confirmed_time * 1e6)]
+
+
+def main():
+    rows = [run(ticks) for ticks in (2, 5, 10, 30)]
+    print_table(["pending ticks", "mispredicted us", "confirmed us"], rows)
+
+
+if __name__ == "__main__":
+    main()
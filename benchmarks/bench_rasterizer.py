@@ -0,0 +1,65 @@
+"""
+Observation rasterizer benchmark.
+
+Compares the NumPy rasterizer with drawing each world through Display on a
+pygame surface (dummy video driver) and reading it back as an array.
+
+Run from the project root:
+    python benchmarks/bench_rasterizer.py
+"""
+
+import common
+from common import create_world, print_table
+
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+import pygame.surfarray
+
+import display
+from rasterizer import ObservationRasterizer
+
+FRAMES = 20
+GRID_SIZE = (84, 84)
+
+
+def run(num_worlds, asteroids_per_world):
+    worlds = [create_world(asteroids_per_world, seed=index)[0] for index in range(num_worlds)]
+    world_size = worlds[0].world_size
+
+    rasterizer = ObservationRasterizer(world_size, GRID_SIZE)
+    out = np.zeros((num_worlds, GRID_SIZE[1], GRID_SIZE[0]), dtype=np.uint8)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        rasterizer.render(worlds, out)
+    numpy_time = (time.perf_counter() - start) / FRAMES
+
+    surface = pygame.Surface(world_size)
+    small_surface = pygame.Surface(GRID_SIZE)
+    display_obj = display.Display(world_size[0], world_size[1], surface)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for index, world in enumerate(worlds):
+            surface.fill((0, 0, 0))
+            for world_object in world.get_world_objects_list():
+                display_obj.draw_world_vertexes(world_object.vertexes, world_object.color)
+            pygame.transform.scale(surface, GRID_SIZE, small_surface)
+            out[index] = pygame.surfarray.pixels_red(small_surface).T
+    pygame_time = (time.perf_counter() - start) / FRAMES
+
+    return [num_worlds, asteroids_per_world,
+            "%.2f" % (pygame_time * 1000), "%.2f" % (numpy_time * 1000)]
+
+
+def main():
+    pygame.init()
+    rows = [run(worlds, asteroids) for (worlds, asteroids) in ((1, 20), (64, 20), (256, 50))]
+    print_table(["worlds", "asteroids/world", "pygame ms/batch", "numpy ms/batch"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Render command buffer benchmark.
+
+Draws worlds of 100, 1k and 10k asteroids on the dummy (offscreen) SDL video
+driver, building a WorldObject wrapper and Vector2D list per object versus
+writing the reusable render command buffer, and reports the time per frame,
+the Vector2D allocated per frame, and the cost of writing the buffer alone
+(what a headless run pays).
+
+Run from the project root:
+    python benchmarks/bench_rendercommands.py
+"""
+
+import os
+
+# An offscreen window: the measure does not depend on a desktop
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import common
+from common import create_world, measure, print_table
+
+import random
+
+import pygame
+
+from display import Display
+from metrics import REGISTRY
+from rendercommands import RenderCommandBuffer
+
+FRAMES = 10
+WORLD_SIZE = (800, 600)
+
+
+def draw_world_objects(world, display_obj):
+    display_obj.begin_frame()
+    for world_object in world.get_world_objects_list():
+        display_obj.draw_world_vertexes(world_object.vertexes, world_object.color)
+
+
+def draw_commands(world, display_obj, commands):
+    display_obj.begin_frame()
+    world.write_render_commands(commands)
+    display_obj.draw_commands(commands)
+
+
+def vectors_per_frame(function):
+    before = REGISTRY.get_values()[('vectors_allocated_total', ())]
+    function()
+    return REGISTRY.get_values()[('vectors_allocated_total', ())] - before
+
+
+def run(num_asteroids, surface):
+    world, _, _ = create_world(num_asteroids, seed=num_asteroids, world_size=WORLD_SIZE)
+    rng = random.Random(num_asteroids)
+    for game_object in world.get_objects_list().values():
+        game_object.rotation_angle = rng.randrange(360)
+    display_obj = Display(WORLD_SIZE[0], WORLD_SIZE[1], surface)
+    commands = RenderCommandBuffer()
+
+    old = lambda: draw_world_objects(world, display_obj)
+    new = lambda: draw_commands(world, display_obj, commands)
+    write = lambda: world.write_render_commands(commands)
+    new()
+    return (measure(old, FRAMES), measure(new, FRAMES), measure(write, FRAMES),
+            vectors_per_frame(old), vectors_per_frame(new))
+
+
+def main():
+    pygame.display.init()
+    surface = pygame.display.set_mode(WORLD_SIZE)
+    rows = []
+    for asteroids in (100, 1000, 10000):
+        old, new, write, old_vectors, new_vectors = run(asteroids, surface)
+        rows.append([asteroids, "%.2f" % (old * 1000), "%.2f" % (new * 1000), "%.1fx" % (old / new),
+                     "%.2f" % (write * 1000), old_vectors, new_vectors])
+    pygame.display.quit()
+    print_table(["objects", "wrappers ms/frame", "commands ms/frame", "speedup",
+                 "write only ms", "vectors/frame (wrappers)", "vectors/frame (commands)"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Scenario benchmark.
+
+Runs every shipped stress scenario for a fixed number of ticks and reports the
+tick time percentiles and the final number of objects. The scenarios are seeded,
+so two runs on the same code do the same work.
+
+Run from the project root:
+    python benchmarks/bench_scenarios.py
+"""
+
+import common
+from common import create_scenario_world, print_table
+
+import time
+
+from scenario import list_scenarios
+from soak import percentile
+
+TICKS = 150
+TICK_SECONDS = 1 / 30
+
+
+def run(name):
+    world, driver = create_scenario_world(name)
+    tick_times = []
+    for _ in range(TICKS):
+        driver.handle_input()
+        start = time.perf_counter()
+        world.process(TICK_SECONDS)
+        tick_times.append(time.perf_counter() - start)
+    tick_times.sort()
+    return [name, len(world.get_objects_list()),
+            "%.2f" % (percentile(tick_times, 0.5) * 1000),
+            "%.2f" % (percentile(tick_times, 0.99) * 1000)]
+
+
+def main():
+    rows = [run(name) for name in list_scenarios()]
+    print_table(["scenario", "objects", "p50 ms/tick", "p99 ms/tick"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Multi-match server benchmark.
+
+Reports the memory taken by the process before any match (what every match
+would pay if it had its own process) and the memory and tick time of each
+additional match hosted in the same process.
+
+Run from the project root:
+    python benchmarks/bench_server.py
+"""
+
+import common
+from common import print_table
+
+import resource
+import time
+import tracemalloc
+
+from server import SharedResources, MatchServer
+
+ROUNDS = 30
+TICK_SECONDS = 1 / 30
+
+
+def run(num_matches):
+    server = MatchServer(SharedResources())
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for _ in range(num_matches):
+        server.create_match()
+    # Let the asteroid generators spawn their asteroids
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        server.scheduler.run_round(TICK_SECONDS)
+    round_seconds = (time.perf_counter() - start) / ROUNDS
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    overruns = sum(match.overruns for match in server.scheduler.matches)
+    return [num_matches,
+            "%.1f" % ((after - before) / num_matches / 1024),
+            "%.3f" % (round_seconds / num_matches * 1000),
+            "%.2f" % (round_seconds * 1000),
+            overruns]
+
+
+def main():
+    # ru_maxrss is in KB on Linux
+    process_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print("Process RSS after imports: %d KB" % process_kb)
+    rows = [run(n) for n in (10, 100, 500)]
+    print_table(["matches", "KB/match", "ms/match tick", "ms/round", "overruns"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Snapshot encoder/decoder benchmark.
+
+Reports encode and decode throughput and the bytes sent per tick for a full
+snapshot and for the delta snapshots, with half of the asteroids moving.
+
+Run from the project root:
+    python benchmarks/bench_snapshot.py
+"""
+
+import common
+from common import create_world, print_table
+
+import time
+
+from snapshot import SnapshotEncoder, SnapshotDecoder
+
+TICKS = 100
+TICK_SECONDS = 1 / 30
+
+
+def run(num_asteroids):
+    world, _, _ = create_world(num_asteroids, seed=num_asteroids)
+    # Half of the asteroids stand still, so that the delta has something to skip
+    moving = [obj for (index, obj) in enumerate(world.get_objects_list().values()) if index % 2 == 0]
+    for obj in world.get_objects_list().values():
+        if obj not in moving:
+            obj.speed = 0
+
+    encoder = SnapshotEncoder(world)
+    encoder.add_client(1)
+    decoder = SnapshotDecoder()
+
+    # Full snapshot
+    encoder.begin_tick(0)
+    start = time.perf_counter()
+    full_payload = bytes(encoder.encode_for_client(1))
+    full_encode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    decoder.decode(full_payload)
+    full_decode_time = time.perf_counter() - start
+    encoder.acknowledge(1, 0)
+
+    # Delta snapshots
+    encode_time = 0
+    decode_time = 0
+    total_bytes = 0
+    for tick in range(1, TICKS + 1):
+        for obj in moving:
+            obj.process(TICK_SECONDS)
+        encoder.begin_tick(tick)
+        start = time.perf_counter()
+        payload = encoder.encode_for_client(1)
+        encode_time += time.perf_counter() - start
+        total_bytes += len(payload)
+        start = time.perf_counter()
+        decoder.decode(payload)
+        decode_time += time.perf_counter() - start
+        encoder.acknowledge(1, tick)
+
+    return [num_asteroids + 1,
+            len(full_payload),
+            "%.0f" % (total_bytes / TICKS),
+            "%.2f" % (full_encode_time * 1000),
+            "%.2f" % (encode_time / TICKS * 1000),
+            "%.1f" % (total_bytes / encode_time / 1e6),
+            "%.2f" % (full_decode_time * 1000),
+            "%.2f" % (decode_time / TICKS * 1000),
+            "%.1f" % (total_bytes / decode_time / 1e6)]
+
+
+def main():
+    rows = [run(n) for n in (100, 1000, 5000)]
+    print_table(["objects", "full bytes", "delta bytes/tick",
+                 "full enc ms", "delta enc ms", "enc MB/s",
+                 "full dec ms", "delta dec ms", "dec MB/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
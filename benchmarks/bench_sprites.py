@@ -0,0 +1,77 @@
+"""
+Sprite atlas benchmark.
+
+Draws 1k and 10k asteroids at random rotation angles on the dummy (offscreen)
+SDL video driver, transforming the vertexes and drawing the lines of every
+object versus blitting the sprites of the atlas, and reports the time per frame.
+The first sprite frame, which rasterizes the sprites, is reported apart.
+
+Run from the project root:
+    python benchmarks/bench_sprites.py
+"""
+
+import os
+
+# An offscreen window: the measure does not depend on a desktop
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import common
+from common import create_world, measure, print_table
+
+import random
+import time
+
+import pygame
+
+from display import Display
+from spriteatlas import SpriteAtlas
+
+FRAMES = 10
+WORLD_SIZE = (800, 600)
+
+
+def draw_lines(world, display_obj):
+    display_obj.begin_frame()
+    for world_object in world.get_world_objects_list():
+        display_obj.draw_world_vertexes(world_object.vertexes, world_object.color)
+
+
+def draw_sprites(world, display_obj):
+    display_obj.begin_frame()
+    display_obj.draw_objects(world.get_objects_list().values())
+
+
+def run(num_asteroids, surface):
+    world, _, _ = create_world(num_asteroids, seed=num_asteroids, world_size=WORLD_SIZE)
+    rng = random.Random(num_asteroids)
+    for game_object in world.get_objects_list().values():
+        game_object.rotation_angle = rng.randrange(360)
+
+    lines_display = Display(WORLD_SIZE[0], WORLD_SIZE[1], surface)
+    atlas = SpriteAtlas()
+    sprites_display = Display(WORLD_SIZE[0], WORLD_SIZE[1], surface, sprite_atlas=atlas)
+
+    start = time.perf_counter()
+    draw_sprites(world, sprites_display)
+    cold = time.perf_counter() - start
+    lines = measure(lambda: draw_lines(world, lines_display), FRAMES)
+    sprites = measure(lambda: draw_sprites(world, sprites_display), FRAMES)
+    return lines, sprites, cold, len(atlas), atlas.bytes_used
+
+
+def main():
+    pygame.display.init()
+    surface = pygame.display.set_mode(WORLD_SIZE)
+    rows = []
+    for asteroids in (1000, 10000):
+        lines, sprites, cold, sprite_count, atlas_bytes = run(asteroids, surface)
+        rows.append([asteroids, "%.2f" % (lines * 1000), "%.2f" % (sprites * 1000),
+                     "%.1fx" % (lines / sprites), "%.2f" % (cold * 1000),
+                     sprite_count, "%d KiB" % (atlas_bytes // 1024)])
+    pygame.display.quit()
+    print_table(["objects", "lines ms/frame", "sprites ms/frame", "speedup",
+                 "first sprite frame ms", "sprites", "atlas"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Frame tracing benchmark.
+
+Cost of World.process with tracing disabled and with the Chrome trace writer
+enabled, and the cost of a single span.
+
+Run from the project root:
+    python benchmarks/bench_tracing.py
+"""
+
+import common
+from common import create_world, measure, print_table
+
+import os
+import tempfile
+
+from tracing import FrameTracer, TraceWriter, NULL_TRACER
+
+REPEAT = 200
+TICK_SECONDS = 1 / 30
+
+
+def run(num_asteroids):
+    world, _, _ = create_world(num_asteroids, seed=num_asteroids)
+    world.tracer = NULL_TRACER
+    disabled_time = measure(lambda: world.process(TICK_SECONDS), REPEAT)
+
+    path = os.path.join(tempfile.mkdtemp(), 'trace.json')
+    tracer = FrameTracer(TraceWriter(path))
+    world.tracer = tracer
+    enabled_time = measure(lambda: world.process(TICK_SECONDS), REPEAT)
+    tracer.close()
+
+    return [num_asteroids, "%.3f" % (disabled_time * 1000), "%.3f" % (enabled_time * 1000)]
+
+
+def span_cost():
+    path = os.path.join(tempfile.mkdtemp(), 'trace.json')
+    tracer = FrameTracer(TraceWriter(path))
+
+    def one_span():
+        with tracer.span('phase'):
+            pass
+    cost = measure(one_span, 100000)
+    tracer.close()
+    return cost
+
+
+def main():
+    rows = [run(asteroids) for asteroids in (10, 50, 100)]
+    print_table(["asteroids", "untraced ms/tick", "traced ms/tick"], rows)
+    print("cost of a span: %.2f us" % (span_cost() * 1000000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Vectorized environment benchmark.
+
+Compares the world-steps per second of a loop of World.process over N worlds
+with VectorWorldEnv, in a single process and sharded across processes.
+
+Run from the project root:
+    python benchmarks/bench_vecenv.py
+"""
+
+import common
+from common import create_factories, print_table
+
+import os
+import time
+
+import numpy as np
+
+from engines import World
+from vecenv import VectorWorldEnv, ShardedVectorWorldEnv
+
+STEPS = 200
+TICK_SECONDS = 1 / 30
+
+
+def world_loop(num_worlds):
+    config, game_object_factory, system_factory = create_factories()
+    worlds = [World(system_factory.get_world_bounds(), game_object_factory, system_factory)
+              for _ in range(num_worlds)]
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        for world in worlds:
+            world.process(TICK_SECONDS)
+    return num_worlds * STEPS / (time.perf_counter() - start)
+
+
+def vector_env(env, num_worlds):
+    rng = np.random.default_rng(0)
+    actions = rng.integers(0, 2, (STEPS, num_worlds, 3))
+    env.reset()
+    start = time.perf_counter()
+    for step in range(STEPS):
+        env.step(actions[step])
+    return num_worlds * STEPS / (time.perf_counter() - start)
+
+
+def main():
+    config, _, _ = create_factories()
+    workers = max(2, os.cpu_count() or 1)
+    rows = []
+    for num_worlds in (16, 256, 2048):
+        looped = world_loop(num_worlds) if num_worlds <= 256 else None
+        vectorized = vector_env(VectorWorldEnv(num_worlds, config), num_worlds)
+        sharded_env = ShardedVectorWorldEnv(num_worlds, workers, config)
+        sharded = vector_env(sharded_env, num_worlds)
+        sharded_env.close()
+        rows.append([num_worlds,
+                     "%.0f" % looped if looped else "-",
+                     "%.0f" % vectorized,
+                     "%.0f" % sharded])
+    print_table(["worlds", "World.process steps/s", "vectorized steps/s",
+                 "sharded (%d) steps/s" % workers], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Shared helpers for the pyAsteroid benchmarks.
+
+Every benchmark is a standalone script to run from the project root, e.g.:
+    python benchmarks/bench_snapshot.py
+"""
+
+import os
+import random
+import sys
+import time
+
+
+def setup_python_path():
+    """Add the src directories to the Python path, as main.py does"""
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for path in [os.path.join(project_root, 'src'), os.path.join(project_root, 'src', 'Main')]:
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+setup_python_path()
+
+
+def create_factories():
+    """Create configuration and factories the same way main.py does"""
+    from Infrastructure.config.config_manager import ConfigurationManager
+    from Infrastructure.factories.system_factory import SystemFactory
+    from Infrastructure.factories.game_object_factory import GameObjectFactory
+    from Infrastructure.factories.physics_factory import PhysicsFactory
+
+    config = ConfigurationManager()
+    physics_factory = PhysicsFactory(config)
+    system_factory = SystemFactory(config)
+    game_object_factory = GameObjectFactory(config, physics_factory)
+    return config, game_object_factory, system_factory
+
+
+def create_world(num_asteroids, seed=0, world_size=None):
+    """
+    Create a World filled with asteroids at random positions and headings.
+
+    Args:
+        num_asteroids: Number of asteroids to add
+        seed: Seed of the random generator, for reproducible runs
+        world_size: (width, height) of the world. Default from configuration
+
+    Returns:
+        Tuple of (world, game_object_factory, system_factory)
+    """
+    from engines import World
+
+    config, game_object_factory, system_factory = create_factories()
+    if world_size is None:
+        world_size = system_factory.get_world_bounds()
+    world = World(world_size, game_object_factory, system_factory)
+
+    rng = random.Random(seed)
+    half_width = world_size[0] / 2 - 20
+    half_height = world_size[1] / 2 - 20
+    for _ in range(num_asteroids):
+        asteroid = game_object_factory.create_asteroid(rng.uniform(-half_width, half_width),
+                                                       rng.uniform(-half_height, half_height),
+                                                       rng.randrange(360),
+                                                       rng.uniform(5, 20))
+        world.add_object(asteroid)
+    return world, game_object_factory, system_factory
+
+
+def create_scenario_world(name, seed=None):
+    """
+    Create the World of a scenario, populated through the GameObjectFactory.
+
+    Args:
+        name: Name of a shipped scenario or path of a scenario YAML file
+        seed: Seed of the random spawns. Default the scenario seed
+
+    Returns:
+        Tuple of (world, driver). Call driver.handle_input() before each world.process()
+    """
+    from server import SharedResources
+    from scenario import build_scenario
+
+    return build_scenario(name, SharedResources(), seed)
+
+
+def measure(function, repeat):
+    """
+    Call a function repeatedly and return the seconds per call.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def print_table(headers, rows):
+    """Print a simple aligned table"""
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for (i, h) in enumerate(headers)]
+    print("  ".join(str(h).rjust(w) for (h, w) in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(c).rjust(w) for (c, w) in zip(row, widths)))
@@ -6,6 +6,9 @@ This is the main entry point for the pyAsteroid game.
 Run this file from the project root directory with: python main.py
 """
 
+import argparse
+import random
+import signal
 import sys
 import os
 
@@ -22,20 +25,180 @@ def setup_python_path():
     if src_main_dir not in sys.path:
         sys.path.insert(0, src_main_dir)
 
+def parse_arguments(argv=None):
+    """Parse the command line"""
+    parser = argparse.ArgumentParser(description="pyAsteroid")
+    parser.add_argument('--trace', metavar='FILE', default=None,
+                        help="write the frame phases to FILE in Chrome trace JSON format "
+                             "(open it in chrome://tracing or ui.perfetto.dev)")
+    parser.add_argument('--profile-frames', type=int, metavar='N', default=None,
+                        help="profile the first N frames with cProfile. Press P (or send SIGUSR1) "
+                             "during the game to profile the next frames")
+    parser.add_argument('--profile-dir', default=None,
+                        help="directory of the .prof and summary files (default from configuration)")
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help="erase and push to the window only the rectangles that changed")
+    parser.add_argument('--pipelined', action='store_true',
+                        help="update the world on a simulation thread and render the latest "
+                             "tick on the main thread, overlapping the two")
+    parser.add_argument('--sprite-atlas', action='store_true',
+                        help="blit pre-rasterized sprites of the shapes instead of drawing their lines")
+    parser.add_argument('--event-input', action='store_true', default=None,
+                        help="read the keyboard from the KEYDOWN/KEYUP events instead of polling it")
+    parser.add_argument('--gc-control', action='store_true', default=None,
+                        help="freeze the startup objects, raise the collector thresholds and run "
+                             "the full collections in the idle time of the frames")
+    parser.add_argument('--attribute-costs', action='store_true',
+                        help="time the update and the collisions per object type; the report is "
+                             "printed at exit and added to the profile captures")
+    parser.add_argument('--input-latency', action='store_true',
+                        help="measure the latency from each input to the presentation of its effect; "
+                             "the distribution is printed at exit")
+    parser.add_argument('--metrics-port', type=int, metavar='PORT', default=None,
+                        help="serve the hot-path counters in Prometheus format on "
+                             "http://127.0.0.1:PORT/metrics")
+    parser.add_argument('--soak', action='store_true',
+                        help="run headless with bot pilots and report drift and leaks")
+    parser.add_argument('--ticks', type=int, default=None,
+                        help="soak run length in ticks")
+    parser.add_argument('--hours', type=float, default=None,
+                        help="soak run length in hours of wall time")
+    parser.add_argument('--bots', type=int, default=None,
+                        help="number of bot starships in the soak run (default from configuration)")
+    parser.add_argument('--scenario', default=None,
+                        help="name or YAML path of the soak scenario (default: bots only)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="seed of the random spawns (default from the scenario, or 0)")
+    return parser.parse_args(argv)
+
+
+def create_tracer(args):
+    """Create the frame tracer requested on the command line, or None"""
+    if args.trace is None:
+        return None
+    from tracing import TraceWriter, FrameTracer
+    
+    return FrameTracer(TraceWriter(args.trace))
+
+
+def create_profile_capture(args, system_factory):
+    """Create the cProfile capture, armed if requested on the command line"""
+    profile_capture = system_factory.create_profile_capture(args.profile_dir)
+    if args.profile_frames is not None:
+        profile_capture.request(args.profile_frames)
+    # Capture on demand from outside, e.g. kill -USR1 <pid> on a headless run
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, lambda signum, frame: profile_capture.request())
+    return profile_capture
+
+
+def enable_cost_attribution(args, world, profile_capture):
+    """Time the world update per object type if requested on the command line, or return None"""
+    if not args.attribute_costs:
+        return None
+    from attribution import CostAttribution
+    
+    cost_attribution = CostAttribution()
+    world.set_cost_attribution(cost_attribution)
+    profile_capture.cost_attribution = cost_attribution
+    return cost_attribution
+
+
+def enable_input_latency(args, input_handler):
+    """Follow the inputs up to the screen if requested on the command line, or return None"""
+    if not args.input_latency:
+        return None
+    from latency import InputLatencyTracker
+    
+    input_latency = InputLatencyTracker()
+    input_handler.get_command_handler().input_latency = input_latency
+    return input_latency
+
+
+def start_metrics_server(args, system_factory):
+    """Start the metrics exporter if requested on the command line, or return None"""
+    if args.metrics_port is None:
+        return None
+    metrics_server = system_factory.create_metrics_server(args.metrics_port)
+    metrics_server.start()
+    print("Metrics served on http://%s:%d/metrics" % metrics_server.address[:2])
+    return metrics_server
+
+
+def run_soak(args):
+    """Run the game headless with bot pilots and print the soak report"""
+    from server import SharedResources
+    
+    resources = SharedResources()
+    config = resources.config
+    system_factory = resources.system_factory
+    ticks = args.ticks
+    
+    if args.scenario is not None:
+        from scenario import load_scenario, build_scenario
+        
+        scenario = load_scenario(args.scenario)
+        world, input_handler = build_scenario(scenario, resources, args.seed)
+        if ticks is None and args.hours is None:
+            ticks = scenario.duration_ticks
+    else:
+        world = resources.create_world()
+        
+        # Bot starships at random positions, sharing a single asteroid index
+        input_handler = system_factory.create_bot_swarm(world)
+        bots = args.bots if args.bots is not None else config.get_int('soak.bots', 50)
+        rng = random.Random(args.seed if args.seed is not None else 0)
+        half_width = resources.world_size[0] / 2
+        half_height = resources.world_size[1] / 2
+        for _ in range(bots):
+            starship = resources.game_object_factory.create_starship(rng.uniform(-half_width, half_width),
+                                                                     rng.uniform(-half_height, half_height))
+            input_handler.add_bot(starship, system_factory.create_bot_strategy())
+    
+    runner = system_factory.create_soak_runner(world, input_handler)
+    runner.profile_capture = create_profile_capture(args, system_factory)
+    cost_attribution = enable_cost_attribution(args, world, runner.profile_capture)
+    start_metrics_server(args, system_factory)
+    duration_seconds = args.hours * 3600 if args.hours is not None else None
+    if ticks is None and duration_seconds is None:
+        ticks = 10 * config.get_int('soak.sample_every', 300)
+    
+    def print_progress(sample):
+        print("tick %d: %d objects, p99 %.3f ms, rss %d KiB" % (
+            sample.tick, sample.object_count, sample.tick_p99_ms, sample.rss_bytes // 1024))
+    
+    tracer = create_tracer(args)
+    if tracer is not None:
+        world.tracer = tracer
+    try:
+        report = runner.run(ticks, duration_seconds, on_sample=print_progress)
+    finally:
+        if tracer is not None:
+            tracer.close()
+    print(report.format())
+    if cost_attribution is not None:
+        print("Cost per object type:")
+        print(cost_attribution.format())
+    return 1 if report.has_problems else 0
+
+
 def main():
     """Main entry point for the game using dependency injection"""
+    args = parse_arguments()
     try:
         # Setup Python path for imports
         setup_python_path()
         
+        if args.soak:
+            sys.exit(run_soak(args))
+        
         # Import and run the game with DI
         from engines import Engine, World
         from Infrastructure.config.config_manager import ConfigurationManager
         from Infrastructure.factories.system_factory import SystemFactory
         from Infrastructure.factories.game_object_factory import GameObjectFactory
         from Infrastructure.factories.physics_factory import PhysicsFactory
-        from Main.input_handler import KeyboardInputHandler
-        import display
+        from Main.input_handler import EventInputHandler
         import pygame
         import constants
         
@@ -49,48 +212,44 @@ def main():
         width = config.get_int('display.width', constants.DISPLAY_SURFACE_WIDTH)
         height = config.get_int('display.height', constants.DISPLAY_SURFACE_HEIGHT)
         draw_surface = pygame.display.set_mode((width, height))
-        display_obj = display.Display(width, height, draw_surface)
+        display_obj = system_factory.create_display(width, height, draw_surface)
+        if args.dirty_rects:
+            display_obj.dirty_rects = True
+        if args.sprite_atlas and display_obj.sprite_atlas is None:
+            display_obj.sprite_atlas = system_factory.create_sprite_atlas()
         
         # Create world with factory dependencies
         world_size = (width, height)
         world = World(world_size, game_object_factory, system_factory)
         
         # Create input handler
-        input_handler = KeyboardInputHandler(world)
+        input_handler = system_factory.create_input_handler(world, args.event_input)
         
         # Create engine with all dependencies
-        engine = Engine(display_obj, world, input_handler)
+        profile_capture = create_profile_capture(args, system_factory)
+        enable_cost_attribution(args, world, profile_capture)
+        engine = Engine(display_obj, world, input_handler, create_tracer(args), profile_capture,
+                        system_factory.create_gc_control(args.gc_control),
+                        enable_input_latency(args, input_handler))
+        start_metrics_server(args, system_factory)
         
         # Start the game using original main function structure
         pygame.init()
         DEFAULT_FONT = pygame.font.SysFont("arial", 15)
         
-        # Keyboard repeating time
-        key_delay, key_interval = system_factory.get_key_repeat_settings()
-        pygame.key.set_repeat(key_delay, key_interval)
+        # Keyboard repeating time. The event-driven handler ignores the repeated keys
+        if not isinstance(input_handler, EventInputHandler):
+            key_delay, key_interval = system_factory.get_key_repeat_settings()
+            pygame.key.set_repeat(key_delay, key_interval)
         
         # Update speed
         fps = system_factory.get_fps()
-        FPS_CLOCK = pygame.time.Clock()
         
         # Engine loop
-        while True:
-            # handle events
-            pygame.event.get()
-
-            # Handle keyboard
-            engine.handle_keyboard()
-
-            delta_time = FPS_CLOCK.tick(fps)
-
-            engine.update_world(delta_time / 1000)
-
-            # Draw the scene
-            engine.clean()
-            engine.draw()
-            engine.show_number_of_objects_in_worlds(DEFAULT_FONT)
-
-            pygame.display.update()
+        if args.pipelined:
+            engine.run_pipelined(fps, DEFAULT_FONT)
+        else:
+            engine.run(fps, DEFAULT_FONT)
         
     except ImportError as e:
         print(f"Error importing game modules: {e}")
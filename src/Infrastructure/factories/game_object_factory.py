@@ -12,6 +12,12 @@ from Infrastructure.interfaces.interfaces import (
 )
 from Main.graphicobjects import StarShip, Bullet, Asteroid
 from Main.geometrytransformation2d import Vector2D
+from Main.metrics import REGISTRY
+
+_CREATED_DESCRIPTION = 'Game objects created by the GameObjectFactory'
+_STARSHIPS_CREATED = REGISTRY.counter('game_objects_created_total', _CREATED_DESCRIPTION, {'kind': 'starship'})
+_BULLETS_CREATED = REGISTRY.counter('game_objects_created_total', _CREATED_DESCRIPTION, {'kind': 'bullet'})
+_ASTEROIDS_CREATED = REGISTRY.counter('game_objects_created_total', _CREATED_DESCRIPTION, {'kind': 'asteroid'})
 
 
 class GameObjectFactory(IGameObjectFactory):
@@ -33,6 +39,29 @@ class GameObjectFactory(IGameObjectFactory):
         """
         self._config = config
         self._physics_factory = physics_factory
+        # Configuration key -> tuple of Vector2D, shared by all the objects of that type
+        self._shapes = {}
+    
+    def _get_shape(self, config_key: str):
+        """
+        Get the vertexes of a shape from configuration, converting them once.
+        
+        The returned tuple is shared by every object created with that shape
+        (and by every World using this factory), so it must not be modified.
+        
+        Args:
+            config_key: Configuration key of the vertexes
+            
+        Returns:
+            Tuple of Vector2D, or None if the shape is not configured
+        """
+        if config_key not in self._shapes:
+            vertexes_config = self._config.get_vertexes(config_key)
+            self._shapes[config_key] = tuple(
+                self._physics_factory.create_vector(v[0], v[1])
+                for v in vertexes_config
+            ) if vertexes_config else None
+        return self._shapes[config_key]
     
     def create_starship(self, x: float, y: float) -> IStarShip:
         """
@@ -47,13 +76,7 @@ class GameObjectFactory(IGameObjectFactory):
         """
         # Get configuration for starship
         color = self._config.get_color('game.starship.color', (255, 255, 255))
-        vertexes_config = self._config.get_vertexes('game.starship.vertexes')
-        
-        # Convert vertexes to Vector2D objects
-        vertexes = [
-            self._physics_factory.create_vector(v[0], v[1]) 
-            for v in vertexes_config
-        ] if vertexes_config else None
+        vertexes = self._get_shape('game.starship.vertexes')
         
         # Create starship with configured properties
         starship = StarShip(x, y, color, vertexes if vertexes else None)
@@ -61,6 +84,7 @@ class GameObjectFactory(IGameObjectFactory):
         # Apply additional configuration if needed
         reload_counter = self._config.get_int('game.starship.reload_counter', 10)
         starship.reload_counter = reload_counter
+        _STARSHIPS_CREATED.value += 1
         
         return starship
     
@@ -78,15 +102,10 @@ class GameObjectFactory(IGameObjectFactory):
         """
         # Get configuration for bullet
         speed = self._config.get_int('game.bullet.speed', 150)
-        vertexes_config = self._config.get_vertexes('game.bullet.vertexes')
-        
-        # Convert vertexes to Vector2D objects
-        vertexes = [
-            self._physics_factory.create_vector(v[0], v[1]) 
-            for v in vertexes_config
-        ] if vertexes_config else None
+        vertexes = self._get_shape('game.bullet.vertexes')
         
         # Create bullet with configured properties
+        _BULLETS_CREATED.value += 1
         return Bullet(x, y, angle, speed, vertexes)
     
     def create_asteroid(self, x: float, y: float, angle: float, speed: float) -> IAsteroid:
@@ -103,15 +122,10 @@ class GameObjectFactory(IGameObjectFactory):
             Configured Asteroid instance
         """
         # Get configuration for asteroid
-        vertexes_config = self._config.get_vertexes('game.asteroid.vertexes')
-        
-        # Convert vertexes to Vector2D objects
-        vertexes = [
-            self._physics_factory.create_vector(v[0], v[1]) 
-            for v in vertexes_config
-        ] if vertexes_config else None
+        vertexes = self._get_shape('game.asteroid.vertexes')
         
         # Create asteroid with configured properties
+        _ASTEROIDS_CREATED.value += 1
         return Asteroid(x, y, angle, speed, vertexes)
     
     def create_starship_at_origin(self) -> IStarShip:
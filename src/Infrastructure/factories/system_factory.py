@@ -8,10 +8,17 @@ with configuration-driven properties and proper dependency injection.
 from typing import Optional
 from Infrastructure.interfaces.interfaces import (
     ISystemFactory, IConfiguration, IWorld, ICollisionHandler, 
-    IAsteroidGenerator, IDisplay
+    IAsteroidGenerator, IDisplay, IInputHandler
 )
 from Main.collisions import CollisionHandler
 from Main.logic import AsteroidGenerator
+from Main.snapshot import SnapshotEncoder
+from Main.interest import InterestManager
+from Main.bots import BotSwarm, SpinAndFireStrategy, AimAtNearestAsteroidStrategy
+from Main.soak import SoakRunner
+from Main.profiling import ProfileCapture
+from Main.metrics import MetricsServer
+from Main.gccontrol import GarbageCollectorControl
 
 
 class SystemFactory(ISystemFactory):
@@ -59,6 +66,145 @@ class SystemFactory(ISystemFactory):
         
         return AsteroidGenerator(world, initial_countdown, max_asteroids)
     
+    def create_snapshot_encoder(self, world: IWorld) -> SnapshotEncoder:
+        """
+        Create a snapshot encoder to broadcast the world state to network clients.
+        
+        Args:
+            world: The world instance to encode
+            
+        Returns:
+            Configured SnapshotEncoder instance
+        """
+        position_scale = self._config.get_int('network.position_scale', 8)
+        history_size = self._config.get_int('network.snapshot_history', 64)
+        
+        return SnapshotEncoder(world, position_scale, history_size)
+    
+    def create_interest_manager(self, world: IWorld) -> InterestManager:
+        """
+        Create an interest manager selecting the objects sent to each network client.
+        
+        Args:
+            world: The world instance containing the objects
+            
+        Returns:
+            Configured InterestManager instance
+        """
+        radius = self._config.get_float('network.interest_radius', 400.0)
+        cell_size = self._config.get_int('network.interest_cell_size', 64)
+        
+        return InterestManager(world, radius, cell_size)
+    
+    def create_bot_swarm(self, world: IWorld) -> BotSwarm:
+        """
+        Create a swarm of scripted pilots sharing a single asteroid index.
+        
+        Args:
+            world: The world instance containing the bot starships
+            
+        Returns:
+            Configured BotSwarm instance, without bots
+        """
+        cell_size = self._config.get_int('bots.cell_size', 64)
+        
+        return BotSwarm(world, cell_size)
+    
+    def create_bot_strategy(self, name: Optional[str] = None):
+        """
+        Create the strategy of a scripted pilot.
+        
+        Args:
+            name: 'spin_and_fire' or 'aim_nearest'. Default from configuration
+            
+        Returns:
+            Configured strategy instance
+            
+        Raises:
+            ValueError: If the strategy name is unknown
+        """
+        if name is None:
+            name = self._config.get('bots.strategy', 'aim_nearest')
+        turn_angle = self._config.get_int('bots.turn_angle', 10)
+        
+        if name == 'spin_and_fire':
+            return SpinAndFireStrategy(turn_angle)
+        if name == 'aim_nearest':
+            aim_tolerance = self._config.get_float('bots.aim_tolerance', 10.0)
+            max_distance = self._config.get_float('bots.target_range', 400.0)
+            return AimAtNearestAsteroidStrategy(turn_angle, aim_tolerance, max_distance)
+        raise ValueError(f"Unknown bot strategy '{name}'")
+    
+    def create_soak_runner(self, world: IWorld, input_handler=None) -> SoakRunner:
+        """
+        Create a headless long-run harness for the world.
+        
+        Args:
+            world: The world instance to run
+            input_handler: The input handler called before each tick, e.g. a bot swarm
+            
+        Returns:
+            Configured SoakRunner instance, ticking at the configured FPS
+        """
+        sample_every = self._config.get_int('soak.sample_every', 300)
+        top_allocators = self._config.get_int('soak.top_allocators', 10)
+        growth_tolerance = self._config.get_float('soak.growth_tolerance', 0.05)
+        
+        return SoakRunner(world, input_handler, 1.0 / self.get_fps(), sample_every,
+                          top_allocators, growth_tolerance)
+    
+    def create_profile_capture(self, output_dir: Optional[str] = None) -> ProfileCapture:
+        """
+        Create the on-demand cProfile capture of a window of frames.
+        
+        Args:
+            output_dir: Directory of the dumped files. Default from configuration
+            
+        Returns:
+            Configured ProfileCapture instance, not capturing
+        """
+        if output_dir is None:
+            output_dir = self._config.get('profiling.output_dir', 'profiles')
+        frames = self._config.get_int('profiling.frames', 300)
+        top_n = self._config.get_int('profiling.top_n', 30)
+        
+        return ProfileCapture(output_dir, frames, top_n)
+    
+    def create_metrics_server(self, port: Optional[int] = None) -> MetricsServer:
+        """
+        Create the Prometheus exporter of the process metrics registry.
+        
+        Args:
+            port: Port to listen on. Default from configuration
+            
+        Returns:
+            Configured MetricsServer instance, not started
+        """
+        if port is None:
+            port = self._config.get_int('metrics.port', 9108)
+        host = self._config.get('metrics.host', '127.0.0.1')
+        
+        return MetricsServer(host=host, port=port)
+    
+    def create_gc_control(self, control: Optional[bool] = None) -> GarbageCollectorControl:
+        """
+        Create the garbage collector control of the engine loop.
+        
+        Args:
+            control: True to freeze the startup objects and run the collections
+                     in the idle time of the frames. Default from configuration
+            
+        Returns:
+            Configured GarbageCollectorControl instance, not started
+        """
+        if control is None:
+            control = bool(self._config.get('gc.control', False))
+        gen0_threshold = self._config.get_int('gc.gen0_threshold', 20000)
+        gen1_threshold = self._config.get_int('gc.gen1_threshold', 20)
+        full_collection_frames = self._config.get_int('gc.full_collection_frames', 600)
+        
+        return GarbageCollectorControl(control, gen0_threshold, gen1_threshold, full_collection_frames)
+    
     def create_display(self, width: int, height: int, draw_surface) -> IDisplay:
         """
         Create a display system for rendering.
@@ -69,10 +215,51 @@ class SystemFactory(ISystemFactory):
             draw_surface: Pygame surface to draw on
             
         Returns:
-            Configured Display instance
+            Configured Display instance, pushing only the dirty
+            rectangles when display.dirty_rects is set, and drawing
+            sprites when display.sprite_atlas.enabled is set
         """
         from Main.display import Display
-        return Display(width, height, draw_surface)
+        dirty_rects = bool(self._config.get('display.dirty_rects', False))
+        sprite_atlas = None
+        if self._config.get('display.sprite_atlas.enabled', False):
+            sprite_atlas = self.create_sprite_atlas()
+        return Display(width, height, draw_surface, dirty_rects, sprite_atlas=sprite_atlas)
+    
+    def create_sprite_atlas(self, max_bytes: Optional[int] = None):
+        """
+        Create the atlas of the pre-rasterized sprites of the shapes.
+        
+        Args:
+            max_bytes: Cap of the pixel memory of the sprites.
+                Default display.sprite_atlas.max_bytes
+            
+        Returns:
+            SpriteAtlas instance
+        """
+        from Main.spriteatlas import SpriteAtlas
+        if max_bytes is None:
+            max_bytes = self._config.get_int('display.sprite_atlas.max_bytes', 8 * 1024 * 1024)
+        return SpriteAtlas(max_bytes)
+    
+    def create_input_handler(self, world: IWorld, event_driven: Optional[bool] = None) -> IInputHandler:
+        """
+        Create the keyboard input handler of the player starship.
+        
+        Args:
+            world: World containing the starship
+            event_driven: True to read the KEYDOWN/KEYUP events instead of
+                polling the keyboard. Default input.event_driven
+            
+        Returns:
+            EventInputHandler or KeyboardInputHandler instance
+        """
+        from Main.input_handler import KeyboardInputHandler, EventInputHandler
+        if event_driven is None:
+            event_driven = bool(self._config.get('input.event_driven', False))
+        if event_driven:
+            return EventInputHandler(world, profile_key=self.get_profile_key())
+        return KeyboardInputHandler(world, profile_key=self.get_profile_key())
     
     def get_world_bounds(self) -> tuple:
         """
@@ -85,6 +272,15 @@ class SystemFactory(ISystemFactory):
         height = self._config.get_int('display.height', 500)
         return (width, height)
     
+    def get_world_margin(self) -> float:
+        """
+        Get the margin beyond the world bounds from configuration.
+        
+        Returns:
+            Distance beyond the screen edges before an object is removed
+        """
+        return self._config.get_float('physics.world_bounds.margin', 0.0)
+    
     def get_fps(self) -> int:
         """
         Get FPS from configuration.
@@ -94,6 +290,16 @@ class SystemFactory(ISystemFactory):
         """
         return self._config.get_int('display.fps', 30)
     
+    def get_profile_key(self) -> int:
+        """
+        Get the key requesting a profile capture from configuration.
+        
+        Returns:
+            The pygame key code of controls.profile (a key name, e.g. "p" or "f12")
+        """
+        import pygame
+        return pygame.key.key_code(str(self._config.get('controls.profile', 'p')))
+    
     def get_key_repeat_settings(self) -> tuple:
         """
         Get keyboard repeat settings from configuration.
@@ -59,6 +59,11 @@ class IDisplay(ABC):
         """Draw vertexes in world coordinates."""
         pass
     
+    @abstractmethod
+    def draw_commands(self, commands: Any) -> None:
+        """Draw the outlines of a RenderCommandBuffer."""
+        pass
+    
     @property
     @abstractmethod
     def width(self) -> int:
@@ -229,6 +234,36 @@ class IWorld(ABC):
         """Add an object to the world."""
         pass
     
+    @abstractmethod
+    def remove_object(self, object_id: int) -> None:
+        """Remove an object from the world."""
+        pass
+    
+    @abstractmethod
+    def add_objects(self, graphical_objects: List[IGameObject]) -> None:
+        """Add several objects to the world at once."""
+        pass
+    
+    @abstractmethod
+    def remove_objects(self, object_ids: List[int]) -> int:
+        """Remove several objects from the world at once."""
+        pass
+    
+    @abstractmethod
+    def spawn_object(self, graphical_object: IGameObject) -> None:
+        """Add an object at the end of the current tick."""
+        pass
+    
+    @abstractmethod
+    def despawn_object(self, object_id: int) -> None:
+        """Remove an object at the end of the current tick."""
+        pass
+    
+    @abstractmethod
+    def get_object(self, object_id: int) -> Optional[IGameObject]:
+        """Get an object by ID, or None if it is not in the world."""
+        pass
+    
     @abstractmethod
     def get_objects_list(self) -> Dict[int, IGameObject]:
         """Get all objects in the world."""
@@ -243,6 +278,11 @@ class IWorld(ABC):
     def get_world_objects_list(self) -> List[Any]:
         """Get renderable world objects."""
         pass
+    
+    @abstractmethod
+    def write_render_commands(self, commands: Any) -> None:
+        """Write the outlines of the objects in a RenderCommandBuffer."""
+        pass
 
 
 class IEngine(ABC):
@@ -316,4 +356,22 @@ class IInputHandler(ABC):
     @abstractmethod
     def is_exit_requested(self) -> bool:
         """Check if the user requested to exit."""
-        pass
\ No newline at end of file
+        pass
+    
+    def is_profile_requested(self) -> bool:
+        """Check if the user requested a profile capture. Only some handlers support it."""
+        return False
+    
+    def handle_events(self, events) -> None:
+        """Receive the window events got by the engine once per frame.
+        Only the event-driven handlers use them."""
+        pass
+    
+    def sample_input(self) -> None:
+        """Read the input devices, on the thread owning them, without touching the world.
+        Only the handlers queuing commands support it."""
+        pass
+    
+    def get_command_handler(self) -> 'IInputHandler':
+        """Get the handler applying the input to the world, on the thread owning it."""
+        return self
\ No newline at end of file
@@ -0,0 +1,157 @@
+import math
+from Infrastructure.interfaces.interfaces import IInputHandler
+from spatial import SpatialHashGrid
+
+__all__ = ['SpinAndFireStrategy', 'AimAtNearestAsteroidStrategy', 'BotInputHandler', 'BotSwarm']
+
+
+def _is_asteroid(world_object):
+    # By class name: the factories and the game modules may import graphicobjects twice
+    return type(world_object).__name__ == 'Asteroid'
+
+
+def _get_asteroids(world):
+    return {object_id: world_object
+            for object_id, world_object in world.get_objects_list().items()
+            if _is_asteroid(world_object)}
+
+
+# -----------------------------------------------------------------------
+class SpinAndFireStrategy(object):
+    """ Rotate at constant speed and fire whenever the starship is reloaded """
+
+    def __init__(self, turn_angle=10):
+        """
+        :param turn_angle: the rotation applied each tick, in degree
+        """
+        self._turn_angle = turn_angle
+
+    def decide(self, starship, world, targets):
+        """ Choose the input of the tick
+        :return: (relative rotation in degree, fire)
+        """
+        return self._turn_angle, True
+
+
+class AimAtNearestAsteroidStrategy(object):
+    """ Turn toward the nearest asteroid and fire when the head points at it.
+        The nearest asteroid is found with a query of the spatial grid of the targets
+    """
+
+    def __init__(self, turn_angle=10, aim_tolerance=10, max_distance=400):
+        """
+        :param turn_angle: the max rotation applied each tick, in degree
+        :param aim_tolerance: the max angle in degree between the head and the target to fire
+        :param max_distance: the asteroids farther than this distance are ignored
+        """
+        self._turn_angle = turn_angle
+        self._aim_tolerance = aim_tolerance
+        self._max_distance = max_distance
+
+    def decide(self, starship, world, targets):
+        position = starship.position
+        target_id = targets.query_nearest(position.x, position.y, self._max_distance)
+        if target_id is None:
+            return 0, False
+        target = world.get_object(target_id)
+        if target is None:
+            return 0, False
+        target_position = target.position
+
+        target_angle = math.degrees(math.atan2(target_position.y - position.y,
+                                               target_position.x - position.x))
+        # Shortest signed rotation from the head to the target, in [-180, 180)
+        delta = (target_angle - starship.head_angle + 180) % 360 - 180
+        rotation = int(round(max(-self._turn_angle, min(self._turn_angle, delta))))
+        return rotation, abs(delta - rotation) <= self._aim_tolerance
+
+
+# -----------------------------------------------------------------------
+class BotInputHandler(IInputHandler):
+    """ Pilot a starship with a scripted strategy instead of the keyboard """
+
+    def __init__(self, world, strategy, starship=None, targets=None):
+        """
+        :param world: the world containing the starship
+        :param strategy: the object choosing the input of each tick
+        :param starship: the piloted starship. Default the world starship
+        :param targets: the SpatialHashGrid of the asteroids. When None, the handler
+                        indexes the asteroids itself at each tick (use a BotSwarm to
+                        share a single index among many bots)
+        """
+        self._world = world
+        self._strategy = strategy
+        self._starship = starship if starship is not None else world.starship
+        self._targets = targets
+        self._exit_requested = False
+
+    @property
+    def starship(self):
+        return self._starship
+
+    def handle_input(self):
+        targets = self._targets
+        if targets is None:
+            targets = SpatialHashGrid()
+            targets.rebuild(_get_asteroids(self._world))
+        self.apply_strategy(targets)
+
+    def apply_strategy(self, targets):
+        """ Apply the input chosen by the strategy using the given asteroid index """
+        starship = self._starship
+        rotation, fire = self._strategy.decide(starship, self._world, targets)
+        if rotation:
+            starship.rotate_object(rotation)
+        if fire:
+            new_bullet = starship.fire()
+            if new_bullet is not None:
+                self._world.add_object(new_bullet)
+
+    def is_exit_requested(self) -> bool:
+        return self._exit_requested
+
+
+class BotSwarm(IInputHandler):
+    """ Drive many bot starships in the same world, headless.
+
+        The asteroids are indexed once per tick in a spatial grid shared by all
+        the bots, so the cost of a tick grows with the number of bots and not
+        with the number of bots times the number of asteroids.
+        It is an IInputHandler, so it can replace the keyboard in the engine.
+    """
+
+    def __init__(self, world, cell_size=64):
+        """
+        :param world: the world containing the bot starships
+        :param cell_size: the size of a cell of the asteroid grid
+        """
+        self._world = world
+        self._targets = SpatialHashGrid(cell_size)
+        self._bots = []
+
+    @property
+    def bots(self):
+        return list(self._bots)
+
+    def add_bot(self, starship, strategy):
+        """ Add a bot piloting the starship. The starship is added to the world if needed
+        :return: the BotInputHandler of the bot
+        """
+        objects_list = self._world.get_objects_list()
+        if objects_list.get(starship.id) is not starship:
+            self._world.add_object(starship)
+        bot = BotInputHandler(self._world, strategy, starship, self._targets)
+        self._bots.append(bot)
+        return bot
+
+    def remove_bot(self, bot):
+        self._bots.remove(bot)
+
+    def handle_input(self):
+        self._targets.rebuild(_get_asteroids(self._world))
+        targets = self._targets
+        for bot in self._bots:
+            bot.apply_strategy(targets)
+
+    def is_exit_requested(self) -> bool:
+        return False
@@ -1,5 +1,10 @@
+from metrics import REGISTRY
+
 __all__ = ['CollisionInfo', 'CollisionHandler']
 
+_PAIR_TESTS = REGISTRY.counter('collision_pair_tests_total', 'Pairs of objects tested for a collision')
+_INTERSECTING_PAIRS = REGISTRY.counter('collision_intersecting_pairs_total', 'Pairs of objects found colliding')
+
 
 class CollisionInfo(object):
     """ This class contains all the information about a collision
@@ -12,19 +17,31 @@ class CollisionInfo(object):
 class CollisionHandler(object):
     def __init__(self, world):
         self._world = world
+        # The CostAttribution timing the tests and the handlers per object class, or None
+        self.cost_attribution = None
 
     def handle(self):
         collision_list = self._build_collision_list()
         if len(collision_list) == 0:
             return
 
-        world_object_list = self._world.get_objects_list()
+        world = self._world
+        cost_attribution = self.cost_attribution
         for collision_item in collision_list:
             # retrieve the object. Remember that the key of the dictionary
             # is the object ID of the object that detected a collision
-            object = world_object_list[collision_item]
+            object = world.get_object(collision_item)
+            if object is None:
+                # Despawned by the collision handler of another object
+                continue
             collision_info = collision_list[collision_item]
-            object.collision_handler(collision_info, self._world)
+            if cost_attribution is None:
+                object.collision_handler(collision_info, self._world)
+            else:
+                start = cost_attribution.clock()
+                object.collision_handler(collision_info, self._world)
+                cost_attribution.add('collision_handler', type(object).__name__,
+                                     cost_attribution.clock() - start)
 
     def _build_collision_list(self):
         # We prepare a dictionary where the key is the ID of the object that has a collision
@@ -34,6 +51,10 @@ class CollisionHandler(object):
         # able to detect multiple collision for the same object (for example, an object that
         # collide with two other different objects
         collisions = {}
+        # Counted locally and added to the metrics once
+        pair_tests = 0
+        intersecting_pairs = 0
+        cost_attribution = self.cost_attribution
 
         for first_object_id in self._world.get_objects_list():
             if first_object_id in collisions:
@@ -49,10 +70,23 @@ class CollisionHandler(object):
                 world_objects_list = self._world.get_objects_list()
                 first_circle = world_objects_list[first_object_id].collision_circle
                 second_circle = world_objects_list[second_object_id].collision_circle
-                is_collision = first_circle.is_intersecting_circle(second_circle)
+                if cost_attribution is None:
+                    is_collision = first_circle.is_intersecting_circle(second_circle)
+                else:
+                    start = cost_attribution.clock()
+                    is_collision = first_circle.is_intersecting_circle(second_circle)
+                    elapsed = cost_attribution.clock() - start
+                    # The pair is not ordered: Asteroid x Bullet and Bullet x Asteroid are the same cost
+                    pair = tuple(sorted((type(world_objects_list[first_object_id]).__name__,
+                                         type(world_objects_list[second_object_id]).__name__)))
+                    cost_attribution.add('broad_phase', pair, elapsed)
+                pair_tests += 1
 
                 if is_collision:
+                    intersecting_pairs += 1
                     collisions[first_object_id] = CollisionInfo(first_object_id, second_object_id)
                     collisions[second_object_id] = CollisionInfo(second_object_id, first_object_id)
 
+        _PAIR_TESTS.value += pair_tests
+        _INTERSECTING_PAIRS.value += intersecting_pairs
         return collisions
\ No newline at end of file
@@ -1,24 +1,279 @@
+import math
+from collections import deque
+
+import numpy as np
+
 from geometrytransformation2d import Vector2D
+import constants
 import pygame
+from metrics import REGISTRY
+
+__all__ = ['Display', 'HeadlessDisplay', 'RecordingDisplay']
 
-__all__ = ['Display']
+_PIXELS_PUSHED = REGISTRY.counter('display_pixels_pushed_total', 'Pixels pushed to the window')
+_FRAME_PIXELS_PUSHED = REGISTRY.gauge('display_frame_pixels_pushed', 'Pixels pushed to the window by the last frame')
 
 
 # -----------------------------------------------------------------------
 class Display(object):
-    def __init__(self, width=0, height=0, draw_surface=None):
+    """ Draw the world on the window surface.
+
+        A frame is:
+            display.begin_frame()
+            display.draw_commands(render_commands) or display.draw_world_vertexes(...) for each object
+            display.blit(...) for the labels
+            display.end_frame()
+
+        With a SpriteAtlas, draw_objects(...) draws the objects instead of
+        draw_world_vertexes: one blit of a pre-rasterized sprite per object, batched
+        in a single Surface.blits call, and no vertex transformed.
+
+        With dirty_rects, begin_frame only erases what the last frame drew (the
+        shapes are drawn again in black: cheaper than filling their rectangles), and
+        end_frame pushes to the window only the rectangles (x, y, width, height)
+        of the shapes that appeared, moved or changed color, and of the labels,
+        instead of the whole surface. Every shape is still drawn on the surface,
+        so a shape overlapping an erased rectangle is restored.
+        When the rectangles cover more than full_update_ratio of the surface, a
+        single full push is cheaper than many small ones, and it is used; the
+        frame after a full push is erased with a single fill as well
+    """
+
+    def __init__(self, width=0, height=0, draw_surface=None, dirty_rects=False, full_update_ratio=0.5,
+                 sprite_atlas=None):
         self.width = width
         self.height = height
         self.draw_surface = draw_surface
-        
+        self.dirty_rects = dirty_rects
+        self.sprite_atlas = sprite_atlas
+        self._full_update_pixels = width * height * full_update_ratio
+        # (points, color) -> bounding rectangle of the shapes drawn by the current and the last frame
+        self._shapes = {}
+        self._previous_shapes = {}
+        # (sprite surface, position) -> rectangle of the sprites blitted by the current and the last frame
+        self._sprites = {}
+        self._previous_sprites = {}
+        self._previous_full_update = True
+        # The rectangles of the labels of the current and the last frame
+        self._label_rects = []
+        self._previous_label_rects = []
+        # The rectangles pushed by the last frame
+        self.last_update_rects = []
+        self.last_pixels_pushed = 0
+
     def _to_display_coordinate(self, world_vertex):
         display_x = self.width / 2 + world_vertex.x
         display_y = self.height / 2 + world_vertex.y
         return Vector2D(display_x, display_y)
-    
+
+    def begin_frame(self):
+        """ Erase the last frame: the whole surface, or only its shapes and labels """
+        if not self.dirty_rects:
+            self.draw_surface.fill(constants.BLACK)
+            return
+        surface = self.draw_surface
+        if self._previous_full_update:
+            surface.fill(constants.BLACK)
+        else:
+            for points, _ in self._previous_shapes:
+                pygame.draw.lines(surface, constants.BLACK, True, points, 1)
+            for rect in self._previous_sprites.values():
+                if rect is not None:
+                    surface.fill(constants.BLACK, rect)
+            for rect in self._previous_label_rects:
+                surface.fill(constants.BLACK, rect)
+        self._shapes = {}
+        self._sprites = {}
+        self._label_rects = []
+
     def draw_world_vertexes(self, world_vertex_list, color):
-        points = []
-        for vertex in world_vertex_list:
-            p = self._to_display_coordinate(vertex)
-            points.append((p.x, p.y))
+        half_width = self.width / 2
+        half_height = self.height / 2
+        if not self.dirty_rects:
+            points = [(half_width + vertex.x, half_height + vertex.y) for vertex in world_vertex_list]
+            pygame.draw.lines(self.draw_surface, color, True, points, 1)
+            return
+        xs = [half_width + vertex.x for vertex in world_vertex_list]
+        ys = [half_height + vertex.y for vertex in world_vertex_list]
+        points = tuple(zip(xs, ys))
         pygame.draw.lines(self.draw_surface, color, True, points, 1)
+        self._shapes[(points, color)] = self._get_bounding_rect(xs, ys)
+
+    def draw_commands(self, commands):
+        """ Draw the outlines of a RenderCommandBuffer
+        :param commands: the RenderCommandBuffer written by the world
+        """
+        if commands.object_count == 0:
+            return
+        # All the vertexes to screen coordinates at once
+        screen = commands.vertexes + (self.width / 2, self.height / 2)
+        points = list(zip(screen[:, 0].tolist(), screen[:, 1].tolist()))
+        colors = commands.colors
+        surface = self.draw_surface
+        draw_lines = pygame.draw.lines
+        ranges = list(zip(commands.starts.tolist(), commands.ends.tolist(), commands.color_ids.tolist()))
+        for start, end, color_id in ranges:
+            draw_lines(surface, colors[color_id], True, points[start:end], 1)
+        if self.dirty_rects:
+            shapes = self._shapes
+            rects = self._get_bounding_rects(screen, commands.starts)
+            for (start, end, color_id), rect in zip(ranges, rects):
+                shapes[(tuple(points[start:end]), colors[color_id])] = rect
+
+    def draw_objects(self, game_objects):
+        """ Draw the objects with the sprites of the atlas
+        :param game_objects: the objects to draw, with their local vertexes, position, rotation and color
+        """
+        atlas = self.sprite_atlas
+        half_width = self.width / 2
+        half_height = self.height / 2
+        blits = []
+        for game_object in game_objects:
+            shape = game_object.get_vertexes()
+            if not shape:
+                continue
+            sprite, offset_x, offset_y = atlas.get_sprite(shape, game_object.color, game_object.rotation_angle)
+            position = game_object.position
+            blits.append((sprite, (math.floor(half_width + position.x) + offset_x,
+                                   math.floor(half_height + position.y) + offset_y)))
+        self.draw_surface.blits(blits, False)
+        if self.dirty_rects:
+            sprites = self._sprites
+            for sprite, position in blits:
+                width, height = sprite.get_size()
+                sprites[(sprite, position)] = self._clip_rect(position[0], position[1],
+                                                              position[0] + width, position[1] + height)
+
+    def blit(self, source_surface, position):
+        """ Draw a surface, e.g. a text label, at the position (x, y) in screen coordinates """
+        self.draw_surface.blit(source_surface, position)
+        if self.dirty_rects:
+            width, height = source_surface.get_size()
+            self._label_rects.append((int(position[0]), int(position[1]), width, height))
+
+    def end_frame(self):
+        """ Push the frame to the window
+        :return: the number of pixels pushed
+        """
+        if not self.dirty_rects:
+            pygame.display.update()
+            rects = [(0, 0, self.width, self.height)]
+        else:
+            # The shapes drawn at the same place with the same color did not change on the screen
+            rects = self._get_changed_rects(self._shapes, self._previous_shapes)
+            rects.extend(self._get_changed_rects(self._sprites, self._previous_sprites))
+            rects.extend(self._label_rects)
+            rects.extend(self._previous_label_rects)
+            self._previous_full_update = sum(rect[2] * rect[3] for rect in rects) > self._full_update_pixels
+            if self._previous_full_update:
+                pygame.display.update()
+                rects = [(0, 0, self.width, self.height)]
+            elif rects:
+                pygame.display.update(rects)
+            self._previous_shapes = self._shapes
+            self._previous_sprites = self._sprites
+            self._previous_label_rects = self._label_rects
+
+        pixels = sum(rect[2] * rect[3] for rect in rects)
+        self.last_update_rects = rects
+        self.last_pixels_pushed = pixels
+        _PIXELS_PUSHED.value += pixels
+        _FRAME_PIXELS_PUSHED.value = pixels
+        return pixels
+
+    def _get_bounding_rect(self, xs, ys):
+        # The screen rectangle covering the 1 pixel wide lines between the points,
+        # clipped to the surface; None when it is out of the surface
+        return self._clip_rect(math.floor(min(xs)) - 1, math.floor(min(ys)) - 1,
+                               math.ceil(max(xs)) + 2, math.ceil(max(ys)) + 2)
+
+    def _get_bounding_rects(self, screen, starts):
+        # _get_bounding_rect of each range of the screen vertexes, computed with NumPy
+        mins = np.minimum.reduceat(screen, starts, axis=0)
+        maxs = np.maximum.reduceat(screen, starts, axis=0)
+        low = np.maximum(np.floor(mins) - 1, 0).astype(np.intp)
+        high = np.minimum(np.ceil(maxs) + 2, (self.width, self.height)).astype(np.intp)
+        size = high - low
+        visible = ((size[:, 0] > 0) & (size[:, 1] > 0)).tolist()
+        boxes = np.concatenate((low, size), axis=1).tolist()
+        return [tuple(box) if is_visible else None for box, is_visible in zip(boxes, visible)]
+
+    def _clip_rect(self, x_min, y_min, x_max, y_max):
+        # The rectangle (x, y, width, height) of the part of the box on the surface, or None
+        x_min = max(0, x_min)
+        y_min = max(0, y_min)
+        x_max = min(self.width, x_max)
+        y_max = min(self.height, y_max)
+        if x_max <= x_min or y_max <= y_min:
+            return None
+        return x_min, y_min, x_max - x_min, y_max - y_min
+
+    @staticmethod
+    def _get_changed_rects(current, previous):
+        # The rectangles of the keys in only one of the frames
+        return [rect for rect in ([current[key] for key in current.keys() - previous.keys()]
+                                  + [previous[key] for key in previous.keys() - current.keys()])
+                if rect is not None]
+
+
+# -----------------------------------------------------------------------
+class HeadlessDisplay(object):
+    """ A display that draws nothing, for the runs without a window (soak runs, benchmarks).
+        It reads the render commands like Display, so the frame cost is the world's only
+    """
+
+    def __init__(self, width=0, height=0):
+        self.width = width
+        self.height = height
+        self.dirty_rects = False
+        self.sprite_atlas = None
+        # The objects of the last frame
+        self.objects_drawn = 0
+
+    def begin_frame(self):
+        self.objects_drawn = 0
+
+    def draw_commands(self, commands):
+        self.objects_drawn += commands.object_count
+
+    def draw_world_vertexes(self, world_vertex_list, color):
+        self.objects_drawn += 1
+
+    def blit(self, source_surface, position):
+        pass
+
+    def end_frame(self):
+        return 0
+
+
+# -----------------------------------------------------------------------
+class RecordingDisplay(HeadlessDisplay):
+    """ A display that records the outlines of the last frames, in world coordinates,
+        e.g. to check what a test or a replay drew.
+        Each frame is a list of (color, [(x, y), ...]) in the order of the commands
+    """
+
+    def __init__(self, width=0, height=0, max_frames=100):
+        super().__init__(width, height)
+        self.frames = deque(maxlen=max_frames)
+        self._frame = []
+
+    def begin_frame(self):
+        super().begin_frame()
+        self._frame = []
+
+    def draw_commands(self, commands):
+        super().draw_commands(commands)
+        vertexes = commands.vertexes.tolist()
+        colors = commands.colors
+        for start, end, color_id in zip(commands.starts.tolist(), commands.ends.tolist(),
+                                        commands.color_ids.tolist()):
+            self._frame.append((colors[color_id], [tuple(vertex) for vertex in vertexes[start:end]]))
+
+    def draw_world_vertexes(self, world_vertex_list, color):
+        super().draw_world_vertexes(world_vertex_list, color)
+        self._frame.append((color, [(vertex.x, vertex.y) for vertex in world_vertex_list]))
+
+    def end_frame(self):
+        self.frames.append(self._frame)
+        return 0
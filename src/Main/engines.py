@@ -1,27 +1,57 @@
 import pygame.locals
 import sys
 import logging
+import time
+from array import array
+import numpy as np
 import constants
 import graphicobjects
 import logic
 import display
 import geometrytransformation2d
 from collisions import CollisionHandler
+from handles import HandleAllocator, INDEX_MASK
+from rendercommands import RenderCommandBuffer
+from pipeline import SimulationLoop
+from tracing import NULL_TRACER
+from metrics import REGISTRY
 
 __all__ = ['Engine', 'World']
 
 logging.getLogger().setLevel(logging.DEBUG)
 
+_FRAMES = REGISTRY.counter('frames_total', 'Frames run by the engine')
+_WORLD_TICKS = REGISTRY.counter('world_ticks_total', 'Calls of World.process')
+_OBJECTS_SPAWNED = REGISTRY.counter('objects_spawned_total', 'Objects added to a world')
+# A bullet is counted when it enters the world, so the shots predicted or replayed by a client are not
+_BULLETS_FIRED = REGISTRY.counter('bullets_fired_total', 'Bullets fired by the starships')
+_OBJECTS_CULLED = REGISTRY.counter('objects_culled_total', 'Objects removed because out of the world bounds')
+_WORLD_OBJECTS = REGISTRY.gauge('world_objects', 'Objects in the last processed world')
+
 
 # -----------------------------------------------------------------
 
 
 class Engine(object):
-    def __init__(self, display, world, input_handler):
+    def __init__(self, display, world, input_handler, tracer=None, profile_capture=None, gc_control=None,
+                 input_latency=None):
         # The world size will be the same of the display size
         self.world = world
         self._display = display
         self._input_handler = input_handler
+        # The FrameTracer recording the phases of each frame
+        self.tracer = tracer if tracer is not None else NULL_TRACER
+        self.world.tracer = self.tracer
+        # The ProfileCapture started by the profile hot-key, or None
+        self.profile_capture = profile_capture
+        # The GarbageCollectorControl measuring (and scheduling) the collections, or None
+        self.gc_control = gc_control
+        # The InputLatencyTracker told of each presented frame, or None
+        self.input_latency = input_latency
+        # The frame written by the world and drawn by the display, reused every frame
+        self._render_commands = RenderCommandBuffer()
+        # When the last wait for the next frame ended
+        self._last_tick_end = None
         
     def handle_keyboard(self):
         """Delegate to injected input handler"""
@@ -30,27 +60,166 @@ class Engine(object):
             pygame.quit()
             sys.exit(0)
 
-    ''' Fill the display surface with black '''
+    ''' Erase the last frame from the display surface '''
     def clean(self):
-        self._display.draw_surface.fill(constants.BLACK)
+        self._display.begin_frame()
 
     ''' Draw the entire world '''
     def draw(self):
-        # Draw all the objects included in the world
-        world_objects_list_to_render = self.world.get_world_objects_list()
-        # Render all the objects in the world
-        for world_object in world_objects_list_to_render:
-            self._display.draw_world_vertexes(world_object.vertexes, world_object.color)
+        if self._display.sprite_atlas is not None:
+            # Blit the sprites of the objects: no vertex to transform
+            self._display.draw_objects(self.world.get_objects_list().values())
+            return
+        # Draw the outlines of all the objects in the world
+        self.world.write_render_commands(self._render_commands)
+        self._display.draw_commands(self._render_commands)
 
     ''' Update the world status'''
     def update_world(self, time_passed):
         self.world.process(time_passed)
 
     ''' Return the number of objects in the world '''
-    def show_number_of_objects_in_worlds(self, font):
-        label_surface = font.render("Objects: %s" % len(self.world._objects_list), 1, (255, 255, 255))
-        self._display.draw_surface.blit(label_surface, (0, 0))
+    def show_number_of_objects_in_worlds(self, font, object_count=None):
+        if object_count is None:
+            object_count = len(self.world._objects_list)
+        label_surface = font.render("Objects: %s" % object_count, 1, (255, 255, 255))
+        self._display.blit(label_surface, (0, 0))
     
+    def run_frame(self, fps_clock, fps, font):
+        """ Run a single frame: input, wait, world update, draw and display update.
+            Each phase is a span of the tracer """
+        tracer = self.tracer
+        profile_capture = self.profile_capture
+        gc_control = self.gc_control
+        if profile_capture is not None:
+            profile_capture.frame_started()
+        if gc_control is not None:
+            gc_control.frame_started()
+        with tracer.span('frame'):
+            # handle events and keyboard
+            with tracer.span('input'):
+                self._input_handler.handle_events(pygame.event.get())
+                self.handle_keyboard()
+                if profile_capture is not None and self._input_handler.is_profile_requested():
+                    profile_capture.request()
+
+            with tracer.span('wait'):
+                # The time left before the next frame is the idle time of the collector
+                if gc_control is not None and self._last_tick_end is not None:
+                    with tracer.span('gc_idle'):
+                        gc_control.run_idle(1 / fps - (time.perf_counter() - self._last_tick_end))
+                delta_time = fps_clock.tick(fps)
+                self._last_tick_end = time.perf_counter()
+
+            with tracer.span('update'):
+                self.update_world(delta_time / 1000)
+
+            # Draw the scene
+            with tracer.span('draw'):
+                self.clean()
+                self.draw()
+                self.show_number_of_objects_in_worlds(font)
+
+            with tracer.span('display_update'):
+                self._display.end_frame()
+                if self.input_latency is not None:
+                    self.input_latency.frame_presented(self.world.tick)
+        _FRAMES.value += 1
+        tracer.add_counter('objects', len(self.world.get_objects_list()))
+        if gc_control is not None:
+            tracer.add_counter('gc_pause_ms', gc_control.frame_finished() * 1000)
+        if profile_capture is not None:
+            profile_capture.frame_finished()
+
+    def run_render_frame(self, frames, timeout, font):
+        """ Pipelined mode: render the latest snapshot published by the simulation thread.
+            The World is not read: the label shows the object count of the snapshot
+        :param frames: the TripleBuffer of the SimulationLoop
+        :param timeout: the seconds to wait for a new snapshot
+        :return: the FrameSnapshot drawn, or None when no new one came before the timeout
+        """
+        tracer = self.tracer
+        profile_capture = self.profile_capture
+        gc_control = self.gc_control
+        if profile_capture is not None:
+            profile_capture.frame_started()
+        if gc_control is not None:
+            gc_control.frame_started()
+        with tracer.span('render_frame'):
+            with tracer.span('input'):
+                # The devices are sampled here; the simulation thread applies the queued commands
+                self._input_handler.handle_events(pygame.event.get())
+                self._input_handler.sample_input()
+                if profile_capture is not None and self._input_handler.is_profile_requested():
+                    profile_capture.request()
+            with tracer.span('wait'):
+                snapshot = frames.acquire_latest(timeout)
+            if snapshot is not None:
+                with tracer.span('draw'):
+                    self.clean()
+                    self._display.draw_commands(snapshot.commands)
+                    self.show_number_of_objects_in_worlds(font, snapshot.object_count)
+                with tracer.span('display_update'):
+                    self._display.end_frame()
+                    if self.input_latency is not None:
+                        self.input_latency.frame_presented(snapshot.tick)
+        if snapshot is not None:
+            _FRAMES.value += 1
+            tracer.add_counter('objects', snapshot.object_count)
+        if gc_control is not None:
+            tracer.add_counter('gc_pause_ms', gc_control.frame_finished() * 1000)
+        if profile_capture is not None:
+            profile_capture.frame_finished()
+        return snapshot
+
+    def run_pipelined(self, fps, font):
+        """ The engine loop of the pipelined mode: a SimulationLoop thread owns the World
+            (the input commands and the update) and publishes a snapshot of each tick, while
+            this thread samples the input and renders the latest snapshot. The update of a tick and the drawing of the
+            previous one overlap, instead of adding up.
+            The draw uses the render commands of the snapshots, also with a sprite atlas,
+            and the profile captures only see this (render) thread.
+            It ends when the input handler requests the exit """
+        simulation = SimulationLoop(self.world, self._input_handler.get_command_handler(), fps, self.tracer,
+                                    gc_control=self.gc_control)
+        if self.gc_control is not None:
+            self.gc_control.start()
+        simulation.start()
+        try:
+            while not simulation.exit_requested and not self._input_handler.is_exit_requested():
+                self.run_render_frame(simulation.frames, 1 / fps, font)
+        finally:
+            try:
+                simulation.stop()
+            finally:
+                self._close()
+        pygame.quit()
+        sys.exit(0)
+
+    def run(self, fps, font):
+        """ The engine loop. It ends when the input handler requests the exit """
+        fps_clock = pygame.time.Clock()
+        if self.gc_control is not None:
+            self.gc_control.start()
+        try:
+            while True:
+                self.run_frame(fps_clock, fps, font)
+        finally:
+            self._close()
+
+    def _close(self):
+        self.tracer.close()
+        if self.profile_capture is not None:
+            self.profile_capture.close()
+        if self.gc_control is not None:
+            self.gc_control.close()
+            logging.info("Longest garbage collection pause of a frame: %.3f ms",
+                         self.gc_control.max_frame_pause * 1000)
+        if self.world.cost_attribution is not None:
+            logging.info("Cost per object type:\n%s", self.world.cost_attribution.format())
+        if self.input_latency is not None:
+            logging.info("Input latency:\n%s", self.input_latency.format())
+
     def start_game(self):
         """Start the main game loop using DI-provided configuration.
         
@@ -76,7 +245,6 @@ class Engine(object):
         from Infrastructure.factories.system_factory import SystemFactory
         from Infrastructure.factories.game_object_factory import GameObjectFactory
         from Infrastructure.factories.physics_factory import PhysicsFactory
-        from Main.input_handler import KeyboardInputHandler
         
         # Initialize configuration and factories
         config = ConfigurationManager()
@@ -98,7 +266,7 @@ class Engine(object):
         height = config.get_int('display.height', 500)
         draw_surface = pygame.display.set_mode((width, height))
         
-        display_obj = display.Display(width, height, draw_surface)
+        display_obj = system_factory.create_display(width, height, draw_surface)
         
         # Update engine with DI-provided dependencies
         self._display = display_obj
@@ -109,7 +277,7 @@ class Engine(object):
         self.world.collision_handler = system_factory.create_collision_handler(self.world)
         
         # Update input handler
-        self._input_handler = KeyboardInputHandler(self.world)
+        self._input_handler = system_factory.create_input_handler(self.world, event_driven=False)
         
         # Get FPS and keyboard settings from configuration
         fps = system_factory.get_fps()
@@ -118,26 +286,8 @@ class Engine(object):
         
         # Game setup
         DEFAULT_FONT = pygame.font.SysFont("arial", 15)
-        FPS_CLOCK = pygame.time.Clock()
         
-        # Engine loop
-        while True:
-            # handle events
-            pygame.event.get()
-
-            # Handle keyboard
-            self.handle_keyboard()
-
-            delta_time = FPS_CLOCK.tick(fps)
-
-            self.update_world(delta_time / 1000)
-
-            # Draw the scene
-            self.clean()
-            self.draw()
-            self.show_number_of_objects_in_worlds(DEFAULT_FONT)
-
-            pygame.display.update()
+        self.run(fps, DEFAULT_FONT)
 
 # -----------------------------------------------------------------
 
@@ -153,25 +303,166 @@ class World:
         # World width and height
         self._world_width = world_size[0]
         self._world_height = world_size[1]
-        # Max and min coordinates in the world to be visible
-        self._x_max = self._world_width / 2
+        # Max and min coordinates in the world to be visible, the margin included:
+        # the objects are removed when they are completely beyond it
+        margin = system_factory.get_world_margin()
+        self._x_max = self._world_width / 2 + margin
         self._x_min = - self._x_max
-        self._y_max = self._world_height / 2
+        self._y_max = self._world_height / 2 + margin
         self._y_min = - self._y_max
-        # Objects list
+        # Objects list, by id. The id of an object is a generational handle:
+        # its index is the slot of the object in the dense _slots list
         self._objects_list = {}
-        self._objects_counter = 0
+        self._handles = HandleAllocator()
+        self._slots = []
+        # The position and the bounding radius of the object in each slot, for the cull.
+        # A free slot is a point at the origin: always inside the bounds, it is never culled.
+        # An object without vertexes has a NaN radius
+        self._slot_x = array('d')
+        self._slot_y = array('d')
+        self._slot_radius = array('d')
+        # The tracer recording the phases of process(); the engine replaces it
+        self.tracer = NULL_TRACER
+        # Functions called with each object removed from the world
+        self._removal_listeners = []
+        # The structural changes requested during a tick, applied at its end
+        self._pending_additions = []
+        self._pending_removals = {}
+        # The CostAttribution timing the update per object class, or None
+        self.cost_attribution = None
+        # The number of ticks processed: the input applied before a process() is stamped with it
+        self.tick = 0
         # Add the objects in the world using factories
         self.starship = game_object_factory.create_starship_at_origin()
         self.add_object(self.starship)
         self.asteroid_generator = system_factory.create_asteroid_generator(self)
         self.collision_handler = system_factory.create_collision_handler(self)
 
+    ''' The (width, height) of the world, in pixels '''
+    @property
+    def world_size(self):
+        return self._world_width, self._world_height
+
     ''' Add an object to the world '''
     def add_object(self, graphical_object):
-        self._objects_counter += 1
-        graphical_object.id = self._objects_counter
-        self._objects_list[graphical_object.id] = graphical_object
+        self.add_objects((graphical_object,))
+
+    ''' Add several objects to the world at once '''
+    def add_objects(self, graphical_objects):
+        objects_list = self._objects_list
+        count = 0
+        bullets = 0
+        for graphical_object in graphical_objects:
+            graphical_object.id = self._handles.allocate()
+            objects_list[graphical_object.id] = graphical_object
+            self._set_slot(graphical_object)
+            count += 1
+            if type(graphical_object).__name__ == 'Bullet':
+                bullets += 1
+        _OBJECTS_SPAWNED.value += count
+        _BULLETS_FIRED.value += bullets
+
+    ''' Remove an object from the world. Removing an object not in the world does nothing '''
+    def remove_object(self, object_id):
+        self.remove_objects((object_id,))
+
+    ''' Remove several objects from the world at once. The ids not in the world are ignored.
+        Return the number of objects removed '''
+    def remove_objects(self, object_ids):
+        objects_list = self._objects_list
+        removed = [graphical_object for graphical_object
+                   in (objects_list.pop(object_id, None) for object_id in object_ids)
+                   if graphical_object is not None]
+        slots = self._slots
+        slot_x, slot_y, slot_radius = self._slot_x, self._slot_y, self._slot_radius
+        release = self._handles.release
+        for graphical_object in removed:
+            index = graphical_object.id & INDEX_MASK
+            slots[index] = None
+            slot_x[index] = slot_y[index] = slot_radius[index] = 0.0
+            release(graphical_object.id)
+        if self._removal_listeners:
+            for graphical_object in removed:
+                for listener in self._removal_listeners:
+                    listener(graphical_object)
+        return len(removed)
+
+    ''' Add an object at the end of the tick. The id is given now, so the caller can keep it '''
+    def spawn_object(self, graphical_object):
+        graphical_object.id = self._handles.allocate()
+        self._pending_additions.append(graphical_object)
+
+    ''' Remove an object at the end of the tick. Until then, get_object() does not return it,
+        so the collision handlers can't hit it twice '''
+    def despawn_object(self, object_id):
+        self._pending_removals[object_id] = True
+
+    ''' Apply the spawns and the despawns of the tick, as one batch each '''
+    def apply_pending_changes(self):
+        removals = self._pending_removals
+        if removals:
+            self._pending_removals = {}
+            self.remove_objects(removals)
+        if self._pending_additions:
+            objects_list = self._objects_list
+            added = 0
+            bullets = 0
+            for graphical_object in self._pending_additions:
+                if graphical_object.id in removals:
+                    # Despawned in the tick of its spawn: it never enters the world
+                    self._handles.release(graphical_object.id)
+                    continue
+                objects_list[graphical_object.id] = graphical_object
+                self._set_slot(graphical_object)
+                added += 1
+                if type(graphical_object).__name__ == 'Bullet':
+                    bullets += 1
+            _OBJECTS_SPAWNED.value += added
+            _BULLETS_FIRED.value += bullets
+            self._pending_additions = []
+
+    ''' Return the object with the id, or None if it is not in the world or is despawned.
+        A stale id (its slot is free or reused by another object) is found in O(1) '''
+    def get_object(self, object_id):
+        index = object_id & INDEX_MASK
+        if index >= len(self._slots):
+            return None
+        graphical_object = self._slots[index]
+        if graphical_object is None or graphical_object.id != object_id or object_id in self._pending_removals:
+            return None
+        return graphical_object
+
+    ''' The dense list of the objects by slot (the index of their id). The free slots are None '''
+    def get_slots(self):
+        return self._slots
+
+    def _set_slot(self, graphical_object):
+        index = graphical_object.id & INDEX_MASK
+        slots = self._slots
+        if index >= len(slots):
+            grow = index + 1 - len(slots)
+            slots.extend([None] * grow)
+            self._slot_x.extend([0.0] * grow)
+            self._slot_y.extend([0.0] * grow)
+            self._slot_radius.extend([0.0] * grow)
+        slots[index] = graphical_object
+        position = graphical_object.position
+        self._slot_x[index] = position.x
+        self._slot_y[index] = position.y
+        radius = graphical_object.bounding_radius
+        self._slot_radius[index] = np.nan if radius is None else radius
+
+    ''' Register a function called with each object removed from the world '''
+    def add_removal_listener(self, listener):
+        self._removal_listeners.append(listener)
+
+    def remove_removal_listener(self, listener):
+        self._removal_listeners.remove(listener)
+
+    ''' Time the processing and the collisions per object class. None disables it '''
+    def set_cost_attribution(self, cost_attribution):
+        self.cost_attribution = cost_attribution
+        self.collision_handler.cost_attribution = cost_attribution
 
     ''' Return the list of the objects in the world '''
     def get_objects_list(self):
@@ -179,21 +470,50 @@ class World:
 
     ''' Process the world, updating the status of each object '''
     def process(self, time_passed):
+        tracer = self.tracer
         # Check if there is a new asteroid
-        self.asteroid_generator.process()
-        new_asteroid = self.asteroid_generator.get_new_asteroid()
-        if new_asteroid is not None:
-            self.add_object(new_asteroid)
+        with tracer.span('spawn'):
+            self.asteroid_generator.process()
+            new_asteroid = self.asteroid_generator.get_new_asteroid()
+            if new_asteroid is not None:
+                self.spawn_object(new_asteroid)
 
         # Process all the objects in the world
-        for key in self._objects_list:
-            self._objects_list[key].process(time_passed)
+        with tracer.span('process'):
+            # The new position of each object goes in its slot, for the cull
+            cost_attribution = self.cost_attribution
+            slot_x, slot_y = self._slot_x, self._slot_y
+            if cost_attribution is None:
+                for key, graphic_object in self._objects_list.items():
+                    graphic_object.process(time_passed)
+                    position = graphic_object.position
+                    slot_x[key & INDEX_MASK] = position.x
+                    slot_y[key & INDEX_MASK] = position.y
+            else:
+                clock = cost_attribution.clock
+                for key, graphic_object in self._objects_list.items():
+                    start = clock()
+                    graphic_object.process(time_passed)
+                    cost_attribution.add('process', type(graphic_object).__name__, clock() - start)
+                    position = graphic_object.position
+                    slot_x[key & INDEX_MASK] = position.x
+                    slot_y[key & INDEX_MASK] = position.y
 
         # Remove objects that are outside the bounds
-        self._remove_objects_not_visible()
+        with tracer.span('cull'):
+            self._remove_objects_not_visible()
 
         # Collision handling
-        self.collision_handler.handle()
+        with tracer.span('collide'):
+            self.collision_handler.handle()
+
+        # The spawns and the despawns requested during the tick
+        with tracer.span('apply_changes'):
+            self.apply_pending_changes()
+
+        self.tick += 1
+        _WORLD_TICKS.value += 1
+        _WORLD_OBJECTS.value = len(self._objects_list)
 
     ''' Return a collection of WorldObject.
         Each items contains the vertexes collection and the color of the object '''
@@ -204,6 +524,29 @@ class World:
                                in self._objects_list.items()]
         return world_vertexes_list
 
+    ''' Write the outlines of the objects in a RenderCommandBuffer, without any per-object allocation.
+        The objects sharing a shape are transformed together '''
+    def write_render_commands(self, commands):
+        commands.clear()
+        get_color_id = commands.get_color_id
+        # id(shape) -> [shape, xs, ys, angles, color ids, object ids]
+        groups = {}
+        for object_id, graphic_object in self._objects_list.items():
+            shape = graphic_object.get_vertexes()
+            if not shape:
+                continue
+            group = groups.get(id(shape))
+            if group is None:
+                group = groups[id(shape)] = [shape, [], [], [], [], []]
+            position = graphic_object.position
+            group[1].append(position.x)
+            group[2].append(position.y)
+            group[3].append(graphic_object.rotation_angle)
+            group[4].append(get_color_id(graphic_object.get_color()))
+            group[5].append(object_id)
+        for group in groups.values():
+            commands.add_instances(*group)
+
     def _build_world_object(self, object):
         world_vertexes_list = self._get_world_vertexes_for_object(object)
         color = object.get_color()
@@ -222,20 +565,38 @@ class World:
                           in object_vertexes]
         return world_vertexes
 
-    ''' Remove the objects that are outside the world bounds '''
+    ''' Remove the objects that are outside the world bounds.
+        The bounding box of each object (its position +/- its bounding radius) is tested
+        against the bounds for all the slots at once, on the slot arrays: a box inside the
+        bounds is visible, a box beyond them is not. Only the boxes across a bound need
+        the vertexes test. The positions are the ones written by process() or at the add '''
     def _remove_objects_not_visible(self):
-        keys_of_objects_to_remove = [key for key
-                                     in self._objects_list
-                                     if not self._is_object_visible(self._objects_list[key])]
-        for key in keys_of_objects_to_remove:
-            del self._objects_list[key]
+        if not self._objects_list:
+            return
+        # Views on the slot arrays, released before the arrays can grow again
+        x = np.frombuffer(self._slot_x, dtype=np.float64)
+        y = np.frombuffer(self._slot_y, dtype=np.float64)
+        radius = np.frombuffer(self._slot_radius, dtype=np.float64)
+        # A NaN radius fails both tests below and goes to the vertexes test, that never finds it visible
+        inside = ((x - radius > self._x_min) & (x + radius < self._x_max)
+                  & (y - radius > self._y_min) & (y + radius < self._y_max))
+        beyond = ((x + radius <= self._x_min) | (x - radius >= self._x_max)
+                  | (y + radius <= self._y_min) | (y - radius >= self._y_max))
+        across = ~(inside | beyond)
+        del x, y, radius
+
+        slots = self._slots
+        keys_of_objects_to_remove = [slots[index].id for index in np.flatnonzero(beyond).tolist()]
+        keys_of_objects_to_remove.extend(slots[index].id for index in np.flatnonzero(across).tolist()
+                                         if not self._is_object_visible(slots[index]))
+        _OBJECTS_CULLED.value += self.remove_objects(keys_of_objects_to_remove)
 
     ''' Check if the object is visible.
         An object is visible if all the object vertexes are in the world bounds '''
     def _is_object_visible(self, graphic_object):
         world_vertexes = self._get_world_vertexes_for_object(graphic_object)
         for vertex in world_vertexes:
-            if vertex.x < self._x_max and vertex.x > self._x_min and vertex.y > self._y_min and vertex.y < self._x_max:
+            if vertex.x < self._x_max and vertex.x > self._x_min and vertex.y > self._y_min and vertex.y < self._y_max:
                 return True
         # If the code arrive here, it means that all the vertex are outside the visible area, so the object is not visible
         return False
@@ -260,7 +621,6 @@ def main():
     from Infrastructure.factories.system_factory import SystemFactory
     from Infrastructure.factories.game_object_factory import GameObjectFactory
     from Infrastructure.factories.physics_factory import PhysicsFactory
-    from Main.input_handler import KeyboardInputHandler
 
     # Initialize configuration and factories
     config = ConfigurationManager()
@@ -279,7 +639,7 @@ def main():
     DISPLAY = display.Display(width, height, draw_surface)
 
     # Create input handler
-    input_handler = KeyboardInputHandler(world)
+    input_handler = system_factory.create_input_handler(world, event_driven=False)
 
     # Create engine with all dependencies
     ENGINE = Engine(DISPLAY, world, input_handler)
@@ -290,27 +650,10 @@ def main():
 
     # Update speed
     FPS = system_factory.get_fps()
-    FPS_CLOCK = pygame.time.Clock()
     DEFAULT_FONT = pygame.font.SysFont("arial", 15)
 
     # Engine loop
-    while True:
-        # handle events
-        pygame.event.get()
-
-        # Handle keyboard
-        ENGINE.handle_keyboard()
-
-        delta_time = FPS_CLOCK.tick(FPS)
-
-        ENGINE.update_world(delta_time / 1000)
-
-        # Draw the scene
-        ENGINE.clean()
-        ENGINE.draw()
-        ENGINE.show_number_of_objects_in_worlds(DEFAULT_FONT)
-
-        pygame.display.update()
+    ENGINE.run(FPS, DEFAULT_FONT)
 
 
 # -----------------------------------------------------------------
@@ -0,0 +1,172 @@
+import gc
+import os
+import traceback
+from multiprocessing import Pipe
+
+from server import SharedResources
+
+__all__ = ['PreforkServer', 'WorkerHandle']
+
+# Messages sent by the parent to an idle worker
+MESSAGE_START = 'start'
+MESSAGE_STOP = 'stop'
+# Messages sent by the worker to the parent
+MESSAGE_READY = 'ready'
+MESSAGE_DONE = 'done'
+MESSAGE_ERROR = 'error'
+
+
+class WorkerHandle(object):
+    """ The parent side of a forked worker that is running a match """
+
+    def __init__(self, pid, connection):
+        self.pid = pid
+        self._connection = connection
+        self._exit_status = None
+        # The payload of the READY message, once received
+        self._ready = False
+        self._ready_payload = None
+
+    def wait_ready(self):
+        """ Block until the worker created the world of the match. Can be called more than once """
+        if not self._ready:
+            message, payload = self._connection.recv()
+            if message == MESSAGE_ERROR:
+                self._reap()
+                raise RuntimeError("Match worker %d failed: %s" % (self.pid, payload))
+            self._ready = True
+            self._ready_payload = payload
+        return self._ready_payload
+
+    def join(self):
+        """ Wait the end of the match, skipping the READY message if wait_ready() was not called
+        :return: the value returned by the match main function
+        """
+        self.wait_ready()
+        message, payload = self._connection.recv()
+        self._reap()
+        if message == MESSAGE_ERROR:
+            raise RuntimeError("Match worker %d failed: %s" % (self.pid, payload))
+        return payload
+
+    def _reap(self):
+        if self._exit_status is None:
+            _, self._exit_status = os.waitpid(self.pid, 0)
+            self._connection.close()
+
+
+class PreforkServer(object):
+    """ Start matches in processes forked from an already initialized parent.
+
+        The parent pays once for the imports, the lookup tables, the YAML parsing and
+        the factories, then freezes its objects (gc.freeze(), so the garbage collector
+        of the children never touches them and the copy-on-write pages stay shared)
+        and keeps a pool of idle forked workers. Starting a match only sends the
+        match specification to an idle worker, that creates its World and runs it.
+        The worker taken is replaced by refill(), out of the match start path.
+
+        POSIX only, because it relies on os.fork()
+    """
+
+    def __init__(self, match_main, pool_size=None, resources=None):
+        """
+        :param match_main: function (world, match_spec) executed in the worker.
+                           Its return value must be picklable
+        :param pool_size: number of idle workers kept ready. Default from configuration
+        :param resources: the SharedResources to initialize once. Created if None
+        """
+        if not hasattr(os, 'fork'):
+            raise RuntimeError("PreforkServer requires os.fork()")
+        self._match_main = match_main
+        self._resources = resources if resources is not None else SharedResources()
+        if pool_size is None:
+            pool_size = self._resources.config.get_int('server.prefork_pool_size', 2)
+        self._pool_size = pool_size
+        self._idle = []
+        # The parent side of the connection of every worker, idle or running a match:
+        # each new worker closes the ones it inherits
+        self._connections = []
+        self._started = False
+
+    @property
+    def idle_workers(self):
+        return len(self._idle)
+
+    def start(self):
+        """ Freeze the initialized state and fork the pool of idle workers """
+        gc.collect()
+        gc.freeze()
+        self._started = True
+        self.refill()
+
+    def refill(self):
+        """ Fork the idle workers missing from the pool, so that the next matches start immediately.
+            Call it after start_match() returned, e.g. when the server is idle
+        :return: the number of workers forked
+        """
+        forked = 0
+        while len(self._idle) < self._pool_size:
+            self._idle.append(self._fork_worker())
+            forked += 1
+        return forked
+
+    def start_match(self, match_spec=None):
+        """ Start a match on an idle worker. It forks one only when the pool is empty
+        :param match_spec: picklable data passed to the match main function
+        :return: the WorkerHandle of the worker running the match
+        """
+        if not self._started:
+            self.start()
+        if not self._idle:
+            self._idle.append(self._fork_worker())
+        pid, connection = self._idle.pop(0)
+        connection.send((MESSAGE_START, match_spec))
+        return WorkerHandle(pid, connection)
+
+    def shutdown(self):
+        """ Stop the idle workers """
+        for pid, connection in self._idle:
+            connection.send((MESSAGE_STOP, None))
+            os.waitpid(pid, 0)
+            connection.close()
+        self._idle = []
+        gc.unfreeze()
+        self._started = False
+
+    def _fork_worker(self):
+        # The connections of the joined workers are closed: forget them
+        self._connections = [connection for connection in self._connections if not connection.closed]
+        parent_connection, child_connection = Pipe()
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                parent_connection.close()
+                exit_code = self._worker_main(child_connection)
+            finally:
+                # Skip the parent atexit handlers and buffers: they are not ours
+                os._exit(exit_code)
+        child_connection.close()
+        self._connections.append(parent_connection)
+        return pid, parent_connection
+
+    def _worker_main(self, connection):
+        # The connections of the other workers (idle or running a match) belong to the parent:
+        # kept open, they would leak and hide the end of the parent from the workers
+        for worker_connection in self._connections:
+            worker_connection.close()
+        try:
+            message, match_spec = connection.recv()
+        except EOFError:
+            return 0
+        if message == MESSAGE_STOP:
+            return 0
+        try:
+            world = self._resources.create_world()
+            connection.send((MESSAGE_READY, os.getpid()))
+            result = self._match_main(world, match_spec)
+            connection.send((MESSAGE_DONE, result))
+            return 0
+        except Exception:
+            connection.send((MESSAGE_ERROR, traceback.format_exc()))
+            return 1
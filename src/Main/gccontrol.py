@@ -0,0 +1,167 @@
+import gc
+import threading
+import time
+
+from metrics import REGISTRY
+
+__all__ = ['GarbageCollectorControl']
+
+_GC_PAUSE_SECONDS = {
+    'frame': REGISTRY.counter('gc_pause_seconds_total', 'Time spent in garbage collections', {'phase': 'frame'}),
+    'idle': REGISTRY.counter('gc_pause_seconds_total', 'Time spent in garbage collections', {'phase': 'idle'}),
+}
+_GC_COLLECTIONS = [REGISTRY.counter('gc_collections_total', 'Garbage collections', {'generation': str(generation)})
+                   for generation in range(3)]
+_GC_FRAME_PAUSE = REGISTRY.gauge('gc_frame_pause_seconds', 'Garbage collection pause of the last frame')
+_GC_MAX_FRAME_PAUSE = REGISTRY.gauge('gc_max_frame_pause_seconds', 'Longest garbage collection pause of a frame')
+
+# A generation 2 threshold that the automatic collection never reaches
+_NEVER = 1 << 30
+
+
+class GarbageCollectorControl(object):
+    """ Measure the garbage collection pauses of each frame and, in control mode,
+        move the collections out of the frames.
+
+        Each frame allocates thousands of short-lived Vector2D, Circle and
+        WorldObject instances. With the default thresholds the collector runs
+        often during the frames, and a full (generation 2) collection walks every
+        live object: a visible hitch.
+
+        In control mode, at start:
+            - gc.freeze() moves the objects created by the startup (modules,
+              configuration, factories) to a permanent generation never scanned
+            - the generation 0 threshold is raised and the automatic full
+              collections are suppressed
+        and in the idle time left at the end of a frame, before the engine
+        sleeps until the next one, run_idle() runs the young collections that
+        are almost due and, when the idle time is long enough, the full one.
+
+        Usage, around each frame:
+            gc_control.frame_started()
+            ...
+            gc_control.run_idle(seconds_left_in_the_frame)
+            gc_control.frame_finished()
+
+        In the pipelined mode the frames are rendered by the window thread, and
+        run_idle() is called by the simulation thread in its wait between two
+        ticks. The frame pause only counts the collections of the thread that
+        called frame_started().
+    """
+
+    def __init__(self, control=False, gen0_threshold=20000, gen1_threshold=20,
+                 full_collection_frames=600, clock=time.perf_counter):
+        """
+        :param control: True to freeze the startup objects and schedule the collections.
+                        False only measures the pauses
+        :param gen0_threshold: the allocations minus deallocations starting a young collection
+        :param gen1_threshold: the young collections starting a generation 1 collection
+        :param full_collection_frames: the frames between two full collections in the idle time.
+                                       After 4 times this number, the full collection runs even
+                                       without enough idle time, so the cyclic garbage can't grow forever
+        :param clock: the function returning the current time in seconds
+        """
+        self.control = control
+        self._gen0_threshold = gen0_threshold
+        self._gen1_threshold = gen1_threshold
+        self._full_collection_frames = full_collection_frames
+        self._clock = clock
+        self._started = False
+        self._previous_thresholds = None
+        self._collection_start = 0.0
+        # The thread running run_idle(), and the one running the frames
+        self._idle_thread = None
+        self._frame_thread = None
+        self._frame_pause = 0.0
+        self._frames_since_full = 0
+        # Duration of the last collection of each generation: the estimate of the next one
+        self._last_duration = [0.0, 0.0, 0.0]
+        self.max_frame_pause = 0.0
+
+    @property
+    def frame_pause(self):
+        """ The seconds of garbage collection during the current (or last) frame """
+        return self._frame_pause
+
+    def start(self):
+        """ Call once the startup is done: the objects alive now are frozen in control mode """
+        if self._started:
+            return
+        self._started = True
+        gc.callbacks.append(self._on_collection)
+        if self.control:
+            gc.collect()
+            gc.freeze()
+            self._previous_thresholds = gc.get_threshold()
+            gc.set_threshold(self._gen0_threshold, self._gen1_threshold, _NEVER)
+
+    def close(self):
+        """ Restore the default collector """
+        if not self._started:
+            return
+        self._started = False
+        gc.callbacks.remove(self._on_collection)
+        if self._previous_thresholds is not None:
+            gc.set_threshold(*self._previous_thresholds)
+            self._previous_thresholds = None
+            gc.unfreeze()
+
+    def frame_started(self):
+        self._frame_pause = 0.0
+        self._frame_thread = threading.get_ident()
+
+    def frame_finished(self):
+        """ Publish the pause of the frame
+        :return: the seconds of garbage collection during the frame
+        """
+        _GC_FRAME_PAUSE.value = self._frame_pause
+        if self._frame_pause > self.max_frame_pause:
+            self.max_frame_pause = self._frame_pause
+            _GC_MAX_FRAME_PAUSE.value = self._frame_pause
+        return self._frame_pause
+
+    def run_idle(self, idle_seconds):
+        """ In control mode, run the collections that fit in the idle time of the frame
+        :param idle_seconds: the time left before the next frame
+        """
+        if not self.control or not self._started:
+            return
+        self._frames_since_full += 1
+        clock = self._clock
+        deadline = clock() + idle_seconds
+        self._idle_thread = threading.get_ident()
+        try:
+            full_due = self._frames_since_full >= self._full_collection_frames
+            if full_due and (self._last_duration[2] <= idle_seconds
+                             or self._frames_since_full >= 4 * self._full_collection_frames):
+                gc.collect(2)
+                self._frames_since_full = 0
+                return
+            # A young collection now, when it is cheap, instead of during the next frame
+            count0, count1, _ = gc.get_count()
+            if count1 >= self._gen1_threshold - 1:
+                generation = 1
+            elif count0 >= self._gen0_threshold // 2:
+                generation = 0
+            else:
+                return
+            if self._last_duration[generation] <= deadline - clock():
+                gc.collect(generation)
+        finally:
+            self._idle_thread = None
+
+    def _on_collection(self, phase, info):
+        if phase == 'start':
+            self._collection_start = self._clock()
+            return
+        duration = self._clock() - self._collection_start
+        generation = info['generation']
+        self._last_duration[generation] = duration
+        _GC_COLLECTIONS[generation].value += 1
+        thread = threading.get_ident()
+        if thread == self._idle_thread:
+            _GC_PAUSE_SECONDS['idle'].value += duration
+            return
+        _GC_PAUSE_SECONDS['frame'].value += duration
+        if thread == self._frame_thread:
+            self._frame_pause += duration
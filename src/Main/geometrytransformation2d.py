@@ -1,9 +1,12 @@
 import lookuptables
 import values
+from metrics import REGISTRY
 
 __all__ = ['Vector2D', 'Circle', 'rotate', 'move_in_a_direction', 'translate',
            'from_local_to_world_coordinates']
 
+_VECTORS_ALLOCATED = REGISTRY.counter('vectors_allocated_total', 'Vector2D instances created')
+
 class Vector2D(object):
     """ Thi class define a simple vector in the 2D world
     """
@@ -11,6 +14,7 @@ class Vector2D(object):
     def __init__(self, x=0, y=0):
         self.x = x
         self.y = y
+        _VECTORS_ALLOCATED.value += 1
 
     def __add__(self, other):
         return Vector2D(self.x + other.x, self.y + other.y)
@@ -6,6 +6,11 @@ from Infrastructure.interfaces.interfaces import IGameObject, IStarShip, IBullet
 
 __all__ = ['GraphicObject', 'StarShip', 'Bullet', 'Asteroid']
 
+# Default shapes. They are shared by all the instances, and never modified
+STARSHIP_VERTEXES = (Vector2D(20, 0), Vector2D(-10, -10), Vector2D(0, 0), Vector2D(-10, 10))
+BULLET_VERTEXES = (Vector2D(-3, 0), Vector2D(3, 0))
+ASTEROID_VERTEXES = (Vector2D(10, 10), Vector2D(-10, 10), Vector2D(-10, -10), Vector2D(10, -10))  # A rectangle
+
 # -----------------------------------------------------------------
 class GraphicObject(IGameObject):
     """ GraphicObject: the base class for every object on the screen """
@@ -19,6 +24,9 @@ class GraphicObject(IGameObject):
         self.rotation_angle = 0  # This is the angle of rotation of the object on its center point
         self.speed = 0  # The movement speed in pixel/sec
         self._id = 0 # The unique ID of the object
+        # The max distance of a vertex from the origin of the object. The shape never changes,
+        # and the rotation keeps the distances, so it is computed once
+        self.bounding_radius = self._compute_bounding_radius()
         self._compute_collision_circle()
 
     """ This method move the Graphical object """
@@ -32,11 +40,14 @@ class GraphicObject(IGameObject):
         if self.object_vertexes is None:
             return None
 
-        # Compute the radius getting the max of the distance of each vertex from the origin of the object
-        distances = [v.magnitude_power_2() for v in self.object_vertexes]
-        radius = math.sqrt(max(distances))
         center = Vector2D(self._position.x, self._position.y)
-        self.collision_circle = Circle(center, radius)
+        self.collision_circle = Circle(center, self.bounding_radius)
+
+    def _compute_bounding_radius(self):
+        if not self.object_vertexes:
+            return None
+        # The max of the distance of each vertex from the origin of the object
+        return math.sqrt(max(v.magnitude_power_2() for v in self.object_vertexes))
 
     " This method rotate the head direction of the Graphical object "
     def rotate_head_direction(self, relative_angle):
@@ -63,6 +74,11 @@ class GraphicObject(IGameObject):
     def position(self):
         return self._position
     
+    @position.setter
+    def position(self, value):
+        self._position = value
+        self._compute_collision_circle()
+    
     @property
     def id(self):
         return self._id
@@ -84,10 +100,7 @@ class StarShip(GraphicObject, IStarShip):
     def __init__(self, x, y, color, vertexes_local=None):
         # Allow custom vertexes or use defaults for backward compatibility
         if vertexes_local is None:
-            object_vertexes = (Vector2D(20, 0),
-                               Vector2D(-10, -10),
-                               Vector2D(0, 0),
-                               Vector2D(-10, 10))
+            object_vertexes = STARSHIP_VERTEXES
         else:
             object_vertexes = vertexes_local
             
@@ -99,11 +112,12 @@ class StarShip(GraphicObject, IStarShip):
         super().rotate_object(relative_angle)
         self.head_angle = int((self.head_angle + relative_angle) % 360)
 
+    " This method fires a bullet, unless reloading "
     def fire(self):
         if not self.is_reloading():
-            null_vector = geometrytransformation2d.Vector2D(0, 0)
             if self.object_vertexes and len(self.object_vertexes) > 0:
-                start_position = geometrytransformation2d.from_local_to_world_coordinates(self.object_vertexes[0], null_vector, self.head_angle)
+                # The bullet starts from the nose of the starship: its first vertex, in world coordinates
+                start_position = geometrytransformation2d.from_local_to_world_coordinates(self.object_vertexes[0], self.position, self.head_angle)
                 bullet = Bullet(start_position.x, start_position.y, self.head_angle)
                 self._reset_reload_counter()
                 return bullet
@@ -118,9 +132,8 @@ class StarShip(GraphicObject, IStarShip):
 
     def collision_handler(self, collision_info, world):
         # Retrieve the type of the other object that collided
-        objects_list = world.get_objects_list()
-        other_object = objects_list[collision_info.second_collider_object_id]
-        if isinstance(other_object, Bullet):
+        other_object = world.get_object(collision_info.second_collider_object_id)
+        if other_object is None or isinstance(other_object, Bullet):
             return  # Don't collide with own bullets
         
         # Handle asteroid collision - for now, just change color to indicate hit
@@ -148,7 +161,7 @@ class Bullet(GraphicObject, IBullet):
     def __init__(self, x, y, angle_of_direction, speed=150, vertexes_local=None):
         # Allow custom vertexes or use defaults for backward compatibility
         if vertexes_local is None:
-            object_vertexes = (Vector2D(-3, 0), Vector2D(3, 0))
+            object_vertexes = BULLET_VERTEXES
         else:
             object_vertexes = vertexes_local
             
@@ -157,10 +170,10 @@ class Bullet(GraphicObject, IBullet):
         self.speed = speed
 
     def collision_handler(self, collision_info, world):
-        object_list = world.get_objects_list()
-        other_object = object_list[collision_info.second_collider_object_id]
+        # The other object may be already despawned by another collision of the same tick
+        other_object = world.get_object(collision_info.second_collider_object_id)
         if isinstance(other_object, Asteroid):
-            del object_list[collision_info.second_collider_object_id]
+            world.despawn_object(collision_info.second_collider_object_id)
 
 # -----------------------------------------------------------------
 
@@ -168,7 +181,7 @@ class Asteroid(GraphicObject, IAsteroid):
     def __init__(self, x, y, angle_of_direction, speed, vertexes_local=None):
         # Allow custom vertexes or use defaults for backward compatibility
         if vertexes_local is None:
-            object_vertexes = (Vector2D(10, 10), Vector2D(-10, 10), Vector2D(-10, -10), Vector2D(10, -10))  # A rectangle
+            object_vertexes = ASTEROID_VERTEXES
         else:
             object_vertexes = vertexes_local
             
@@ -0,0 +1,93 @@
+from array import array
+from collections import deque
+
+__all__ = ['HandleAllocator', 'make_handle', 'handle_index', 'handle_generation',
+           'INDEX_BITS', 'GENERATION_BITS', 'INDEX_MASK']
+
+# A handle is a single int: (generation << INDEX_BITS) | index.
+# 20 + 12 bits fit the uint32 object ids of the network snapshots
+INDEX_BITS = 20
+GENERATION_BITS = 12
+INDEX_MASK = (1 << INDEX_BITS) - 1
+GENERATION_MASK = (1 << GENERATION_BITS) - 1
+
+
+def make_handle(index, generation):
+    return (generation << INDEX_BITS) | index
+
+
+def handle_index(handle):
+    """ The slot of a handle, to index the dense arrays of the entities """
+    return handle & INDEX_MASK
+
+
+def handle_generation(handle):
+    return handle >> INDEX_BITS
+
+
+class HandleAllocator(object):
+    """ Give out (index, generation) handles of entity slots, reusing the released slots.
+
+        The index of a handle is its slot in the dense arrays of the entities. Each
+        time a slot is released its generation changes, so a stale handle (e.g. the
+        id of a destroyed object kept by a CollisionInfo) is detected in O(1): the
+        generation of the slot no longer matches.
+
+        The free slots are reused in FIFO order, so a slot goes through all its
+        generations (4095: the generation 0 is never used, so no handle is 0) as late as possible
+    """
+
+    def __init__(self, max_slots=INDEX_MASK + 1):
+        """
+        :param max_slots: the max number of live handles, at most 2 ** INDEX_BITS
+        """
+        if not 0 < max_slots <= INDEX_MASK + 1:
+            raise ValueError("max_slots must be in [1, %d]" % (INDEX_MASK + 1))
+        self._max_slots = max_slots
+        # Per slot: the current generation, and 1 when a handle of the slot is live
+        self._generations = array('H')
+        self._alive = bytearray()
+        self._free = deque()
+        self._live_count = 0
+
+    def __len__(self):
+        """ The number of live handles """
+        return self._live_count
+
+    @property
+    def slot_count(self):
+        """ The number of slots ever used: the size of the dense arrays indexed by slot """
+        return len(self._generations)
+
+    def allocate(self):
+        """ Return a new live handle """
+        if self._free:
+            index = self._free.popleft()
+        else:
+            index = len(self._generations)
+            if index >= self._max_slots:
+                raise OverflowError("No free slot: %d live handles" % self._live_count)
+            self._generations.append(1)
+            self._alive.append(0)
+        self._alive[index] = 1
+        self._live_count += 1
+        return (self._generations[index] << INDEX_BITS) | index
+
+    def release(self, handle):
+        """ Free the slot of a live handle. Releasing a stale handle does nothing
+        :return: True if the handle was live
+        """
+        if not self.is_alive(handle):
+            return False
+        index = handle & INDEX_MASK
+        generation = self._generations[index] + 1
+        self._generations[index] = generation if generation <= GENERATION_MASK else 1
+        self._alive[index] = 0
+        self._free.append(index)
+        self._live_count -= 1
+        return True
+
+    def is_alive(self, handle):
+        index = handle & INDEX_MASK
+        return (index < len(self._generations) and self._alive[index] == 1
+                and self._generations[index] == handle >> INDEX_BITS)
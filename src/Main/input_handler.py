@@ -1,31 +1,70 @@
+import time
+
 import pygame.locals
 from Infrastructure.interfaces.interfaces import IInputHandler
+from inputcommands import InputCommand, SPSCQueue, CommandInputHandler
+
+# The actions of the held-key state of EventInputHandler, one bit each
+ROTATE_LEFT = 1
+ROTATE_RIGHT = 2
+FIRE = 4
 
 
 class KeyboardInputHandler(IInputHandler):
-    """Handles keyboard input using dependency injection pattern"""
+    """Handles keyboard input using dependency injection pattern.
     
-    def __init__(self, world):
-        """Initialize with world dependency"""
+    The keyboard is sampled into InputCommand pushed on a single-producer /
+    single-consumer queue, and the commands are applied to the world by a
+    CommandInputHandler. handle_input() does both, on the same thread; the
+    pipelined mode calls sample_input() on the window thread and gives the
+    command handler to the simulation thread.
+    """
+    
+    def __init__(self, world, clock=time.perf_counter, profile_key=None):
+        """Initialize with world dependency.
+        
+        The profile key is the controls.profile binding, K_p by default.
+        """
         self._world = world
+        self._clock = clock
+        self._profile_key = pygame.locals.K_p if profile_key is None else profile_key
         self._exit_requested = False
+        self._profile_requested = False
+        self._profile_key_down = False
+        self.commands = SPSCQueue()
+        self._command_handler = CommandInputHandler(world, self.commands, clock=clock)
     
     def handle_input(self):
         """Process keyboard input and update world state"""
+        self.sample_input()
+        self._command_handler.handle_input()
+    
+    def get_command_handler(self):
+        """The handler applying the sampled commands to the world"""
+        return self._command_handler
+    
+    def sample_input(self):
+        """Read the keyboard and queue the command of the pressed keys"""
         keys_pressed = pygame.key.get_pressed()
         
         # Ship rotation
+        rotation = 0
         if keys_pressed[pygame.locals.K_a]:
-            self._world.starship.rotate_object(-10)
+            rotation -= 10
         
         if keys_pressed[pygame.locals.K_d]:
-            self._world.starship.rotate_object(10)
+            rotation += 10
         
         # Fire bullets
-        if keys_pressed[pygame.locals.K_SPACE]:
-            new_bullet = self._world.starship.fire()
-            if new_bullet is not None:
-                self._world.add_object(new_bullet)
+        fire = bool(keys_pressed[pygame.locals.K_SPACE])
+        if rotation or fire:
+            self.commands.push(InputCommand(self._clock(), rotation, fire))
+        
+        # Profile capture, once per key press
+        profile_key_down = keys_pressed[self._profile_key]
+        if profile_key_down and not self._profile_key_down:
+            self._profile_requested = True
+        self._profile_key_down = profile_key_down
         
         # Exit game
         if keys_pressed[pygame.locals.K_q] or keys_pressed[pygame.locals.K_ESCAPE]:
@@ -33,4 +72,79 @@ class KeyboardInputHandler(IInputHandler):
     
     def is_exit_requested(self) -> bool:
         """Check if exit was requested"""
-        return self._exit_requested
\ No newline at end of file
+        return self._exit_requested
+    
+    def is_profile_requested(self) -> bool:
+        """Check if a profile capture was requested since the last call"""
+        requested = self._profile_requested
+        self._profile_requested = False
+        return requested
+
+
+class EventInputHandler(KeyboardInputHandler):
+    """Handles keyboard input from the KEYDOWN/KEYUP events instead of polling.
+    
+    The events got by the engine (handle_events) update a bitmap of the held
+    actions, and sample_input() emits the command of the held actions once per
+    tick, as the polling handler. The repeated KEYDOWN of pygame.key.set_repeat
+    are ignored, so the key repeat is not needed. A key pressed and released
+    between two ticks still gives its action once, where polling misses it.
+    The command of a new press is stamped with the time its KEYDOWN was
+    received, so its latency covers the wait for the next tick.
+    """
+    
+    def __init__(self, world, clock=time.perf_counter, profile_key=None):
+        """Initialize with world dependency"""
+        super().__init__(world, clock, profile_key)
+        self._key_actions = {pygame.locals.K_a: ROTATE_LEFT,
+                             pygame.locals.K_d: ROTATE_RIGHT,
+                             pygame.locals.K_SPACE: FIRE}
+        self._exit_keys = (pygame.locals.K_q, pygame.locals.K_ESCAPE)
+        # The actions of the keys held down, and of the keys pressed since the last sample
+        self.held_actions = 0
+        self._pressed_actions = 0
+        # When the first press not sampled yet was received, or None
+        self._press_time = None
+    
+    def handle_events(self, events):
+        """Update the held actions from the keyboard events"""
+        for event in events:
+            if event.type == pygame.locals.KEYDOWN:
+                key = event.key
+                action = self._key_actions.get(key, 0)
+                if action:
+                    # A repeated KEYDOWN of a held key is not a new press
+                    if not self.held_actions & action:
+                        self.held_actions |= action
+                        self._pressed_actions |= action
+                        if self._press_time is None:
+                            self._press_time = self._clock()
+                elif key == self._profile_key:
+                    if not self._profile_key_down:
+                        self._profile_requested = True
+                    self._profile_key_down = True
+                elif key in self._exit_keys:
+                    self._exit_requested = True
+            elif event.type == pygame.locals.KEYUP:
+                key = event.key
+                self.held_actions &= ~self._key_actions.get(key, 0)
+                if key == self._profile_key:
+                    self._profile_key_down = False
+            elif event.type == pygame.locals.QUIT:
+                self._exit_requested = True
+    
+    def sample_input(self):
+        """Queue the command of the actions held, or pressed since the last sample"""
+        actions = self.held_actions | self._pressed_actions
+        self._pressed_actions = 0
+        press_time = self._press_time
+        self._press_time = None
+        if not actions:
+            return
+        rotation = 0
+        if actions & ROTATE_LEFT:
+            rotation -= 10
+        if actions & ROTATE_RIGHT:
+            rotation += 10
+        timestamp = press_time if press_time is not None else self._clock()
+        self.commands.push(InputCommand(timestamp, rotation, bool(actions & FIRE)))
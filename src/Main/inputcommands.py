@@ -0,0 +1,171 @@
+import time
+
+from Infrastructure.interfaces.interfaces import IInputHandler
+from metrics import REGISTRY
+
+__all__ = ['InputCommand', 'SPSCQueue', 'CommandInputHandler', 'ReplayInputHandler', 'apply_command']
+
+_COMMANDS_DROPPED = REGISTRY.counter('input_commands_dropped_total', 'Input commands dropped because the queue was full')
+_COMMANDS_APPLIED = REGISTRY.counter('input_commands_applied_total', 'Input commands applied to the world')
+_INPUT_TO_ACTION_SECONDS = REGISTRY.counter('input_to_action_seconds_total',
+                                            'Sum of the seconds from the input to the application of its command')
+_LAST_INPUT_TO_ACTION = REGISTRY.gauge('input_to_action_last_seconds',
+                                       'Seconds from the input to the application of the last command')
+
+
+class InputCommand(object):
+    """ The input of the player sampled once: a rotation of the starship and/or a shot """
+
+    __slots__ = ('timestamp', 'rotation', 'fire', 'tick', 'latency')
+
+    def __init__(self, timestamp, rotation=0, fire=False):
+        """
+        :param timestamp: the clock seconds when the input was sampled, or received for the events
+        :param rotation: the relative rotation of the starship in degrees
+        :param fire: True to fire a bullet
+        """
+        self.timestamp = timestamp
+        self.rotation = rotation
+        self.fire = fire
+        # The world tick the command was applied before, set by the CommandInputHandler
+        self.tick = None
+        # The seconds from timestamp to the application, set by the CommandInputHandler
+        self.latency = None
+
+
+# -----------------------------------------------------------------------
+class SPSCQueue(object):
+    """ A bounded single-producer / single-consumer ring buffer, without locks.
+
+        The producer only writes _tail and the consumer only writes _head, so
+        the two threads never write the same field: a slot is filled before
+        _tail moves past it, and emptied before _head does. When the queue is
+        full, push() drops the item instead of waiting for the consumer.
+    """
+
+    def __init__(self, capacity=256):
+        """
+        :param capacity: the max number of items waiting in the queue
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._capacity = capacity
+        self._slots = [None] * capacity
+        # The count of items pushed (written by the producer) and popped (written by the consumer)
+        self._tail = 0
+        self._head = 0
+
+    def __len__(self):
+        return self._tail - self._head
+
+    def push(self, item):
+        """ Producer side: add an item
+        :return: False when the queue is full and the item was dropped
+        """
+        tail = self._tail
+        if tail - self._head >= self._capacity:
+            _COMMANDS_DROPPED.value += 1
+            return False
+        self._slots[tail % self._capacity] = item
+        self._tail = tail + 1
+        return True
+
+    def drain(self):
+        """ Consumer side: remove and return the items pushed so far, oldest first """
+        head = self._head
+        tail = self._tail
+        slots = self._slots
+        capacity = self._capacity
+        items = []
+        while head < tail:
+            index = head % capacity
+            items.append(slots[index])
+            slots[index] = None
+            head += 1
+        self._head = head
+        return items
+
+
+# -----------------------------------------------------------------------
+class CommandInputHandler(IInputHandler):
+    """ Apply the queued InputCommand to the world starship at the start of each tick.
+
+        It is the consumer of the queue, on the thread owning the World, so the
+        devices can be sampled on another thread (e.g. the window thread of the
+        pipelined mode, or the network on a server). Each applied command gets
+        the world tick and its input-to-action latency, and is appended to
+        history when given: the exact input of each tick, for a ReplayInputHandler.
+    """
+
+    def __init__(self, world, commands, history=None, clock=time.perf_counter):
+        """
+        :param world: the world containing the starship
+        :param commands: the SPSCQueue of the InputCommand
+        :param history: the list receiving the applied commands, or None
+        :param clock: the clock of the command timestamps
+        """
+        self._world = world
+        self._commands = commands
+        self.history = history
+        self._clock = clock
+        # The InputLatencyTracker following the applied commands up to the screen, or None
+        self.input_latency = None
+
+    def handle_input(self):
+        commands = self._commands.drain()
+        if not commands:
+            return
+        tick = self._world.tick
+        now = self._clock()
+        latencies = 0
+        for command in commands:
+            command.tick = tick
+            command.latency = now - command.timestamp
+            latencies += command.latency
+            apply_command(self._world, command)
+        _COMMANDS_APPLIED.value += len(commands)
+        _INPUT_TO_ACTION_SECONDS.value += latencies
+        _LAST_INPUT_TO_ACTION.value = commands[-1].latency
+        if self.history is not None:
+            self.history.extend(commands)
+        if self.input_latency is not None:
+            self.input_latency.commands_applied(commands)
+
+    def is_exit_requested(self) -> bool:
+        return False
+
+
+def apply_command(world, command):
+    """ Rotate the world starship and fire, as the command says """
+    starship = world.starship
+    if command.rotation:
+        starship.rotate_object(command.rotation)
+    if command.fire:
+        new_bullet = starship.fire()
+        if new_bullet is not None:
+            world.add_object(new_bullet)
+
+
+# -----------------------------------------------------------------------
+class ReplayInputHandler(IInputHandler):
+    """ Apply recorded commands (the history of a CommandInputHandler) at the ticks they were applied """
+
+    def __init__(self, world, history):
+        """
+        :param world: the world to drive, started in the same state as the recorded one
+        :param history: the applied InputCommand, in tick order
+        """
+        self._world = world
+        self._history = history
+        self._next = 0
+
+    def handle_input(self):
+        tick = self._world.tick
+        history = self._history
+        while self._next < len(history) and history[self._next].tick <= tick:
+            apply_command(self._world, history[self._next])
+            self._next += 1
+
+    def is_exit_requested(self) -> bool:
+        """ The replay ends after the last recorded command """
+        return self._next >= len(self._history)
@@ -0,0 +1,59 @@
+from spatial import SpatialHashGrid
+
+__all__ = ['InterestManager']
+
+
+class InterestManager(object):
+    """ Select, for each network client, the objects near its starship.
+
+        The objects are indexed once per tick in a spatial grid; the interest set of
+        a client is then a range query around its starship, so the cost of building
+        (and encoding) a client update depends on the density around the client and
+        not on the size of the world.
+
+        Usage, once per server tick:
+            interest_manager.update()
+            for client_id in clients:
+                ids = interest_manager.get_interest_set(client_id)
+                payload = snapshot_encoder.encode_for_client(client_id, ids)
+    """
+
+    def __init__(self, world, radius, cell_size=64):
+        """
+        :param world: the world containing the objects
+        :param radius: the distance from the client starship within which the objects are sent
+        :param cell_size: the size of a cell of the spatial grid
+        """
+        self._world = world
+        self._radius = radius
+        self._grid = SpatialHashGrid(cell_size)
+        self._starships = {}
+
+    @property
+    def radius(self):
+        return self._radius
+
+    @property
+    def grid(self):
+        return self._grid
+
+    def register_client(self, client_id, starship):
+        """ Associate a client to the starship it is piloting """
+        self._starships[client_id] = starship
+
+    def unregister_client(self, client_id):
+        self._starships.pop(client_id, None)
+
+    def update(self):
+        """ Index the current position of all the objects. Call it once per tick """
+        self._grid.rebuild(self._world.get_objects_list())
+
+    def get_interest_set(self, client_id):
+        """ Return the ids of the objects the client must receive.
+            The client starship is always included """
+        starship = self._starships[client_id]
+        position = starship.position
+        object_ids = self._grid.query_range(position.x, position.y, self._radius)
+        if starship.id not in object_ids:
+            object_ids.append(starship.id)
+        return object_ids
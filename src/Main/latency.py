@@ -0,0 +1,96 @@
+import collections
+import time
+
+from soak import percentile
+from metrics import REGISTRY
+
+__all__ = ['InputLatencyTracker']
+
+_INPUTS_PRESENTED = REGISTRY.counter('input_to_photon_inputs_total', 'Input commands whose effect was presented')
+_INPUT_TO_PHOTON_SECONDS = REGISTRY.counter('input_to_photon_seconds_total',
+                                            'Sum of the seconds from the inputs to the presentation of their effect')
+_LAST_INPUT_TO_PHOTON = REGISTRY.gauge('input_to_photon_last_seconds',
+                                       'Seconds from the last presented input to the presentation of its effect')
+
+
+class InputLatencyTracker(object):
+    """ Measure the input-to-photon latency: from when an input entered the engine
+        to when the first frame showing its effect was presented.
+
+        Each input is an InputCommand, stamped when the input was sampled (or its
+        KEYDOWN received) and tagged by the CommandInputHandler with the world
+        tick that consumed it, which calls commands_applied() on the thread owning
+        the World. The engine calls frame_presented() on the window thread after
+        the display update, with World.tick after the update it drew: the commands
+        consumed by a lower tick are on screen.
+
+        The latencies are kept split in two stages, input-to-action (the wait for
+        the tick) and input-to-photon, for the last max_samples inputs.
+    """
+
+    def __init__(self, max_samples=100000, clock=time.perf_counter):
+        """
+        :param max_samples: the number of the latest inputs kept for the distribution
+        :param clock: the clock of the command timestamps
+        """
+        self.clock = clock
+        # (input-to-action seconds, input-to-photon seconds) of the presented inputs
+        self.samples = collections.deque(maxlen=max_samples)
+        # The commands applied, not drained by the window thread yet: deque append
+        # and popleft are atomic, so the two threads need no lock
+        self._applied = collections.deque()
+        # The drained commands whose tick is not on screen yet, in tick order
+        self._waiting = []
+
+    def commands_applied(self, commands):
+        """ World thread: record the commands consumed by a tick """
+        self._applied.extend(commands)
+
+    def frame_presented(self, tick, presented_time=None):
+        """ Window thread: record the presentation of a frame
+        :param tick: the World.tick after the update shown by the frame
+        :param presented_time: the clock time of the presentation, default now
+        :return: the number of inputs whose effect the frame showed first
+        """
+        applied = self._applied
+        waiting = self._waiting
+        while applied:
+            waiting.append(applied.popleft())
+        shown = 0
+        while shown < len(waiting) and waiting[shown].tick < tick:
+            shown += 1
+        if not shown:
+            return 0
+        if presented_time is None:
+            presented_time = self.clock()
+        total = 0.0
+        for command in waiting[:shown]:
+            latency = presented_time - command.timestamp
+            self.samples.append((command.latency, latency))
+            total += latency
+        del waiting[:shown]
+        _INPUTS_PRESENTED.value += shown
+        _INPUT_TO_PHOTON_SECONDS.value += total
+        _LAST_INPUT_TO_PHOTON.value = latency
+        return shown
+
+    def get_percentiles(self, fractions=(0.5, 0.95, 0.99, 1.0)):
+        """ Return ([input-to-action seconds], [input-to-photon seconds]) at the fractions """
+        action = sorted(sample[0] for sample in self.samples)
+        photon = sorted(sample[1] for sample in self.samples)
+        return [percentile(action, fraction) for fraction in fractions], \
+               [percentile(photon, fraction) for fraction in fractions]
+
+    def reset(self):
+        self.samples.clear()
+
+    def format(self):
+        """ Return the latency distribution as text """
+        if not self.samples:
+            return "No input presented"
+        action, photon = self.get_percentiles()
+        lines = ["%-16s %8s %8s %8s %8s %8s" % ('', 'inputs', 'p50 ms', 'p95 ms', 'p99 ms', 'max ms')]
+        for name, values in (('input to action', action), ('input to photon', photon)):
+            lines.append("%-16s %8d %8.1f %8.1f %8.1f %8.1f" % (
+                name, len(self.samples), values[0] * 1000, values[1] * 1000, values[2] * 1000, values[3] * 1000))
+        return "\n".join(lines)
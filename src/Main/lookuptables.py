@@ -7,7 +7,7 @@ sin = {}
 def _initializeLookupTables():
     # We compute the lookup table for positive angles and negative angles
     # to have an easier rotation algorithm
-    for i in range(-359, 359):
+    for i in range(-359, 360):
         #  Convert in radiant
         angle_radiant = angles.from_degree_to_radiant(i)
         cos[i] = math.cos(angle_radiant)
@@ -0,0 +1,160 @@
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+__all__ = ['Counter', 'Gauge', 'MetricsRegistry', 'MetricsServer', 'REGISTRY']
+
+
+class Counter(object):
+    """ A value that only grows, e.g. the number of collision tests since the start.
+
+        The increment is a plain attribute update, cheap enough for the hot paths:
+            COLLISION_PAIR_TESTS.value += tests
+        In the loops, count in a local variable and add it once at the end.
+    """
+
+    __slots__ = ('name', 'description', 'labels', 'value')
+
+    metric_type = 'counter'
+
+    def __init__(self, name, description, labels=None):
+        self.name = name
+        self.description = description
+        self.labels = labels or {}
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+
+class Gauge(Counter):
+    """ A value that goes up and down, e.g. the number of objects in the world """
+
+    __slots__ = ()
+
+    metric_type = 'gauge'
+
+    def set(self, value):
+        self.value = value
+
+
+# -----------------------------------------------------------------------
+class MetricsRegistry(object):
+    """ The named metrics of the process """
+
+    def __init__(self):
+        # (name, sorted labels) -> metric, in creation order
+        self._metrics = {}
+
+    def counter(self, name, description, labels=None):
+        """ Return the counter with the name and labels, created if needed """
+        return self._get_or_create(Counter, name, description, labels)
+
+    def gauge(self, name, description, labels=None):
+        """ Return the gauge with the name and labels, created if needed """
+        return self._get_or_create(Gauge, name, description, labels)
+
+    def get_values(self):
+        """ Return a dictionary (name, sorted labels tuple) -> current value """
+        return {key: metric.value for key, metric in self._metrics.items()}
+
+    def reset(self):
+        """ Set all the values to zero, e.g. between two benchmark runs """
+        for metric in self._metrics.values():
+            metric.value = 0
+
+    def render_prometheus(self):
+        """ Return the metrics in the Prometheus text exposition format """
+        lines = []
+        described = set()
+        for metric in sorted(self._metrics.values(), key=lambda metric: metric.name):
+            if metric.name not in described:
+                described.add(metric.name)
+                lines.append('# HELP %s %s' % (metric.name, metric.description))
+                lines.append('# TYPE %s %s' % (metric.name, metric.metric_type))
+            if metric.labels:
+                labels = ','.join('%s="%s"' % (key, value) for key, value in sorted(metric.labels.items()))
+                lines.append('%s{%s} %s' % (metric.name, labels, metric.value))
+            else:
+                lines.append('%s %s' % (metric.name, metric.value))
+        return '\n'.join(lines) + '\n'
+
+    def _get_or_create(self, metric_class, name, description, labels):
+        key = (name, tuple(sorted((labels or {}).items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            metric = metric_class(name, description, labels)
+            self._metrics[key] = metric
+        elif metric.metric_type != metric_class.metric_type:
+            raise ValueError("Metric %s is already registered as a %s" % (name, metric.metric_type))
+        return metric
+
+
+def _get_shared_registry():
+    # The game modules import this module as 'metrics' and the factories as 'Main.metrics':
+    # the second import must find the registry of the first one
+    for module_name in ('metrics', 'Main.metrics'):
+        module = sys.modules.get(module_name)
+        if module is not None and hasattr(module, 'REGISTRY'):
+            return module.REGISTRY
+    return MetricsRegistry()
+
+
+# The registry of the process
+REGISTRY = _get_shared_registry()
+
+
+# -----------------------------------------------------------------------
+class MetricsServer(object):
+    """ Serve the registry on http://host:port/metrics in the Prometheus text
+        format, from a background (daemon) thread
+    """
+
+    def __init__(self, registry=None, host='127.0.0.1', port=9108):
+        """
+        :param registry: the MetricsRegistry to serve. Default the process one
+        :param host: the address to listen on. Default localhost only
+        :param port: the port to listen on; 0 chooses a free port
+        """
+        self._registry = registry if registry is not None else REGISTRY
+        self._host = host
+        self._port = port
+        self._server = None
+        self._thread = None
+
+    @property
+    def address(self):
+        """ The (host, port) the server listens on, once started """
+        return self._server.server_address if self._server is not None else None
+
+    def start(self):
+        registry = self._registry
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # A scrape every few seconds must not fill the console
+                pass
+
+        self._server = ThreadingHTTPServer((self._host, self._port), MetricsHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name='metrics-server', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
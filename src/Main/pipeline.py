@@ -0,0 +1,174 @@
+import threading
+import time
+
+from rendercommands import RenderCommandBuffer
+from tracing import NULL_TRACER
+from metrics import REGISTRY
+
+__all__ = ['FrameSnapshot', 'TripleBuffer', 'SimulationLoop']
+
+_FRAMES_PUBLISHED = REGISTRY.counter('pipeline_frames_published_total', 'Frames published by the simulation thread')
+_FRAMES_DROPPED = REGISTRY.counter('pipeline_frames_dropped_total',
+                                   'Published frames replaced by a newer one before being rendered')
+
+
+class FrameSnapshot(object):
+    """ What the render thread needs of a tick: the outlines and the label values """
+
+    def __init__(self):
+        self.commands = RenderCommandBuffer()
+        # World.tick after the update of the snapshot
+        self.tick = 0
+        self.object_count = 0
+
+
+# -----------------------------------------------------------------------
+class TripleBuffer(object):
+    """ Hand frames from a producer thread to a consumer thread, without copies.
+
+        Each of the three buffers is owned by one side at a time:
+            - the one being written by the producer (begin_write, publish)
+            - the latest published one
+            - the one being read by the consumer (acquire_latest)
+        The producer never waits the consumer: when it publishes before the
+        consumer took the previous frame, that frame is dropped and its buffer
+        written again. The consumer always gets the newest frame.
+    """
+
+    def __init__(self, factory=FrameSnapshot):
+        """
+        :param factory: the function creating each of the three buffers
+        """
+        self._buffers = [factory(), factory(), factory()]
+        self._condition = threading.Condition()
+        self._write_index = 0
+        self._latest_index = 1
+        self._read_index = 2
+        self._fresh = False
+
+    def begin_write(self):
+        """ Return the buffer owned by the producer. It stays its own until publish() """
+        return self._buffers[self._write_index]
+
+    def publish(self):
+        """ Make the written buffer the latest one; the producer gets a free buffer """
+        with self._condition:
+            if self._fresh:
+                _FRAMES_DROPPED.value += 1
+            self._write_index, self._latest_index = self._latest_index, self._write_index
+            self._fresh = True
+            _FRAMES_PUBLISHED.value += 1
+            self._condition.notify()
+
+    def acquire_latest(self, timeout=None):
+        """ Take the latest published buffer, giving back the one read before
+        :param timeout: the seconds to wait for a new frame. None waits forever
+        :return: the buffer, owned by the consumer until the next call, or None when no new frame came
+        """
+        with self._condition:
+            if not self._fresh and not self._condition.wait_for(lambda: self._fresh, timeout):
+                return None
+            self._read_index, self._latest_index = self._latest_index, self._read_index
+            self._fresh = False
+            return self._buffers[self._read_index]
+
+
+# -----------------------------------------------------------------------
+class SimulationLoop(object):
+    """ Run the input handling and the world update on their own thread, at a fixed rate,
+        publishing a FrameSnapshot of each tick in a TripleBuffer.
+
+        The World is owned by the simulation thread: the input handler (e.g. the
+        CommandInputHandler applying the commands queued by the keyboard) and
+        World.process run there, and the render thread only reads the published
+        snapshots.
+    """
+
+    def __init__(self, world, input_handler, fps, tracer=NULL_TRACER, clock=time.perf_counter, sleep=time.sleep,
+                 gc_control=None):
+        """
+        :param world: the World, updated only by the simulation thread
+        :param input_handler: the IInputHandler called before each tick
+        :param fps: the ticks per second
+        :param tracer: the FrameTracer recording the phases of each tick
+        :param clock: the function returning the current time in seconds
+        :param sleep: the function waiting a number of seconds
+        :param gc_control: the GarbageCollectorControl running its collections in the wait
+                           between two ticks, or None
+        """
+        self.world = world
+        self._input_handler = input_handler
+        self._tick_seconds = 1 / fps
+        self.tracer = tracer
+        self._clock = clock
+        self._sleep = sleep
+        self._gc_control = gc_control
+        self.frames = TripleBuffer()
+        self.ticks = 0
+        self.exit_requested = False
+        # The exception that stopped the simulation thread, raised again by stop()
+        self.error = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._last_tick = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='simulation', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """ Stop the simulation thread and wait for it """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def run_tick(self):
+        """ Handle the input, update the world and publish its snapshot """
+        tracer = self.tracer
+        now = self._clock()
+        delta_time = self._tick_seconds if self._last_tick is None else now - self._last_tick
+        self._last_tick = now
+        with tracer.span('tick'):
+            with tracer.span('input'):
+                self._input_handler.handle_input()
+                if self._input_handler.is_exit_requested():
+                    self.exit_requested = True
+            with tracer.span('update'):
+                self.world.process(delta_time)
+            with tracer.span('write_commands'):
+                snapshot = self.frames.begin_write()
+                self.world.write_render_commands(snapshot.commands)
+                self.ticks += 1
+                snapshot.tick = self.world.tick
+                snapshot.object_count = len(self.world.get_objects_list())
+                self.frames.publish()
+
+    def _run(self):
+        clock = self._clock
+        next_tick = clock()
+        try:
+            while not self._stop.is_set() and not self.exit_requested:
+                self.run_tick()
+                # Fixed rate: the next tick is due one period after this one was
+                next_tick += self._tick_seconds
+                wait = next_tick - clock()
+                if wait > 0 and self._gc_control is not None:
+                    # The wait is the idle time of the collector
+                    with self.tracer.span('gc_idle'):
+                        self._gc_control.run_idle(wait)
+                    wait = next_tick - clock()
+                if wait > 0:
+                    self._sleep(wait)
+                else:
+                    next_tick = clock()
+        except BaseException as error:
+            self.error = error
+            self.exit_requested = True
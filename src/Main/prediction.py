@@ -0,0 +1,225 @@
+from collections import deque
+from geometrytransformation2d import Vector2D
+from snapshot import SnapshotDecoder, EntityState, POSITION_SCALE
+
+__all__ = ['PlayerInput', 'ClientPrediction', 'SnapshotInterpolator', 'NetworkClient']
+
+
+class PlayerInput(object):
+    """ The input of the local player for a single tick """
+
+    __slots__ = ('tick', 'rotation', 'fire', 'reload_counter', 'predicted_state')
+
+    def __init__(self, tick, rotation, fire):
+        self.tick = tick
+        self.rotation = rotation
+        self.fire = fire
+        # The starship reload counter before the input was applied
+        self.reload_counter = 0
+        # The predicted (x, y, rotation angle, head angle) after the input was applied
+        self.predicted_state = None
+
+
+# -----------------------------------------------------------------------
+class ClientPrediction(object):
+    """ Apply the local player input immediately to the local copy of the starship,
+        without waiting the server round trip.
+
+        The inputs not yet acknowledged by the server are kept. When an authoritative
+        snapshot arrives, the starship is reset to the server state and the pending
+        inputs are simulated again. When the prediction was right (the common case)
+        the re-simulation is skipped.
+    """
+
+    def __init__(self, starship, tick_seconds, position_scale=POSITION_SCALE):
+        """
+        :param starship: the local starship
+        :param tick_seconds: the duration of a simulation tick, in seconds
+        :param position_scale: the quantization steps per pixel of the snapshots
+        """
+        self._starship = starship
+        self._tick_seconds = tick_seconds
+        # Predictions closer than half a quantization step to the server state are right
+        self._tolerance = 0.5 / position_scale
+        self._pending = deque()
+        self.replayed_ticks = 0
+
+    @property
+    def starship(self):
+        return self._starship
+
+    @property
+    def pending_inputs(self):
+        return len(self._pending)
+
+    def apply_input(self, tick, rotation, fire):
+        """ Apply the local input of a tick and simulate the starship for that tick
+        :param tick: the simulation tick of the input
+        :param rotation: the relative rotation angle in degree
+        :param fire: True if the player is firing
+        :return: the predicted bullet, or None
+        """
+        player_input = PlayerInput(tick, rotation, fire)
+        player_input.reload_counter = self._starship.reload_counter
+        bullet = self._simulate(player_input)
+        self._pending.append(player_input)
+        return bullet
+
+    def reconcile(self, acked_tick, server_state):
+        """ Correct the prediction with the authoritative state of the starship
+        :param acked_tick: the tick of the server snapshot
+        :param server_state: the EntityState of the local starship in that snapshot
+        """
+        pending = self._pending
+        acked_input = None
+        while pending and pending[0].tick <= acked_tick:
+            acked_input = pending.popleft()
+
+        if acked_input is not None and self._is_predicted(acked_input.predicted_state, server_state):
+            return
+
+        starship = self._starship
+        starship.position = Vector2D(server_state.x, server_state.y)
+        starship.rotation_angle = server_state.rotation_angle
+        starship.head_angle = server_state.head_angle
+        if pending:
+            starship.reload_counter = pending[0].reload_counter
+        for player_input in pending:
+            self._simulate(player_input)
+        self.replayed_ticks += len(pending)
+
+    def _simulate(self, player_input):
+        starship = self._starship
+        if player_input.rotation:
+            starship.rotate_object(player_input.rotation)
+        bullet = starship.fire() if player_input.fire else None
+        starship.process(self._tick_seconds)
+        position = starship.position
+        player_input.predicted_state = (position.x, position.y,
+                                        starship.rotation_angle, starship.head_angle)
+        return bullet
+
+    def _is_predicted(self, predicted_state, server_state):
+        x, y, rotation_angle, head_angle = predicted_state
+        return (abs(x - server_state.x) <= self._tolerance
+                and abs(y - server_state.y) <= self._tolerance
+                and rotation_angle == server_state.rotation_angle
+                and head_angle == server_state.head_angle)
+
+
+# -----------------------------------------------------------------------
+def _interpolate_angle(from_angle, to_angle, alpha):
+    # Along the shortest arc, so that 350 -> 10 passes through 0 and not through 180
+    delta = (to_angle - from_angle + 180) % 360 - 180
+    return int(round(from_angle + delta * alpha)) % 360
+
+
+class SnapshotInterpolator(object):
+    """ Smooth the movement of the remote entities interpolating between the
+        last received snapshots. The entities are shown with a small delay, so
+        that there are (almost) always two snapshots around the rendered time
+    """
+
+    def __init__(self, delay_ticks=2, history_size=32):
+        """
+        :param delay_ticks: how many ticks in the past the remote entities are shown
+        :param history_size: max number of snapshots kept
+        """
+        self._delay_ticks = delay_ticks
+        # (tick, {object id: EntityState}) sorted by tick
+        self._snapshots = deque(maxlen=history_size)
+
+    def push(self, tick, entities):
+        """ Add the entities decoded from the snapshot of a tick """
+        if self._snapshots and tick <= self._snapshots[-1][0]:
+            # Out of order or duplicated snapshot
+            return
+        self._snapshots.append((tick, entities))
+
+    def sample(self, client_tick):
+        """ Return the interpolated entities at the given (fractional) client tick
+        :return: a dictionary object id -> EntityState
+        """
+        snapshots = self._snapshots
+        if not snapshots:
+            return {}
+        render_tick = client_tick - self._delay_ticks
+
+        if render_tick <= snapshots[0][0]:
+            return snapshots[0][1]
+        if render_tick >= snapshots[-1][0]:
+            # No extrapolation: the entities stay in the last known state
+            return snapshots[-1][1]
+
+        # The two snapshots around the rendered tick; the list is short, most recent first
+        for index in range(len(snapshots) - 1, 0, -1):
+            if snapshots[index - 1][0] <= render_tick:
+                from_tick, from_entities = snapshots[index - 1]
+                to_tick, to_entities = snapshots[index]
+                break
+        alpha = (render_tick - from_tick) / (to_tick - from_tick)
+
+        result = {}
+        for object_id, to_state in to_entities.items():
+            from_state = from_entities.get(object_id)
+            if from_state is None:
+                result[object_id] = to_state
+                continue
+            result[object_id] = EntityState(
+                object_id, to_state.kind,
+                from_state.x + (to_state.x - from_state.x) * alpha,
+                from_state.y + (to_state.y - from_state.y) * alpha,
+                _interpolate_angle(from_state.rotation_angle, to_state.rotation_angle, alpha),
+                _interpolate_angle(from_state.head_angle, to_state.head_angle, alpha))
+        return result
+
+
+# -----------------------------------------------------------------------
+class NetworkClient(object):
+    """ The client side of a networked game: it decodes the server snapshots,
+        predicts the local starship and interpolates the remote entities.
+
+        Usage, for each client tick:
+            client.apply_input(tick, rotation, fire)
+            for payload in received_payloads:
+                ack = client.receive(payload)   # send ack to the server
+            entities = client.get_entities(tick + frame_fraction)
+    """
+
+    def __init__(self, starship, own_object_id, tick_seconds,
+                 position_scale=POSITION_SCALE, interpolation_delay_ticks=2):
+        """
+        :param starship: the local copy of the starship piloted by the player
+        :param own_object_id: the id of the player starship on the server
+        :param tick_seconds: the duration of a simulation tick, in seconds
+        :param position_scale: the quantization steps per pixel of the snapshots
+        :param interpolation_delay_ticks: the delay of the remote entities
+        """
+        self._own_object_id = own_object_id
+        self._decoder = SnapshotDecoder(position_scale)
+        self._prediction = ClientPrediction(starship, tick_seconds, position_scale)
+        self._interpolator = SnapshotInterpolator(interpolation_delay_ticks)
+
+    @property
+    def prediction(self):
+        return self._prediction
+
+    def apply_input(self, tick, rotation, fire):
+        return self._prediction.apply_input(tick, rotation, fire)
+
+    def receive(self, payload):
+        """ Process a snapshot received from the server
+        :return: the tick to acknowledge to the server
+        """
+        tick = self._decoder.decode(payload)
+        entities = self._decoder.get_entities(tick)
+        own_state = entities.pop(self._own_object_id, None)
+        if own_state is not None:
+            self._prediction.reconcile(tick, own_state)
+        self._interpolator.push(tick, entities)
+        return tick
+
+    def get_entities(self, client_tick):
+        """ Return the remote entities interpolated at the client tick.
+            The local starship is not included: it is the predicted one """
+        return self._interpolator.sample(client_tick)
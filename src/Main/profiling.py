@@ -0,0 +1,102 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import time
+
+__all__ = ['ProfileCapture']
+
+
+class ProfileCapture(object):
+    """ Profile the game with cProfile for a window of N frames only.
+
+        A capture is requested (hot-key, command line or signal) and starts at the
+        next frame; after N frames the profiler is disabled and the statistics are
+        dumped in a .prof file (for snakeviz, pstats, ...) and in a .txt summary
+        of the top functions sorted by cumulative time. With a cost_attribution,
+        the summary also has the cost per object class of the window.
+        Outside the capture window the cost is a single test per frame.
+
+        Usage, around each frame:
+            capture.frame_started()
+            ...
+            capture.frame_finished()
+    """
+
+    def __init__(self, output_dir='profiles', frames=300, top_n=30, clock=time.time):
+        """
+        :param output_dir: the directory of the dumped files. Created if needed
+        :param frames: the default number of frames of a capture
+        :param top_n: the number of functions in the summary
+        :param clock: the function returning the current time, for the file names
+        """
+        self._output_dir = output_dir
+        self._frames = frames
+        self._top_n = top_n
+        self._clock = clock
+        self._profiler = None
+        # Frames still to capture; 0 when no capture is requested or running
+        self._remaining_frames = 0
+        self._captures = 0
+        self.last_dump = None
+        # The CostAttribution reported in the summary, or None
+        self.cost_attribution = None
+        self._attribution_start = None
+
+    @property
+    def is_capturing(self):
+        return self._profiler is not None
+
+    def request(self, frames=None):
+        """ Capture the next frames. Ignored while a capture is running
+        :param frames: the number of frames to capture. Default the one of the constructor
+        """
+        if self._remaining_frames > 0:
+            return
+        self._remaining_frames = frames if frames is not None else self._frames
+
+    def frame_started(self):
+        if self._remaining_frames > 0 and self._profiler is None:
+            logging.info("cProfile capture of %d frames started", self._remaining_frames)
+            if self.cost_attribution is not None:
+                self._attribution_start = self.cost_attribution.snapshot()
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def frame_finished(self):
+        if self._profiler is None:
+            return
+        self._remaining_frames -= 1
+        if self._remaining_frames <= 0:
+            self._profiler.disable()
+            profiler = self._profiler
+            self._profiler = None
+            self.last_dump = self._dump(profiler)
+
+    def close(self):
+        """ Stop and dump a running capture, e.g. when the game exits inside the window """
+        if self._profiler is not None:
+            self._remaining_frames = 1
+            self.frame_finished()
+
+    def _dump(self, profiler):
+        os.makedirs(self._output_dir, exist_ok=True)
+        self._captures += 1
+        timestamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(self._clock()))
+        base_name = os.path.join(self._output_dir, 'frames-%s-%d' % (timestamp, self._captures))
+        profile_path = base_name + '.prof'
+        profiler.dump_stats(profile_path)
+
+        summary = io.StringIO()
+        stats = pstats.Stats(profiler, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self._top_n)
+        summary_path = base_name + '.txt'
+        with open(summary_path, 'w', encoding='utf-8') as summary_file:
+            summary_file.write(summary.getvalue())
+            if self.cost_attribution is not None:
+                summary_file.write("\nCost per object type:\n")
+                summary_file.write(self.cost_attribution.format(self._attribution_start) + "\n")
+
+        logging.info("cProfile capture written to %s and %s", profile_path, summary_path)
+        return profile_path, summary_path
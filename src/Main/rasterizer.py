@@ -0,0 +1,201 @@
+import math
+
+import numpy as np
+
+from rendercommands import RenderCommandBuffer
+
+__all__ = ['ObservationRasterizer']
+
+# Value of a pixel covered by an outline
+OUTLINE_VALUE = 255
+
+
+class ObservationRasterizer(object):
+    """ Draw the outlines of the world objects in small uint8 grids with NumPy,
+        without pygame and without a video driver, for bot training.
+
+        Each world writes its outlines in its own RenderCommandBuffer, and the
+        segments of the outlines of all the worlds are copied from their flat
+        vertex arrays in a single batch, sampled at (at least) one point per grid
+        pixel and written with one scatter operation. All the NumPy buffers are
+        allocated once and reused, and the result is written in the output array
+        given by the caller.
+    """
+
+    def __init__(self, world_size, grid_size=(84, 84), initial_segments=1024):
+        """
+        :param world_size: (width, height) of the worlds in pixels
+        :param grid_size: (width, height) of the output grids
+        :param initial_segments: initial capacity of the segment buffers; it grows if needed
+        """
+        self._grid_width, self._grid_height = grid_size
+        self._scale_x = self._grid_width / world_size[0]
+        self._scale_y = self._grid_height / world_size[1]
+        # Same mapping of Display._to_display_coordinate, scaled to the grid
+        self._offset_x = world_size[0] / 2 * self._scale_x
+        self._offset_y = world_size[1] / 2 * self._scale_y
+        # Enough samples for the longest segment that crosses the whole grid
+        self._max_samples = int(math.ceil(math.hypot(self._grid_width, self._grid_height))) + 1
+        self._sample_ratios = {}
+        self._canvas = None
+        # The RenderCommandBuffer of each world, reused from batch to batch
+        self._commands = []
+        # The index of the last vertex and the first vertex of each object of a world
+        self._last_vertexes = np.zeros(0, dtype=np.intp)
+        self._first_vertexes = np.zeros((0, 2))
+        self._allocate_segments(initial_segments)
+
+    @property
+    def grid_size(self):
+        return self._grid_width, self._grid_height
+
+    def render(self, worlds, out):
+        """ Rasterize the worlds
+        :param worlds: a sequence of World
+        :param out: uint8 array (len(worlds), grid height, grid width) that receives the images
+        """
+        while len(self._commands) < len(worlds):
+            self._commands.append(RenderCommandBuffer())
+        count = 0
+        for world_index, world in enumerate(worlds):
+            commands = self._commands[world_index]
+            world.write_render_commands(commands)
+            count = self._append_outlines(commands, world_index, count)
+        self._render(count, out)
+
+    def render_segments(self, coordinates, world_indexes, out):
+        """ Rasterize segments given in world coordinates
+        :param coordinates: flat sequence x0, y0, x1, y1 of each segment
+        :param world_indexes: the index of the output grid of each segment
+        :param out: uint8 array (worlds, grid height, grid width) that receives the images
+        """
+        count = len(world_indexes)
+        self._reserve_segments(count)
+        if count > 0:
+            self._segments[:count].reshape(-1)[:] = coordinates
+            self._world_indexes[:count] = world_indexes
+        self._render(count, out)
+
+    def _render(self, count, out):
+        if out.dtype != np.uint8 or not out.flags.c_contiguous:
+            raise ValueError("The output must be a contiguous uint8 array")
+        canvas = self._get_canvas(out.shape[0])
+        canvas[:] = 0
+        if count > 0:
+            self._draw(count)
+        out.reshape(-1)[:] = canvas[:-1]
+
+    def _append_outlines(self, commands, world_index, count):
+        """ Copy the outlines of a RenderCommandBuffer in the segments from count
+        :return: the segment count after them
+        """
+        vertex_count = commands.vertex_count
+        object_count = commands.object_count
+        if vertex_count == 0:
+            return count
+        self._reserve_segments(count + vertex_count, count)
+        self._reserve_objects(object_count)
+        vertexes = commands.vertexes
+        # A closed outline, as Display.draw_world_vertexes: a segment from each vertex
+        # to the next one of its object, and from the last vertex to the first one.
+        # An outline of two vertexes gives the same segment twice
+        segments = self._segments[count:count + vertex_count]
+        segments[:, 0:2] = vertexes
+        segments[:-1, 2:4] = vertexes[1:]
+        last_vertexes = self._last_vertexes[:object_count]
+        np.subtract(commands.ends, 1, out=last_vertexes)
+        np.take(vertexes, commands.starts, axis=0, out=self._first_vertexes[:object_count])
+        segments[last_vertexes, 2:4] = self._first_vertexes[:object_count]
+        self._world_indexes[count:count + vertex_count] = world_index
+        return count + vertex_count
+
+    def _draw(self, count):
+        segments = self._segments[:count]
+        # World to grid coordinates, in place
+        segments[:, 0::2] *= self._scale_x
+        segments[:, 0::2] += self._offset_x
+        segments[:, 1::2] *= self._scale_y
+        segments[:, 1::2] += self._offset_y
+
+        # The same number of samples for every segment: enough for the longest one
+        lengths = self._lengths[:count]
+        np.subtract(segments[:, 2], segments[:, 0], out=self._delta_x[:count])
+        np.subtract(segments[:, 3], segments[:, 1], out=self._delta_y[:count])
+        np.hypot(self._delta_x[:count], self._delta_y[:count], out=lengths)
+        sample_count = min(self._max_samples, int(math.ceil(lengths.max())) + 2)
+        ratios = self._get_sample_ratios(sample_count)
+
+        xs = self._xs[:count, :sample_count]
+        ys = self._ys[:count, :sample_count]
+        np.multiply(self._delta_x[:count, np.newaxis], ratios, out=xs)
+        np.add(xs, segments[:, 0:1], out=xs)
+        np.multiply(self._delta_y[:count, np.newaxis], ratios, out=ys)
+        np.add(ys, segments[:, 1:2], out=ys)
+        np.floor(xs, out=xs)
+        np.floor(ys, out=ys)
+
+        # Flat index in the canvas; the samples out of the grid go to the last (sink) cell
+        inside = self._inside[:count, :sample_count]
+        outside = self._outside[:count, :sample_count]
+        np.greater_equal(xs, 0, out=inside)
+        np.less(xs, self._grid_width, out=outside)
+        np.logical_and(inside, outside, out=inside)
+        np.greater_equal(ys, 0, out=outside)
+        np.logical_and(inside, outside, out=inside)
+        np.less(ys, self._grid_height, out=outside)
+        np.logical_and(inside, outside, out=inside)
+
+        indexes = self._indexes[:count, :sample_count]
+        np.multiply(ys, self._grid_width, out=ys)
+        np.add(ys, xs, out=ys)
+        np.copyto(indexes, ys, casting='unsafe')
+        np.multiply(self._world_indexes[:count, np.newaxis], self._grid_width * self._grid_height,
+                    out=self._world_offsets[:count, :sample_count])
+        np.add(indexes, self._world_offsets[:count, :sample_count], out=indexes)
+        sink = len(self._canvas) - 1
+        np.logical_not(inside, out=outside)
+        np.copyto(indexes, sink, where=outside)
+
+        self._canvas[indexes] = OUTLINE_VALUE
+
+    def _get_sample_ratios(self, sample_count):
+        ratios = self._sample_ratios.get(sample_count)
+        if ratios is None:
+            ratios = np.linspace(0.0, 1.0, sample_count)
+            self._sample_ratios[sample_count] = ratios
+        return ratios
+
+    def _get_canvas(self, world_count):
+        size = world_count * self._grid_width * self._grid_height + 1
+        if self._canvas is None or len(self._canvas) != size:
+            self._canvas = np.zeros(size, dtype=np.uint8)
+        return self._canvas
+
+    def _reserve_segments(self, capacity, kept=0):
+        """ Grow the segment buffers to capacity, keeping the first kept segments """
+        if capacity > len(self._world_indexes):
+            segments = self._segments[:kept].copy()
+            world_indexes = self._world_indexes[:kept].copy()
+            self._allocate_segments(max(capacity, 2 * len(self._world_indexes)))
+            self._segments[:kept] = segments
+            self._world_indexes[:kept] = world_indexes
+
+    def _reserve_objects(self, capacity):
+        if capacity > len(self._last_vertexes):
+            capacity = max(capacity, 2 * len(self._last_vertexes))
+            self._last_vertexes = np.zeros(capacity, dtype=np.intp)
+            self._first_vertexes = np.zeros((capacity, 2))
+
+    def _allocate_segments(self, capacity):
+        samples = self._max_samples
+        self._segments = np.zeros((capacity, 4))
+        self._world_indexes = np.zeros(capacity, dtype=np.int64)
+        self._lengths = np.zeros(capacity)
+        self._delta_x = np.zeros(capacity)
+        self._delta_y = np.zeros(capacity)
+        self._xs = np.zeros((capacity, samples))
+        self._ys = np.zeros((capacity, samples))
+        self._inside = np.zeros((capacity, samples), dtype=bool)
+        self._outside = np.zeros((capacity, samples), dtype=bool)
+        self._indexes = np.zeros((capacity, samples), dtype=np.int64)
+        self._world_offsets = np.zeros((capacity, samples), dtype=np.int64)
@@ -0,0 +1,144 @@
+import numpy as np
+
+import lookuptables
+
+__all__ = ['RenderCommandBuffer']
+
+# The lookup tables of the rotations, as arrays indexed by integer degrees
+_COS = np.array([lookuptables.cos[angle] for angle in range(360)])
+_SIN = np.array([lookuptables.sin[angle] for angle in range(360)])
+
+
+class RenderCommandBuffer(object):
+    """ The frame to draw, written by World.write_render_commands and read by the displays.
+
+        The outlines of all the objects are in flat arrays, reused from frame to frame:
+            vertexes    (vertex_count, 2) world coordinates of the vertexes of all the outlines
+            starts/ends the range of the vertexes of each object
+            color_ids   the index in colors of the color of each object
+            object_ids  the world id of each object
+        The objects sharing a shape are transformed together with NumPy, so the
+        objects are grouped by shape, not in the world order.
+    """
+
+    def __init__(self, initial_vertexes=4096, initial_objects=1024):
+        """
+        :param initial_vertexes: initial capacity of the vertex array; it grows if needed
+        :param initial_objects: initial capacity of the object arrays; it grows if needed
+        """
+        self.vertex_count = 0
+        self.object_count = 0
+        # The palette: color_ids index it, and it only grows
+        self.colors = []
+        self._color_ids = {}
+        # id(shape) -> (shape, local x array, local y array), for the shapes drawn in the current
+        # frame and in the previous one. The shape is kept so its id is not reused while cached.
+        # The shapes not drawn for a whole frame are dropped by clear(), so the cache does not
+        # grow with the per-instance shapes of the objects removed from the world
+        self._local_shapes = {}
+        self._previous_shapes = {}
+        self._allocate_vertexes(initial_vertexes)
+        self._allocate_objects(initial_objects)
+
+    @property
+    def vertexes(self):
+        return self._vertexes[:self.vertex_count]
+
+    @property
+    def starts(self):
+        return self._starts[:self.object_count]
+
+    @property
+    def ends(self):
+        return self._ends[:self.object_count]
+
+    @property
+    def color_ids(self):
+        return self._color_ids_array[:self.object_count]
+
+    @property
+    def object_ids(self):
+        return self._object_ids[:self.object_count]
+
+    def clear(self):
+        """ Start a new frame, keeping the capacity and the shapes drawn in the last frame """
+        self.vertex_count = 0
+        self.object_count = 0
+        self._previous_shapes = self._local_shapes
+        self._local_shapes = {}
+
+    def get_color_id(self, color):
+        color_id = self._color_ids.get(color)
+        if color_id is None:
+            color_id = len(self.colors)
+            self.colors.append(color)
+            self._color_ids[color] = color_id
+        return color_id
+
+    def add_instances(self, shape, xs, ys, angles, color_ids, object_ids):
+        """ Add the outlines of the objects sharing a shape
+        :param shape: the local vertexes of the shape
+        :param xs: the x of the position of each object
+        :param ys: the y of the position of each object
+        :param angles: the rotation of each object, in integer degrees
+        :param color_ids: the color id of each object (see get_color_id)
+        :param object_ids: the world id of each object
+        """
+        count = len(xs)
+        if count == 0:
+            return
+        local_x, local_y = self._get_local_shape(shape)
+        shape_size = len(local_x)
+        vertex_start = self.vertex_count
+        vertex_end = vertex_start + count * shape_size
+        object_start = self.object_count
+        object_end = object_start + count
+        if vertex_end > len(self._vertexes):
+            self._allocate_vertexes(max(vertex_end, 2 * len(self._vertexes)))
+        if object_end > len(self._starts):
+            self._allocate_objects(max(object_end, 2 * len(self._starts)))
+
+        angles = np.asarray(angles, dtype=np.intp) % 360
+        cos = _COS[angles][:, None]
+        sin = _SIN[angles][:, None]
+        xs = np.asarray(xs, dtype=np.float64)[:, None]
+        ys = np.asarray(ys, dtype=np.float64)[:, None]
+        # Rotation then translation, as geometrytransformation2d.from_local_to_world_coordinates
+        block = self._vertexes[vertex_start:vertex_end].reshape(count, shape_size, 2)
+        block[:, :, 0] = cos * local_x - sin * local_y + xs
+        block[:, :, 1] = sin * local_x + cos * local_y + ys
+
+        starts = self._starts[object_start:object_end]
+        np.multiply(np.arange(count), shape_size, out=starts)
+        starts += vertex_start
+        np.add(starts, shape_size, out=self._ends[object_start:object_end])
+        self._color_ids_array[object_start:object_end] = color_ids
+        self._object_ids[object_start:object_end] = object_ids
+        self.vertex_count = vertex_end
+        self.object_count = object_end
+
+    def _get_local_shape(self, shape):
+        local_shape = self._local_shapes.get(id(shape))
+        if local_shape is None:
+            local_shape = self._previous_shapes.get(id(shape))
+            if local_shape is None:
+                local_shape = (shape,
+                               np.array([vertex.x for vertex in shape], dtype=np.float64),
+                               np.array([vertex.y for vertex in shape], dtype=np.float64))
+            self._local_shapes[id(shape)] = local_shape
+        return local_shape[1], local_shape[2]
+
+    def _allocate_vertexes(self, capacity):
+        vertexes = np.empty((capacity, 2), dtype=np.float64)
+        if self.vertex_count:
+            vertexes[:self.vertex_count] = self._vertexes[:self.vertex_count]
+        self._vertexes = vertexes
+
+    def _allocate_objects(self, capacity):
+        arrays = [np.empty(capacity, dtype=np.intp), np.empty(capacity, dtype=np.intp),
+                  np.empty(capacity, dtype=np.intp), np.empty(capacity, dtype=np.int64)]
+        if self.object_count:
+            old = [self._starts, self._ends, self._color_ids_array, self._object_ids]
+            for new_array, old_array in zip(arrays, old):
+                new_array[:self.object_count] = old_array[:self.object_count]
+        self._starts, self._ends, self._color_ids_array, self._object_ids = arrays
@@ -0,0 +1,240 @@
+import os
+import random
+
+import yaml
+
+from Infrastructure.interfaces.interfaces import IInputHandler
+from engines import World
+from logic import AsteroidGenerator
+
+__all__ = ['Population', 'Scenario', 'ScenarioDriver', 'load_scenario', 'list_scenarios', 'build_scenario']
+
+# The scenarios shipped with the game
+SCENARIOS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'Infrastructure', 'config', 'scenarios')
+
+KINDS = ('asteroid', 'starship', 'bullet')
+DISTRIBUTIONS = ('uniform', 'clusters', 'point')
+BOT_STRATEGIES = ('none', 'spin_and_fire', 'aim_nearest')
+
+
+def _get_range(data, key, default):
+    # A range is [min, max], or a single value for a constant
+    value = data.get(key, default)
+    if isinstance(value, (int, float)):
+        return value, value
+    if not isinstance(value, (list, tuple)) or len(value) != 2 or value[0] > value[1]:
+        raise ValueError("'%s' must be a number or a [min, max] list" % key)
+    return value[0], value[1]
+
+
+# -----------------------------------------------------------------------
+class Population(object):
+    """ A group of objects of the same kind, spawned with the same rules """
+
+    def __init__(self, data):
+        """
+        :param data: the dictionary of the population read from the scenario file
+        """
+        self.kind = data.get('kind')
+        if self.kind not in KINDS:
+            raise ValueError("Unknown population kind '%s', expected one of %s" % (self.kind, KINDS))
+        # Objects spawned at the start; with respawn, the count is kept during the run
+        self.count = int(data.get('count', 0))
+        # Objects spawned per second of simulation, in addition to the count
+        self.rate = float(data.get('rate', 0))
+        if self.count < 0 or self.rate < 0:
+            raise ValueError("The count and the rate of a population can't be negative")
+        self.respawn = bool(data.get('respawn', False))
+
+        self.distribution = dict(data.get('distribution') or {'type': 'uniform'})
+        if self.distribution.get('type', 'uniform') not in DISTRIBUTIONS:
+            raise ValueError("Unknown distribution '%s', expected one of %s"
+                             % (self.distribution.get('type'), DISTRIBUTIONS))
+
+        default_speed = {'asteroid': (5, 20), 'starship': 0, 'bullet': 150}[self.kind]
+        self.speed = _get_range(data, 'speed', default_speed)
+        self.heading = _get_range(data, 'heading', (0, 359))
+
+        self.bot = data.get('bot', 'none')
+        if self.bot not in BOT_STRATEGIES:
+            raise ValueError("Unknown bot strategy '%s', expected one of %s" % (self.bot, BOT_STRATEGIES))
+        if self.bot != 'none' and self.kind != 'starship':
+            raise ValueError("Only the starship populations can be piloted by a bot")
+
+
+class Scenario(object):
+    """ A declarative stress load: the populations of a world and the run length """
+
+    def __init__(self, data):
+        """
+        :param data: the dictionary read from the scenario file
+        """
+        if not isinstance(data, dict):
+            raise ValueError("A scenario must be a mapping")
+        self.name = data.get('name', 'unnamed')
+        self.description = data.get('description', '')
+        self.seed = int(data.get('seed', 0))
+        self.duration_ticks = int(data.get('duration_ticks', 1000))
+        world_size = data.get('world_size')
+        self.world_size = tuple(world_size) if world_size is not None else None
+        self.populations = [Population(population) for population in data.get('populations', [])]
+
+
+def list_scenarios():
+    """ Return the names of the scenarios shipped with the game """
+    return sorted(os.path.splitext(file_name)[0] for file_name in os.listdir(SCENARIOS_DIR)
+                  if file_name.endswith('.yaml'))
+
+
+def load_scenario(name_or_path):
+    """ Load a scenario
+    :param name_or_path: the name of a shipped scenario or the path of a YAML file
+    :return: the Scenario
+    """
+    path = name_or_path
+    if not os.path.isfile(path):
+        path = os.path.join(SCENARIOS_DIR, name_or_path + '.yaml')
+        if not os.path.isfile(path):
+            raise ValueError("Scenario '%s' not found. The shipped ones are %s"
+                             % (name_or_path, list_scenarios()))
+    with open(path, 'r', encoding='utf-8') as file:
+        return Scenario(yaml.safe_load(file))
+
+
+# -----------------------------------------------------------------------
+class ScenarioDriver(IInputHandler):
+    """ Spawn the populations of a scenario through the GameObjectFactory and
+        pilot its bot starships. It is an IInputHandler, so the soak runner and
+        the engine call it before each tick. The exit is requested when the
+        scenario duration is over
+    """
+
+    def __init__(self, world, scenario, game_object_factory, system_factory, tick_seconds, seed=None):
+        """
+        :param world: the world to populate
+        :param scenario: the Scenario
+        :param game_object_factory: the factory creating the objects
+        :param system_factory: the factory creating the bot swarm and strategies
+        :param tick_seconds: the simulation time of a tick, for the spawn rates
+        :param seed: the seed of the random generator. Default the scenario seed
+        """
+        self._world = world
+        self._scenario = scenario
+        self._game_object_factory = game_object_factory
+        self._system_factory = system_factory
+        self._tick_seconds = tick_seconds
+        self._rng = random.Random(scenario.seed if seed is None else seed)
+        self._swarm = system_factory.create_bot_swarm(world)
+        self._tick = 0
+        # Per population: the spawns owed by the rate, and the live objects to respawn
+        self._rate_credits = [0.0] * len(scenario.populations)
+        self._alive = [0] * len(scenario.populations)
+        # Object id -> index of the population to respawn
+        self._respawned_ids = {}
+        # Population index -> centers of its clusters
+        self._cluster_centers = {}
+        world.add_removal_listener(self._on_removed)
+
+    @property
+    def swarm(self):
+        return self._swarm
+
+    def populate(self):
+        """ Spawn the initial count of each population """
+        for index, population in enumerate(self._scenario.populations):
+            for _ in range(population.count):
+                self._spawn(index, population)
+
+    def handle_input(self):
+        for index, population in enumerate(self._scenario.populations):
+            if population.rate > 0:
+                self._rate_credits[index] += population.rate * self._tick_seconds
+                while self._rate_credits[index] >= 1:
+                    self._rate_credits[index] -= 1
+                    self._spawn(index, population)
+            if population.respawn:
+                for _ in range(population.count - self._alive[index]):
+                    self._spawn(index, population)
+        self._swarm.handle_input()
+        self._tick += 1
+
+    def is_exit_requested(self) -> bool:
+        return self._tick >= self._scenario.duration_ticks
+
+    def _on_removed(self, graphical_object):
+        index = self._respawned_ids.pop(graphical_object.id, None)
+        if index is not None:
+            self._alive[index] -= 1
+
+    def _spawn(self, index, population):
+        x, y = self._get_position(index, population.distribution)
+        rng = self._rng
+        heading = rng.randint(int(population.heading[0]), int(population.heading[1])) % 360
+        speed = rng.uniform(population.speed[0], population.speed[1])
+        factory = self._game_object_factory
+
+        if population.kind == 'asteroid':
+            graphic_object = factory.create_asteroid(x, y, heading, speed)
+        elif population.kind == 'bullet':
+            graphic_object = factory.create_bullet(x, y, heading)
+            graphic_object.speed = speed
+        else:
+            graphic_object = factory.create_starship(x, y)
+            graphic_object.rotate_object(heading)
+            graphic_object.speed = speed
+
+        if population.bot != 'none':
+            self._swarm.add_bot(graphic_object, self._system_factory.create_bot_strategy(population.bot))
+        else:
+            self._world.add_object(graphic_object)
+        if population.respawn:
+            self._respawned_ids[graphic_object.id] = index
+            self._alive[index] += 1
+        return graphic_object
+
+    def _get_position(self, index, distribution):
+        rng = self._rng
+        kind = distribution.get('type', 'uniform')
+        margin = distribution.get('margin', 20)
+        world_width, world_height = self._world.world_size
+        half_width = world_width / 2 - margin
+        half_height = world_height / 2 - margin
+
+        if kind == 'point':
+            center_x, center_y = distribution.get('x', 0), distribution.get('y', 0)
+        elif kind == 'clusters':
+            centers = self._cluster_centers.get(index)
+            if centers is None:
+                centers = [(rng.uniform(-half_width, half_width), rng.uniform(-half_height, half_height))
+                           for _ in range(int(distribution.get('clusters', 4)))]
+                self._cluster_centers[index] = centers
+            center_x, center_y = rng.choice(centers)
+        else:
+            return rng.uniform(-half_width, half_width), rng.uniform(-half_height, half_height)
+
+        spread = distribution.get('spread', 0)
+        x = rng.gauss(center_x, spread) if spread else center_x
+        y = rng.gauss(center_y, spread) if spread else center_y
+        return max(-half_width, min(half_width, x)), max(-half_height, min(half_height, y))
+
+
+def build_scenario(scenario, resources, seed=None):
+    """ Create the world of a scenario and populate it
+    :param scenario: the Scenario, or the name or path of the scenario file
+    :param resources: the SharedResources with the configuration and the factories
+    :param seed: the seed of the random generator. Default the scenario seed
+    :return: (world, driver). Call driver.handle_input() before each world.process()
+    """
+    if not isinstance(scenario, Scenario):
+        scenario = load_scenario(scenario)
+    world_size = scenario.world_size or resources.world_size
+    world = World(world_size, resources.game_object_factory, resources.system_factory)
+    # The scenario is the only source of objects: no default asteroid
+    world.asteroid_generator = AsteroidGenerator(world, 0, 0)
+
+    tick_seconds = 1.0 / resources.system_factory.get_fps()
+    driver = ScenarioDriver(world, scenario, resources.game_object_factory,
+                            resources.system_factory, tick_seconds, seed)
+    driver.populate()
+    return world, driver
@@ -0,0 +1,178 @@
+import logging
+import time
+from collections import deque
+
+from engines import World
+from Infrastructure.config.config_manager import ConfigurationManager
+from Infrastructure.factories.system_factory import SystemFactory
+from Infrastructure.factories.game_object_factory import GameObjectFactory
+from Infrastructure.factories.physics_factory import PhysicsFactory
+
+__all__ = ['SharedResources', 'Match', 'MatchScheduler', 'MatchServer']
+
+
+class SharedResources(object):
+    """ The resources shared, read-only, by all the matches hosted in a process:
+        the configuration, the factories and, through the game object factory,
+        the shapes of the objects. The sin/cos lookup tables are module level,
+        so they are already loaded once per process
+    """
+
+    def __init__(self, config=None):
+        self.config = config if config is not None else ConfigurationManager()
+        self.physics_factory = PhysicsFactory(self.config)
+        self.system_factory = SystemFactory(self.config)
+        self.game_object_factory = GameObjectFactory(self.config, self.physics_factory)
+        self.world_size = self.system_factory.get_world_bounds()
+
+    def create_world(self):
+        return World(self.world_size, self.game_object_factory, self.system_factory)
+
+
+# -----------------------------------------------------------------------
+class Match(object):
+    """ A single match hosted by the server, with its tick statistics """
+
+    def __init__(self, match_id, world):
+        self.match_id = match_id
+        self.world = world
+        self.ticks = 0
+        self.overruns = 0
+        self.last_tick_seconds = 0.0
+        self.max_tick_seconds = 0.0
+        self.total_tick_seconds = 0.0
+        # Simulation time not processed yet, because the match was skipped in a round
+        self.pending_time = 0.0
+
+
+class MatchScheduler(object):
+    """ Tick many matches cooperatively in the same thread.
+
+        Each round, the matches are ticked in order until the frame budget is used.
+        A match that is ticked goes to the back of the queue, so the matches skipped
+        in a round are the first ones in the next round and no match starves. A skipped
+        match accumulates the simulation time, that is processed in its next tick.
+        A match whose tick takes longer than the tick budget is an overrun.
+    """
+
+    def __init__(self, tick_budget_seconds, frame_budget_seconds=None, clock=time.perf_counter):
+        """
+        :param tick_budget_seconds: the max time a single match tick should take
+        :param frame_budget_seconds: the max time of a round. None means no limit
+        :param clock: the function returning the current time in seconds
+        """
+        self._tick_budget_seconds = tick_budget_seconds
+        self._frame_budget_seconds = frame_budget_seconds
+        self._clock = clock
+        self._matches = deque()
+
+    @property
+    def matches(self):
+        return list(self._matches)
+
+    def add_match(self, match):
+        # New matches are ticked first, as if they were skipped in the previous round
+        self._matches.appendleft(match)
+
+    def remove_match(self, match_id):
+        for match in self._matches:
+            if match.match_id == match_id:
+                self._matches.remove(match)
+                return match
+        return None
+
+    def run_round(self, time_passed):
+        """ Tick the matches for a round
+        :param time_passed: the simulation time since the previous round, in seconds
+        :return: the list of matches that overran the tick budget in this round
+        """
+        clock = self._clock
+        round_start = clock()
+        overrunning = []
+        for match in self._matches:
+            match.pending_time += time_passed
+
+        for _ in range(len(self._matches)):
+            if (self._frame_budget_seconds is not None
+                    and clock() - round_start >= self._frame_budget_seconds):
+                break
+            match = self._matches.popleft()
+            self._matches.append(match)
+
+            tick_start = clock()
+            match.world.process(match.pending_time)
+            tick_seconds = clock() - tick_start
+
+            match.pending_time = 0.0
+            match.ticks += 1
+            match.last_tick_seconds = tick_seconds
+            match.total_tick_seconds += tick_seconds
+            match.max_tick_seconds = max(match.max_tick_seconds, tick_seconds)
+            if tick_seconds > self._tick_budget_seconds:
+                match.overruns += 1
+                overrunning.append(match)
+
+        # One warning per round, whatever the number of matches: the logging must not add to the overrun
+        if overrunning:
+            worst = max(overrunning, key=lambda match: match.last_tick_seconds)
+            logging.warning("%d matches overran the tick budget, the worst %s: %.2f ms",
+                            len(overrunning), worst.match_id, worst.last_tick_seconds * 1000)
+        return overrunning
+
+    def get_overrun_report(self):
+        """ Return the matches that overran at least once, the worst first """
+        return sorted((match for match in self._matches if match.overruns > 0),
+                      key=lambda match: match.max_tick_seconds, reverse=True)
+
+
+# -----------------------------------------------------------------------
+class MatchServer(object):
+    """ Host many independent matches in a single process """
+
+    def __init__(self, resources=None):
+        """
+        :param resources: the SharedResources of the process. Created if None
+        """
+        self._resources = resources if resources is not None else SharedResources()
+        config = self._resources.config
+        self._fps = self._resources.system_factory.get_fps()
+        tick_budget_seconds = config.get_float('server.tick_budget_ms', 2.0) / 1000
+        frame_budget_seconds = config.get_float('server.frame_budget_ms', 1000.0 / self._fps) / 1000
+        self._scheduler = MatchScheduler(tick_budget_seconds, frame_budget_seconds)
+        self._next_match_id = 0
+
+    @property
+    def resources(self):
+        return self._resources
+
+    @property
+    def scheduler(self):
+        return self._scheduler
+
+    def create_match(self):
+        """ Create a new match and schedule it """
+        self._next_match_id += 1
+        match = Match(self._next_match_id, self._resources.create_world())
+        self._scheduler.add_match(match)
+        return match
+
+    def end_match(self, match_id):
+        return self._scheduler.remove_match(match_id)
+
+    def run(self, rounds=None):
+        """ Run the rounds at the configured FPS
+        :param rounds: the number of rounds to run. None means forever
+        """
+        round_seconds = 1.0 / self._fps
+        next_round = time.perf_counter()
+        previous_round = next_round
+        count = 0
+        while rounds is None or count < rounds:
+            now = time.perf_counter()
+            if now < next_round:
+                time.sleep(next_round - now)
+                now = time.perf_counter()
+            self._scheduler.run_round(now - previous_round)
+            previous_round = now
+            next_round += round_seconds
+            count += 1
@@ -0,0 +1,305 @@
+import struct
+
+__all__ = ['SnapshotEncoder', 'SnapshotDecoder', 'EntityState', 'SnapshotError',
+           'POSITION_SCALE', 'HISTORY_SIZE', 'NO_BASELINE']
+
+# Number of quantization steps per world pixel. With a signed 16 bit integer
+# this covers a world of +/- 4096 pixels around the origin with 1/8 px precision
+POSITION_SCALE = 8
+# Number of snapshots sent (or received) kept to build the deltas. Both ends count
+# snapshots, not ticks, so the baselines still match when a snapshot is not sent every tick
+HISTORY_SIZE = 64
+# Baseline tick value used for a full (non delta) snapshot
+NO_BASELINE = 0xFFFFFFFF
+
+WIRE_VERSION = 1
+INITIAL_BUFFER_SIZE = 4096
+
+# Entity kinds on the wire. The lookup is done on the class name because the
+# same class can be imported both as 'graphicobjects' and 'Main.graphicobjects'
+ENTITY_KINDS = {'StarShip': 1, 'Bullet': 2, 'Asteroid': 3}
+ENTITY_KIND_NAMES = {kind: name for (name, kind) in ENTITY_KINDS.items()}
+UNKNOWN_KIND = 0
+
+# version, tick, baseline tick, number of spawns, updates and despawns
+HEADER = struct.Struct('<BIIHHH')
+# id, kind, x, y, rotation angle, head angle
+SPAWN_RECORD = struct.Struct('<IBhhHH')
+# id, x, y, rotation angle, head angle
+UPDATE_RECORD = struct.Struct('<IhhHH')
+# id
+DESPAWN_RECORD = struct.Struct('<I')
+
+INT16_MIN = -32768
+INT16_MAX = 32767
+
+
+class SnapshotError(Exception):
+    """ Raised when a snapshot can not be encoded or decoded """
+    pass
+
+
+class EntityState(object):
+    """ The de-quantized state of a single entity received from the server """
+
+    __slots__ = ('id', 'kind', 'x', 'y', 'rotation_angle', 'head_angle')
+
+    def __init__(self, id, kind, x, y, rotation_angle, head_angle):
+        self.id = id
+        self.kind = kind
+        self.x = x
+        self.y = y
+        self.rotation_angle = rotation_angle
+        self.head_angle = head_angle
+
+    @property
+    def kind_name(self):
+        return ENTITY_KIND_NAMES.get(self.kind)
+
+
+def _quantize_coordinate(value, scale):
+    quantized = int(round(value * scale))
+    if quantized < INT16_MIN:
+        return INT16_MIN
+    if quantized > INT16_MAX:
+        return INT16_MAX
+    return quantized
+
+
+# -----------------------------------------------------------------------
+class _ClientState(object):
+    """ What the server knows about a single client """
+
+    def __init__(self):
+        self.acked_tick = None
+        # tick -> {object id: quantized record} sent to the client on that tick
+        self.sent = {}
+
+
+class SnapshotEncoder(object):
+    """ Encode the world state in a compact binary form, sending to every client only
+        the entities changed since the last snapshot the client acknowledged.
+
+        Usage, once per server tick:
+            encoder.begin_tick(tick)
+            for client_id in clients:
+                payload = encoder.encode_for_client(client_id)
+
+        The returned payload is a memoryview over a buffer that is reused by the
+        next call to encode_for_client, so it must be sent (or copied) before that.
+    """
+
+    def __init__(self, world, position_scale=POSITION_SCALE, history_size=HISTORY_SIZE):
+        """
+        :param world: the world whose objects are encoded
+        :param position_scale: quantization steps per world pixel
+        :param history_size: max number of unacknowledged snapshots kept per client
+        """
+        self._world = world
+        self._position_scale = position_scale
+        self._history_size = history_size
+        self._buffer = bytearray(INITIAL_BUFFER_SIZE)
+        self._tick = 0
+        # Quantized records of the current tick, computed lazily and shared by all the clients
+        self._quantized = {}
+        self._kinds_by_type = {}
+        self._clients = {}
+
+    @property
+    def tick(self):
+        return self._tick
+
+    def begin_tick(self, tick):
+        """ Start a new tick. The quantized state of the previous tick is discarded """
+        self._tick = tick
+        self._quantized = {}
+
+    def add_client(self, client_id):
+        self._clients[client_id] = _ClientState()
+
+    def remove_client(self, client_id):
+        self._clients.pop(client_id, None)
+
+    def acknowledge(self, client_id, tick):
+        """ Record that the client received the snapshot of the given tick.
+            Following snapshots will be a delta against it """
+        client = self._clients[client_id]
+        if tick not in client.sent:
+            # Too old, or never sent: ignore it and keep the previous baseline
+            return
+        if client.acked_tick is not None and tick <= client.acked_tick:
+            return
+        client.acked_tick = tick
+        # Nothing older than the acknowledged tick can be used as a baseline anymore
+        for sent_tick in [t for t in client.sent if t < tick]:
+            del client.sent[sent_tick]
+
+    def encode_for_client(self, client_id, object_ids=None):
+        """ Encode the snapshot of the current tick for a client
+        :param client_id: the client that will receive the snapshot
+        :param object_ids: the ids of the objects the client is interested in.
+                           If None, all the objects in the world are sent
+        :return: a memoryview with the encoded snapshot
+        """
+        client = self._clients[client_id]
+        objects_list = self._world.get_objects_list()
+        if object_ids is None:
+            object_ids = objects_list
+
+        current = {}
+        quantized = self._quantized
+        for object_id in object_ids:
+            record = quantized.get(object_id)
+            if record is None:
+                world_object = objects_list.get(object_id)
+                if world_object is None:
+                    continue
+                record = self._quantize(world_object)
+                quantized[object_id] = record
+            current[object_id] = record
+
+        baseline_tick = client.acked_tick
+        baseline = client.sent.get(baseline_tick) if baseline_tick is not None else None
+        if baseline is None:
+            baseline_tick = NO_BASELINE
+            baseline = {}
+
+        spawns = []
+        updates = []
+        for object_id, record in current.items():
+            previous = baseline.get(object_id)
+            if previous is None:
+                spawns.append(object_id)
+            elif previous != record:
+                updates.append(object_id)
+        despawns = [object_id for object_id in baseline if object_id not in current]
+
+        payload = self._write(baseline_tick, current, spawns, updates, despawns)
+        self._remember_sent(client, current)
+        return payload
+
+    def _quantize(self, world_object):
+        object_type = type(world_object)
+        kind = self._kinds_by_type.get(object_type)
+        if kind is None:
+            kind = ENTITY_KINDS.get(object_type.__name__, UNKNOWN_KIND)
+            self._kinds_by_type[object_type] = kind
+        position = world_object.position
+        return (kind,
+                _quantize_coordinate(position.x, self._position_scale),
+                _quantize_coordinate(position.y, self._position_scale),
+                int(round(world_object.rotation_angle)) % 360,
+                int(round(world_object.head_angle)) % 360)
+
+    def _write(self, baseline_tick, current, spawns, updates, despawns):
+        if len(spawns) > 0xFFFF or len(updates) > 0xFFFF or len(despawns) > 0xFFFF:
+            raise SnapshotError("Too many entities in a single snapshot")
+
+        size = (HEADER.size + len(spawns) * SPAWN_RECORD.size
+                + len(updates) * UPDATE_RECORD.size + len(despawns) * DESPAWN_RECORD.size)
+        if size > len(self._buffer):
+            # A new buffer, rather than a resize, so that a memoryview still held
+            # by the caller on the old one doesn't prevent the growth
+            self._buffer = bytearray(max(size, 2 * len(self._buffer)))
+        buffer = self._buffer
+
+        HEADER.pack_into(buffer, 0, WIRE_VERSION, self._tick, baseline_tick,
+                         len(spawns), len(updates), len(despawns))
+        offset = HEADER.size
+        pack_spawn = SPAWN_RECORD.pack_into
+        for object_id in spawns:
+            kind, x, y, rotation_angle, head_angle = current[object_id]
+            pack_spawn(buffer, offset, object_id, kind, x, y, rotation_angle, head_angle)
+            offset += SPAWN_RECORD.size
+        pack_update = UPDATE_RECORD.pack_into
+        for object_id in updates:
+            kind, x, y, rotation_angle, head_angle = current[object_id]
+            pack_update(buffer, offset, object_id, x, y, rotation_angle, head_angle)
+            offset += UPDATE_RECORD.size
+        pack_despawn = DESPAWN_RECORD.pack_into
+        for object_id in despawns:
+            pack_despawn(buffer, offset, object_id)
+            offset += DESPAWN_RECORD.size
+
+        return memoryview(buffer)[:offset]
+
+    def _remember_sent(self, client, current):
+        client.sent[self._tick] = current
+        if len(client.sent) > self._history_size:
+            # The client is not acknowledging: forget the oldest snapshot. If it was the
+            # baseline, the next snapshot will be a full one
+            oldest_tick = min(client.sent)
+            del client.sent[oldest_tick]
+            if oldest_tick == client.acked_tick:
+                client.acked_tick = None
+
+
+# -----------------------------------------------------------------------
+class SnapshotDecoder(object):
+    """ Rebuild on the client the world state from the snapshots sent by SnapshotEncoder """
+
+    def __init__(self, position_scale=POSITION_SCALE, history_size=HISTORY_SIZE):
+        """
+        :param position_scale: quantization steps per world pixel, as the encoder
+        :param history_size: max number of decoded snapshots kept, as the encoder
+        """
+        self._position_scale = position_scale
+        self._history_size = history_size
+        # tick -> {object id: quantized record}, used as baselines for the next deltas
+        self._states = {}
+        self.tick = None
+
+    def decode(self, data):
+        """ Decode a snapshot and apply it to the client state
+        :param data: a bytes-like object produced by SnapshotEncoder
+        :return: the tick of the snapshot, that must be acknowledged to the server
+        """
+        version, tick, baseline_tick, spawn_count, update_count, despawn_count = \
+            HEADER.unpack_from(data, 0)
+        if version != WIRE_VERSION:
+            raise SnapshotError("Unsupported snapshot version %d" % version)
+
+        if baseline_tick == NO_BASELINE:
+            state = {}
+        else:
+            baseline = self._states.get(baseline_tick)
+            if baseline is None:
+                raise SnapshotError("Unknown baseline tick %d" % baseline_tick)
+            state = dict(baseline)
+
+        offset = HEADER.size
+        unpack_spawn = SPAWN_RECORD.unpack_from
+        for _ in range(spawn_count):
+            object_id, kind, x, y, rotation_angle, head_angle = unpack_spawn(data, offset)
+            state[object_id] = (kind, x, y, rotation_angle, head_angle)
+            offset += SPAWN_RECORD.size
+        unpack_update = UPDATE_RECORD.unpack_from
+        for _ in range(update_count):
+            object_id, x, y, rotation_angle, head_angle = unpack_update(data, offset)
+            state[object_id] = (state[object_id][0], x, y, rotation_angle, head_angle)
+            offset += UPDATE_RECORD.size
+        unpack_despawn = DESPAWN_RECORD.unpack_from
+        for _ in range(despawn_count):
+            (object_id,) = unpack_despawn(data, offset)
+            state.pop(object_id, None)
+            offset += DESPAWN_RECORD.size
+
+        self._states[tick] = state
+        # Only the snapshots that the server can still use as baseline are kept: the server
+        # forgets the ticks older than its baseline, and keeps at most history_size snapshots
+        if baseline_tick != NO_BASELINE:
+            for old_tick in [t for t in self._states if t < baseline_tick]:
+                del self._states[old_tick]
+        while len(self._states) > self._history_size:
+            del self._states[min(self._states)]
+        self.tick = tick
+        return tick
+
+    def get_entities(self, tick=None):
+        """ Return a dictionary object id -> EntityState for the given tick (default: the last one) """
+        if tick is None:
+            tick = self.tick
+        state = self._states.get(tick, {})
+        scale = self._position_scale
+        return {object_id: EntityState(object_id, kind, x / scale, y / scale, rotation_angle, head_angle)
+                for (object_id, (kind, x, y, rotation_angle, head_angle)) in state.items()}
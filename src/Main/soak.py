@@ -0,0 +1,253 @@
+import gc
+import os
+import time
+import tracemalloc
+import weakref
+
+__all__ = ['SoakSample', 'SoakReport', 'LeakAuditor', 'SoakRunner', 'percentile', 'is_growing']
+
+
+def percentile(sorted_values, fraction):
+    """ Return the percentile of an already sorted list (nearest rank)
+    :param fraction: the percentile in [0, 1], e.g. 0.99
+    """
+    if not sorted_values:
+        return 0.0
+    return sorted_values[int(round(fraction * (len(sorted_values) - 1)))]
+
+
+def is_growing(values, tolerance=0.05, min_samples=4):
+    """ Check if a series grows monotonically: (almost) every sample is greater
+        than the previous one and the last is more than tolerance above the first
+    :param tolerance: the relative growth ignored, e.g. 0.05 for 5%
+    :param min_samples: the series shorter than this are never growing
+    """
+    if len(values) < min_samples:
+        return False
+    increasing_steps = sum(1 for (previous, current) in zip(values, values[1:]) if current > previous)
+    # One step out of ten may go down, because of the noise of the measure
+    if increasing_steps < 0.9 * (len(values) - 1):
+        return False
+    return values[-1] > values[0] * (1 + tolerance)
+
+
+def _get_rss_bytes():
+    # Current resident set size; the peak one when /proc is not available
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# -----------------------------------------------------------------------
+class SoakSample(object):
+    """ The measures of a sampling window of the soak run """
+
+    __slots__ = ('tick', 'elapsed_seconds', 'object_count', 'tick_p50_ms', 'tick_p95_ms',
+                 'tick_p99_ms', 'tick_max_ms', 'rss_bytes', 'traced_bytes', 'top_allocators',
+                 'leaked_objects')
+
+    def __init__(self, tick, elapsed_seconds, object_count):
+        self.tick = tick
+        self.elapsed_seconds = elapsed_seconds
+        self.object_count = object_count
+        self.tick_p50_ms = 0.0
+        self.tick_p95_ms = 0.0
+        self.tick_p99_ms = 0.0
+        self.tick_max_ms = 0.0
+        self.rss_bytes = 0
+        self.traced_bytes = 0
+        # (source line, bytes allocated since the start, count) of the top allocators
+        self.top_allocators = []
+        # {kind name: count} of the removed objects still alive
+        self.leaked_objects = {}
+
+
+class SoakReport(object):
+    """ The result of a soak run """
+
+    # The series checked for monotonic growth
+    GROWTH_METRICS = ('rss_bytes', 'traced_bytes', 'object_count', 'tick_p50_ms')
+
+    def __init__(self, samples, growth_tolerance=0.05):
+        self.samples = samples
+        self.growing = [metric for metric in self.GROWTH_METRICS
+                        if is_growing([getattr(sample, metric) for sample in samples], growth_tolerance)]
+        self.leaked_objects = samples[-1].leaked_objects if samples else {}
+
+    @property
+    def has_problems(self):
+        return bool(self.growing or self.leaked_objects)
+
+    def format(self):
+        """ Return the report as text """
+        lines = ["%8s %10s %8s %8s %8s %8s %8s %10s %10s" % (
+            'tick', 'elapsed s', 'objects', 'p50 ms', 'p95 ms', 'p99 ms', 'max ms', 'rss KiB', 'traced KiB')]
+        for sample in self.samples:
+            lines.append("%8d %10.1f %8d %8.3f %8.3f %8.3f %8.3f %10d %10d" % (
+                sample.tick, sample.elapsed_seconds, sample.object_count,
+                sample.tick_p50_ms, sample.tick_p95_ms, sample.tick_p99_ms, sample.tick_max_ms,
+                sample.rss_bytes // 1024, sample.traced_bytes // 1024))
+        if self.samples and self.samples[-1].top_allocators:
+            lines.append("Top allocators since the start:")
+            for (location, size, count) in self.samples[-1].top_allocators:
+                lines.append("  %+10d B %8d blocks  %s" % (size, count, location))
+        for metric in self.growing:
+            lines.append("WARNING: %s grows monotonically" % metric)
+        for kind, count in sorted(self.leaked_objects.items()):
+            lines.append("WARNING: %d removed %s objects are still alive" % (count, kind))
+        return "\n".join(lines)
+
+
+# -----------------------------------------------------------------------
+class LeakAuditor(object):
+    """ Keep a weak reference to every object removed from the world.
+        A removed object that is still alive after a full garbage collection,
+        at two consecutive checks, is referenced by something that leaks it
+    """
+
+    def __init__(self, world):
+        self._world = world
+        # [weak reference, kind name, checked once]
+        self._removed = []
+        world.add_removal_listener(self._on_removed)
+
+    def close(self):
+        self._world.remove_removal_listener(self._on_removed)
+
+    def _on_removed(self, graphical_object):
+        self._removed.append([weakref.ref(graphical_object), type(graphical_object).__name__, False])
+
+    def check(self):
+        """ Collect the garbage and return {kind name: count} of the leaked objects """
+        gc.collect()
+        leaked = {}
+        alive = []
+        for entry in self._removed:
+            if entry[0]() is None:
+                continue
+            if entry[2]:
+                leaked[entry[1]] = leaked.get(entry[1], 0) + 1
+            entry[2] = True
+            alive.append(entry)
+        self._removed = alive
+        return leaked
+
+
+# -----------------------------------------------------------------------
+class SoakRunner(object):
+    """ Drive a world headless for a long time, sampling every N ticks the frame
+        time percentiles, the object count, the resident memory, the top allocators
+        (tracemalloc) and the removed objects that are still alive.
+
+        The world runs with a fixed tick, as fast as possible: World.process, with
+        the collision handling, is all the work of a tick.
+    """
+
+    def __init__(self, world, input_handler=None, tick_seconds=1 / 30, sample_every=300,
+                 top_allocators=10, growth_tolerance=0.05, clock=time.perf_counter):
+        """
+        :param world: the world to run
+        :param input_handler: the IInputHandler called before each tick (e.g. a BotSwarm), or None
+        :param tick_seconds: the simulation time of a tick
+        :param sample_every: the number of ticks of a sampling window
+        :param top_allocators: the number of allocators reported. 0 disables tracemalloc
+        :param growth_tolerance: the relative growth of a series ignored by the drift check
+        :param clock: the function returning the current time in seconds
+        """
+        self._world = world
+        self._input_handler = input_handler
+        self._tick_seconds = tick_seconds
+        self._sample_every = sample_every
+        self._top_allocators = top_allocators
+        self._growth_tolerance = growth_tolerance
+        self._clock = clock
+        # The ProfileCapture wrapped around each tick, or None
+        self.profile_capture = None
+
+    def run(self, ticks=None, duration_seconds=None, on_sample=None):
+        """ Run until the ticks are done or the duration is elapsed
+        :param ticks: the number of ticks to run. None means no limit
+        :param duration_seconds: the wall time to run. None means no limit
+        :param on_sample: function called with each SoakSample, e.g. to print the progress
+        :return: the SoakReport
+        """
+        if ticks is None and duration_seconds is None:
+            raise ValueError("A soak run needs a number of ticks or a duration")
+        clock = self._clock
+        world = self._world
+        input_handler = self._input_handler
+        tick_seconds = self._tick_seconds
+        profile_capture = self.profile_capture
+
+        auditor = LeakAuditor(world)
+        started_tracing = self._top_allocators > 0 and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        baseline = self._take_snapshot()
+
+        samples = []
+        tick_times = []
+        start = clock()
+        tick = 0
+        try:
+            while ticks is None or tick < ticks:
+                if duration_seconds is not None and clock() - start >= duration_seconds:
+                    break
+                if profile_capture is not None:
+                    profile_capture.frame_started()
+                if input_handler is not None:
+                    input_handler.handle_input()
+                tick_start = clock()
+                world.process(tick_seconds)
+                tick_times.append(clock() - tick_start)
+                if profile_capture is not None:
+                    profile_capture.frame_finished()
+                tick += 1
+
+                if len(tick_times) >= self._sample_every:
+                    sample = self._sample(tick, clock() - start, tick_times, auditor, baseline)
+                    samples.append(sample)
+                    tick_times = []
+                    if on_sample is not None:
+                        on_sample(sample)
+            if tick_times:
+                samples.append(self._sample(tick, clock() - start, tick_times, auditor, baseline))
+        finally:
+            auditor.close()
+            if profile_capture is not None:
+                profile_capture.close()
+            if started_tracing:
+                tracemalloc.stop()
+        return SoakReport(samples, self._growth_tolerance)
+
+    def _sample(self, tick, elapsed_seconds, tick_times, auditor, baseline):
+        sample = SoakSample(tick, elapsed_seconds, len(self._world.get_objects_list()))
+        tick_times.sort()
+        sample.tick_p50_ms = percentile(tick_times, 0.50) * 1000
+        sample.tick_p95_ms = percentile(tick_times, 0.95) * 1000
+        sample.tick_p99_ms = percentile(tick_times, 0.99) * 1000
+        sample.tick_max_ms = tick_times[-1] * 1000
+        sample.leaked_objects = auditor.check()
+        sample.rss_bytes = _get_rss_bytes()
+
+        snapshot = self._take_snapshot()
+        if snapshot is not None:
+            sample.traced_bytes = sum(statistic.size for statistic in snapshot.statistics('filename'))
+            top = snapshot.compare_to(baseline, 'lineno')[:self._top_allocators]
+            sample.top_allocators = [(str(statistic.traceback[0]), statistic.size_diff, statistic.count_diff)
+                                     for statistic in top]
+        return sample
+
+    def _take_snapshot(self):
+        if self._top_allocators <= 0 or not tracemalloc.is_tracing():
+            return None
+        # The memory used by tracemalloc and by the harness itself is not interesting
+        return tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)))
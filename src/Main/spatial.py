@@ -0,0 +1,108 @@
+__all__ = ['SpatialHashGrid']
+
+
+class SpatialHashGrid(object):
+    """ A uniform grid that indexes the world objects by position.
+        The grid is rebuilt once per tick; the queries then only visit the cells
+        around the query point instead of scanning every object of the world
+    """
+
+    def __init__(self, cell_size=64):
+        """
+        :param cell_size: the size of a grid cell in pixels
+        """
+        self._cell_size = cell_size
+        # (cell x, cell y) -> list of (object id, x, y)
+        self._cells = {}
+
+    @property
+    def cell_size(self):
+        return self._cell_size
+
+    def clear(self):
+        self._cells = {}
+
+    def insert(self, object_id, x, y):
+        cell_size = self._cell_size
+        key = (int(x // cell_size), int(y // cell_size))
+        cell = self._cells.get(key)
+        if cell is None:
+            self._cells[key] = [(object_id, x, y)]
+        else:
+            cell.append((object_id, x, y))
+
+    def rebuild(self, objects_list):
+        """ Index again all the objects
+        :param objects_list: a dictionary object id -> object, as returned by World.get_objects_list()
+        """
+        # Same as calling insert() for each object, inlined because it runs every tick
+        cells = {}
+        cell_size = self._cell_size
+        for object_id, world_object in objects_list.items():
+            position = world_object.position
+            x = position.x
+            y = position.y
+            key = (int(x // cell_size), int(y // cell_size))
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [(object_id, x, y)]
+            else:
+                cell.append((object_id, x, y))
+        self._cells = cells
+
+    def query_range(self, x, y, radius):
+        """ Return the ids of the objects whose position is within the radius from (x, y) """
+        cell_size = self._cell_size
+        min_cell_x = int((x - radius) // cell_size)
+        max_cell_x = int((x + radius) // cell_size)
+        min_cell_y = int((y - radius) // cell_size)
+        max_cell_y = int((y + radius) // cell_size)
+        radius_power_2 = radius * radius
+
+        result = []
+        cells = self._cells
+        for cell_x in range(min_cell_x, max_cell_x + 1):
+            for cell_y in range(min_cell_y, max_cell_y + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell is None:
+                    continue
+                for (object_id, object_x, object_y) in cell:
+                    dx = object_x - x
+                    dy = object_y - y
+                    if dx * dx + dy * dy <= radius_power_2:
+                        result.append(object_id)
+        return result
+
+    def query_nearest(self, x, y, max_radius):
+        """ Return the id of the object nearest to (x, y), within max_radius, or None.
+            The cells are visited in rings around the query point, and the search
+            stops as soon as no farther ring can contain a nearer object
+        """
+        cell_size = self._cell_size
+        center_x = int(x // cell_size)
+        center_y = int(y // cell_size)
+        max_ring = int(max_radius // cell_size) + 1
+        best_id = None
+        best_distance_power_2 = max_radius * max_radius
+
+        cells = self._cells
+        for ring in range(max_ring + 1):
+            # The query point can be anywhere in the center cell
+            ring_distance = (ring - 1) * cell_size
+            if ring_distance > 0 and ring_distance * ring_distance >= best_distance_power_2:
+                break
+            for cell_x in range(center_x - ring, center_x + ring + 1):
+                # Only the border of the ring: the inner cells were visited already
+                step = 1 if cell_x in (center_x - ring, center_x + ring) else 2 * ring
+                for cell_y in range(center_y - ring, center_y + ring + 1, step):
+                    cell = cells.get((cell_x, cell_y))
+                    if cell is None:
+                        continue
+                    for (object_id, object_x, object_y) in cell:
+                        dx = object_x - x
+                        dy = object_y - y
+                        distance_power_2 = dx * dx + dy * dy
+                        if distance_power_2 <= best_distance_power_2:
+                            best_id = object_id
+                            best_distance_power_2 = distance_power_2
+        return best_id
@@ -0,0 +1,98 @@
+import math
+from collections import OrderedDict
+
+import constants
+import geometrytransformation2d
+import pygame
+from metrics import REGISTRY
+
+__all__ = ['SpriteAtlas']
+
+_ATLAS_HITS = REGISTRY.counter('sprite_atlas_hits_total', 'Sprites found in the atlas')
+_ATLAS_MISSES = REGISTRY.counter('sprite_atlas_misses_total', 'Sprites rasterized because missing from the atlas')
+_ATLAS_EVICTIONS = REGISTRY.counter('sprite_atlas_evictions_total', 'Sprites evicted from the atlas by its memory cap')
+_ATLAS_BYTES = REGISTRY.gauge('sprite_atlas_bytes', 'Pixel memory of the sprites in the atlas')
+
+# Pixel size of the sprite surfaces
+BYTES_PER_PIXEL = 4
+
+
+class SpriteAtlas(object):
+    """ Pre-rasterized outlines of the shapes, one surface per (shape, color, angle).
+
+        The angles of the objects are integer degrees and the shapes are the few
+        tuples shared by all the instances of a kind (see graphicobjects and the
+        GameObjectFactory), so the same sprites are drawn again and again: a sprite
+        is rasterized the first time it is requested and then only blitted.
+
+        The sprites are kept in least recently used order: when the pixel memory
+        goes over max_bytes, the oldest ones are evicted. A shape is identified by
+        its id(); the atlas keeps a reference to it, so the id can't be reused by
+        another shape while its sprites are cached.
+    """
+
+    def __init__(self, max_bytes=8 * 1024 * 1024, surface_factory=None):
+        """
+        :param max_bytes: the cap of the pixel memory of the sprites
+        :param surface_factory: the function creating a surface of a (width, height). Default pygame.Surface
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self._surface_factory = surface_factory or pygame.Surface
+        # (id(shape), color, angle) -> (surface, offset_x, offset_y, bytes, shape)
+        self._sprites = OrderedDict()
+        self.bytes_used = 0
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def get_sprite(self, shape, color, angle):
+        """ Return the sprite of a shape rotated by an angle
+        :param shape: the sequence of the local vertexes of the shape
+        :param color: the color of the outline
+        :param angle: the rotation in integer degrees
+        :return: (surface, offset_x, offset_y): blit the surface at the position of the object plus the offset
+        """
+        key = (id(shape), color, angle)
+        sprites = self._sprites
+        sprite = sprites.get(key)
+        if sprite is not None:
+            sprites.move_to_end(key)
+            _ATLAS_HITS.value += 1
+            return sprite[0], sprite[1], sprite[2]
+
+        _ATLAS_MISSES.value += 1
+        sprite = self._rasterize(shape, color, angle)
+        sprites[key] = sprite
+        self.bytes_used += sprite[3]
+        # The new sprite is the last one: it is kept even if it is bigger than the cap
+        while self.bytes_used > self.max_bytes and len(sprites) > 1:
+            _, evicted = sprites.popitem(last=False)
+            self.bytes_used -= evicted[3]
+            _ATLAS_EVICTIONS.value += 1
+        _ATLAS_BYTES.value = self.bytes_used
+        return sprite[0], sprite[1], sprite[2]
+
+    def clear(self):
+        self._sprites.clear()
+        self.bytes_used = 0
+        _ATLAS_BYTES.value = 0
+
+    def _rasterize(self, shape, color, angle):
+        origin = geometrytransformation2d.Vector2D(0, 0)
+        rotated = [geometrytransformation2d.from_local_to_world_coordinates(vertex, origin, angle)
+                   for vertex in shape]
+        # One pixel around the 1 pixel wide lines, as Display._get_bounding_rect
+        offset_x = math.floor(min(vertex.x for vertex in rotated)) - 1
+        offset_y = math.floor(min(vertex.y for vertex in rotated)) - 1
+        width = math.ceil(max(vertex.x for vertex in rotated)) - offset_x + 2
+        height = math.ceil(max(vertex.y for vertex in rotated)) - offset_y + 2
+
+        surface = self._surface_factory((width, height))
+        surface.fill(constants.BLACK)
+        # The black pixels are not copied by the blits: the sprites can overlap
+        surface.set_colorkey(constants.BLACK, pygame.RLEACCEL)
+        points = [(vertex.x - offset_x, vertex.y - offset_y) for vertex in rotated]
+        pygame.draw.lines(surface, color, True, points, 1)
+        return surface, offset_x, offset_y, width * height * BYTES_PER_PIXEL, shape
@@ -0,0 +1,175 @@
+import json
+import os
+import queue
+import threading
+import time
+
+__all__ = ['TraceWriter', 'FrameTracer', 'NullTracer', 'NULL_TRACER']
+
+
+class TraceWriter(object):
+    """ Write trace events to a file in the Chrome trace JSON format (array form),
+        that chrome://tracing and Perfetto (ui.perfetto.dev) open.
+
+        The events arrive in batches and are serialized and written by a
+        background thread, so the game thread never waits the disk
+    """
+
+    def __init__(self, path):
+        """
+        :param path: the path of the trace file
+        """
+        self._path = path
+        self._file = open(path, 'w', encoding='utf-8')
+        self._file.write('[\n')
+        self._first_event = True
+        self._batches = queue.Queue()
+        self._thread = threading.Thread(target=self._write_batches, name='trace-writer', daemon=True)
+        self._thread.start()
+
+    @property
+    def path(self):
+        return self._path
+
+    def write(self, batch):
+        """ Queue a list of events (dictionaries) to be written """
+        self._batches.put(batch)
+
+    def close(self):
+        """ Write the queued events and close the file """
+        self._batches.put(None)
+        self._thread.join()
+        self._file.write('\n]\n')
+        self._file.close()
+
+    def _write_batches(self):
+        while True:
+            batch = self._batches.get()
+            if batch is None:
+                return
+            text = ',\n'.join(json.dumps(event, separators=(',', ':')) for event in batch)
+            if not text:
+                continue
+            if not self._first_event:
+                self._file.write(',\n')
+            self._file.write(text)
+            self._first_event = False
+
+
+# -----------------------------------------------------------------------
+class _Span(object):
+    """ A phase of a frame; the event is recorded when the span ends """
+
+    __slots__ = ('_tracer', '_name', '_start')
+
+    def __init__(self, tracer, name):
+        self._tracer = tracer
+        self._name = name
+
+    def __enter__(self):
+        self._start = self._tracer.clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        tracer = self._tracer
+        tracer.add_complete_event(self._name, self._start, tracer.clock() - self._start)
+        return False
+
+
+class FrameTracer(object):
+    """ Record the phases of each frame as Chrome trace "complete" events.
+
+        Usage:
+            with tracer.span('process'):
+                world.process(time_passed)
+
+        The spans can be nested: the viewer shows them as a flame graph for each frame.
+        The events are kept in memory and handed to the TraceWriter in batches.
+        Each event has the id of the thread recording it, so the simulation and the
+        render threads of the pipelined mode are shown as two tracks. Both threads
+        record in the same list: a lock guards the appends and the hand-off of a batch
+    """
+
+    def __init__(self, writer, batch_size=1000, clock=time.perf_counter):
+        """
+        :param writer: the TraceWriter receiving the events
+        :param batch_size: the number of events handed to the writer at once
+        :param clock: the function returning the current time in seconds
+        """
+        self._writer = writer
+        self._batch_size = batch_size
+        self.clock = clock
+        self._origin = clock()
+        self._pid = os.getpid()
+        self._tid = threading.get_ident()
+        self._lock = threading.Lock()
+        self._events = [{'name': 'process_name', 'ph': 'M', 'pid': self._pid, 'tid': self._tid,
+                         'args': {'name': 'pyAsteroid'}}]
+
+    def span(self, name):
+        """ Return a context manager recording the duration of the enclosed code """
+        return _Span(self, name)
+
+    def add_complete_event(self, name, start, duration):
+        """ Record a phase that started at start (clock seconds) and lasted duration seconds """
+        event = {'name': name, 'ph': 'X', 'pid': self._pid, 'tid': threading.get_ident(),
+                 'ts': (start - self._origin) * 1000000, 'dur': duration * 1000000}
+        with self._lock:
+            self._events.append(event)
+            full = len(self._events) >= self._batch_size
+        if full:
+            self.flush()
+
+    def add_counter(self, name, value):
+        """ Record the value of a counter (e.g. the number of objects) at the current time """
+        event = {'name': name, 'ph': 'C', 'pid': self._pid, 'tid': threading.get_ident(),
+                 'ts': (self.clock() - self._origin) * 1000000, 'args': {name: value}}
+        with self._lock:
+            self._events.append(event)
+
+    def flush(self):
+        """ Hand the recorded events to the writer """
+        # Once swapped, the batch is only owned by the writer: the other thread appends to the new list
+        with self._lock:
+            events, self._events = self._events, []
+        if events:
+            self._writer.write(events)
+
+    def close(self):
+        """ Write all the events and close the trace file """
+        self.flush()
+        self._writer.close()
+
+
+class _NullSpan(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        return False
+
+
+class NullTracer(object):
+    """ The tracer used when tracing is disabled: it records nothing """
+
+    _span = _NullSpan()
+
+    def span(self, name):
+        return self._span
+
+    def add_complete_event(self, name, start, duration):
+        pass
+
+    def add_counter(self, name, value):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+NULL_TRACER = NullTracer()
@@ -0,0 +1,332 @@
+import math
+import multiprocessing
+
+import numpy as np
+
+import lookuptables
+from graphicobjects import STARSHIP_VERTEXES, BULLET_VERTEXES, ASTEROID_VERTEXES
+
+__all__ = ['VectorWorldEnv', 'ShardedVectorWorldEnv',
+           'ACTION_ROTATE_LEFT', 'ACTION_ROTATE_RIGHT', 'ACTION_FIRE',
+           'KIND_NONE', 'KIND_STARSHIP', 'KIND_ASTEROID', 'KIND_BULLET']
+
+# Columns of the action array: one row per world, 1 means the key is pressed
+ACTION_ROTATE_LEFT = 0
+ACTION_ROTATE_RIGHT = 1
+ACTION_FIRE = 2
+ACTION_SIZE = 3
+
+# Values of the kind feature in the observations
+KIND_NONE = 0
+KIND_STARSHIP = 1
+KIND_ASTEROID = 2
+KIND_BULLET = 3
+
+# Features of each observed entity: kind, x, y (normalized to -1..1), heading (0..1)
+OBSERVATION_FEATURES = 4
+
+REWARD_ASTEROID_DESTROYED = 1.0
+REWARD_STARSHIP_HIT = -1.0
+
+
+def _shape_from_config(config, key, default_vertexes):
+    vertexes = config.get_vertexes(key)
+    if vertexes:
+        return [(float(v[0]), float(v[1])) for v in vertexes]
+    return [(v.x, v.y) for v in default_vertexes]
+
+
+def _radius(shape):
+    # Same as the collision circle of GraphicObject
+    return math.sqrt(max(x * x + y * y for (x, y) in shape))
+
+
+class VectorWorldEnv(object):
+    """ Step many independent worlds in lockstep, for bot training.
+
+        The worlds follow the rules of World: the starship at the origin rotates and
+        fires, the asteroids are spawned as AsteroidGenerator does, the objects move
+        in their heading direction, the objects beyond the screen and the world
+        margin are removed, and the collisions use the collision circles. But the
+        state of all the worlds lives in NumPy arrays, and movement, culling and
+        collisions are computed for all the worlds at once instead of calling
+        World.process for each one.
+
+        step() takes an array (num_worlds, 3) of [rotate left, rotate right, fire]
+        and returns observations (num_worlds, 1 + asteroids + bullets, 4), rewards
+        (+1 for each asteroid destroyed, -1 when the starship is hit) and dones.
+        A world whose episode is done is reset automatically, and the returned
+        observation is the first one of the new episode.
+    """
+
+    def __init__(self, num_worlds, config, max_asteroids=None, max_bullets=16,
+                 max_episode_ticks=1000, tick_seconds=None, seed=None, randomize_spawns=False):
+        """
+        :param num_worlds: number of independent worlds
+        :param config: the game configuration (IConfiguration)
+        :param max_asteroids: asteroids spawned per episode. Default from configuration
+        :param max_bullets: max bullets alive at the same time in a world
+        :param max_episode_ticks: length of an episode when the starship is not hit
+        :param tick_seconds: simulation time of a step. Default 1 / configured FPS
+        :param seed: seed of the random spawns
+        :param randomize_spawns: if True the asteroids are spawned from a random point
+                                 of the left border with a random heading, instead of
+                                 the fixed AsteroidGenerator position
+        """
+        self.num_worlds = num_worlds
+        self._half_width = config.get_int('display.width', 500) / 2
+        self._half_height = config.get_int('display.height', 500) / 2
+        # The objects are removed when they are completely beyond the screen and the margin, as in World
+        margin = config.get_float('physics.world_bounds.margin', 0.0)
+        self._x_max = self._half_width + margin
+        self._y_max = self._half_height + margin
+        self._rotation_speed = config.get_int('game.starship.rotation_speed', 10)
+        self._reload_ticks = config.get_int('game.starship.reload_counter', 10)
+        self._bullet_speed = config.get_float('game.bullet.speed', 150.0)
+        self._asteroid_speed = config.get_float('game.asteroid.speed', 10.0)
+        self._spawn_countdown = config.get_int('game.asteroid.spawn_countdown', 30)
+        if max_asteroids is None:
+            max_asteroids = config.get_int('game.asteroid.max_count', 1)
+        self._max_asteroids = max_asteroids
+        self._max_bullets = max_bullets
+        self._max_episode_ticks = max_episode_ticks
+        if tick_seconds is None:
+            tick_seconds = 1.0 / config.get_int('display.fps', 30)
+        self._tick_seconds = tick_seconds
+        self._randomize_spawns = randomize_spawns
+        self._rng = np.random.default_rng(seed)
+
+        starship_shape = _shape_from_config(config, 'game.starship.vertexes', STARSHIP_VERTEXES)
+        self._starship_front = starship_shape[0]
+        self._starship_radius = _radius(starship_shape)
+        self._bullet_radius = _radius(_shape_from_config(config, 'game.bullet.vertexes', BULLET_VERTEXES))
+        self._asteroid_radius = _radius(_shape_from_config(config, 'game.asteroid.vertexes', ASTEROID_VERTEXES))
+
+        # The same values of the World lookup tables, as arrays indexed by angle
+        self._cos = np.array([lookuptables.cos[angle] for angle in range(360)])
+        self._sin = np.array([lookuptables.sin[angle] for angle in range(360)])
+
+        n = num_worlds
+        self._starship_angle = np.zeros(n, dtype=np.int64)
+        self._reload_counter = np.zeros(n, dtype=np.int64)
+        self._spawn_counter = np.zeros(n, dtype=np.int64)
+        self._spawned = np.zeros(n, dtype=np.int64)
+        self._ticks = np.zeros(n, dtype=np.int64)
+        self._asteroid_position = np.zeros((n, max_asteroids, 2))
+        self._asteroid_angle = np.zeros((n, max_asteroids), dtype=np.int64)
+        self._asteroid_alive = np.zeros((n, max_asteroids), dtype=bool)
+        self._bullet_position = np.zeros((n, max_bullets, 2))
+        self._bullet_angle = np.zeros((n, max_bullets), dtype=np.int64)
+        self._bullet_alive = np.zeros((n, max_bullets), dtype=bool)
+        self._observations = np.zeros((n, 1 + max_asteroids + max_bullets, OBSERVATION_FEATURES),
+                                      dtype=np.float32)
+        self._rewards = np.zeros(n, dtype=np.float32)
+        self._dones = np.zeros(n, dtype=bool)
+
+    @property
+    def observation_shape(self):
+        return self._observations.shape[1:]
+
+    def reset(self):
+        """ Reset all the worlds
+        :return: the observations
+        """
+        self._reset_worlds(np.ones(self.num_worlds, dtype=bool))
+        return self._observe()
+
+    def step(self, actions):
+        """ Advance all the worlds by a tick
+        :param actions: array-like (num_worlds, 3) of [rotate left, rotate right, fire]
+        :return: tuple of (observations, rewards, dones)
+        """
+        actions = np.asarray(actions).reshape(self.num_worlds, ACTION_SIZE).astype(bool)
+
+        # Input, as KeyboardInputHandler
+        rotation = (actions[:, ACTION_ROTATE_RIGHT].astype(np.int64)
+                    - actions[:, ACTION_ROTATE_LEFT]) * self._rotation_speed
+        self._starship_angle = (self._starship_angle + rotation) % 360
+        firing = actions[:, ACTION_FIRE] & (self._reload_counter <= 0)
+        if firing.any():
+            self._fire(firing)
+
+        # New asteroids, as AsteroidGenerator
+        self._spawn_counter = np.maximum(self._spawn_counter - 1, 0)
+        spawning = (self._spawn_counter <= 0) & (self._spawned < self._max_asteroids)
+        if spawning.any():
+            self._spawn_asteroids(spawning)
+
+        # Objects processing
+        self._reload_counter -= self._reload_counter > 0
+        self._move(self._asteroid_position, self._asteroid_angle, self._asteroid_alive,
+                   self._asteroid_speed)
+        self._move(self._bullet_position, self._bullet_angle, self._bullet_alive,
+                   self._bullet_speed)
+
+        # Objects out of the screen
+        self._asteroid_alive &= self._is_visible(self._asteroid_position, self._asteroid_radius)
+        self._bullet_alive &= self._is_visible(self._bullet_position, self._bullet_radius)
+
+        # Collisions
+        self._rewards[:] = 0
+        self._collide()
+
+        self._ticks += 1
+        np.logical_or(self._dones, self._ticks >= self._max_episode_ticks, out=self._dones)
+        if self._dones.any():
+            self._reset_worlds(self._dones)
+        return self._observe(), self._rewards.copy(), self._dones.copy()
+
+    def _reset_worlds(self, mask):
+        self._starship_angle[mask] = 0
+        self._reload_counter[mask] = self._reload_ticks
+        self._spawn_counter[mask] = self._spawn_countdown
+        self._spawned[mask] = 0
+        self._ticks[mask] = 0
+        self._asteroid_alive[mask] = False
+        self._bullet_alive[mask] = False
+
+    def _fire(self, firing):
+        # First free bullet slot of each world (argmin of a bool array is the first False)
+        slots = np.argmin(self._bullet_alive, axis=1)
+        worlds = np.nonzero(firing & ~self._bullet_alive[np.arange(self.num_worlds), slots])[0]
+        slots = slots[worlds]
+        angles = self._starship_angle[worlds]
+        front_x, front_y = self._starship_front
+        cos = self._cos[angles]
+        sin = self._sin[angles]
+        # The front vertex of the starship, rotated, as StarShip.fire
+        self._bullet_position[worlds, slots, 0] = front_x * cos - front_y * sin
+        self._bullet_position[worlds, slots, 1] = front_x * sin + front_y * cos
+        self._bullet_angle[worlds, slots] = angles
+        self._bullet_alive[worlds, slots] = True
+        self._reload_counter[worlds] = self._reload_ticks
+
+    def _spawn_asteroids(self, spawning):
+        slots = np.argmin(self._asteroid_alive, axis=1)
+        worlds = np.nonzero(spawning & ~self._asteroid_alive[np.arange(self.num_worlds), slots])[0]
+        slots = slots[worlds]
+        self._asteroid_position[worlds, slots, 0] = -self._half_width
+        if self._randomize_spawns:
+            self._asteroid_position[worlds, slots, 1] = self._rng.uniform(
+                -self._half_height, self._half_height, len(worlds))
+            self._asteroid_angle[worlds, slots] = self._rng.integers(-45, 46, len(worlds)) % 360
+        else:
+            self._asteroid_position[worlds, slots, 1] = 0
+            self._asteroid_angle[worlds, slots] = 0
+        self._asteroid_alive[worlds, slots] = True
+        self._spawned[worlds] += 1
+
+    def _move(self, positions, angles, alive, speed):
+        distance = speed * self._tick_seconds * alive
+        positions[:, :, 0] += self._cos[angles] * distance
+        positions[:, :, 1] += self._sin[angles] * distance
+
+    def _is_visible(self, positions, radius):
+        x = positions[:, :, 0]
+        y = positions[:, :, 1]
+        return ((x - radius < self._x_max) & (x + radius > -self._x_max)
+                & (y - radius < self._y_max) & (y + radius > -self._y_max))
+
+    def _collide(self):
+        # Bullets against asteroids: (worlds, bullets, asteroids)
+        delta = self._bullet_position[:, :, np.newaxis, :] - self._asteroid_position[:, np.newaxis, :, :]
+        distance_power_2 = (delta * delta).sum(axis=3)
+        threshold = (self._bullet_radius + self._asteroid_radius) ** 2
+        hits = ((distance_power_2 <= threshold)
+                & self._bullet_alive[:, :, np.newaxis] & self._asteroid_alive[:, np.newaxis, :])
+        # As Bullet.collision_handler, the asteroid is removed and the bullet goes on
+        destroyed = hits.any(axis=1)
+        self._asteroid_alive &= ~destroyed
+        self._rewards += destroyed.sum(axis=1) * REWARD_ASTEROID_DESTROYED
+
+        # Asteroids against the starship, that is at the origin
+        distance_power_2 = (self._asteroid_position * self._asteroid_position).sum(axis=2)
+        threshold = (self._starship_radius + self._asteroid_radius) ** 2
+        starship_hit = ((distance_power_2 <= threshold) & self._asteroid_alive).any(axis=1)
+        self._rewards += starship_hit * REWARD_STARSHIP_HIT
+        self._dones[:] = starship_hit
+
+    def _observe(self):
+        observations = self._observations
+        first_bullet = 1 + self._max_asteroids
+        observations[:, 0, 0] = KIND_STARSHIP
+        observations[:, 0, 1:3] = 0
+        observations[:, 0, 3] = self._starship_angle / 360
+        self._observe_objects(observations[:, 1:first_bullet], KIND_ASTEROID, self._asteroid_alive,
+                              self._asteroid_position, self._asteroid_angle)
+        self._observe_objects(observations[:, first_bullet:], KIND_BULLET, self._bullet_alive,
+                              self._bullet_position, self._bullet_angle)
+        return observations.copy()
+
+    def _observe_objects(self, observations, kind, alive, positions, angles):
+        observations[:, :, 0] = alive * kind
+        observations[:, :, 1] = positions[:, :, 0] / self._half_width * alive
+        observations[:, :, 2] = positions[:, :, 1] / self._half_height * alive
+        observations[:, :, 3] = angles / 360 * alive
+
+
+# -----------------------------------------------------------------------
+def _shard_worker(connection, num_worlds, config, env_kwargs):
+    env = VectorWorldEnv(num_worlds, config, **env_kwargs)
+    while True:
+        command, data = connection.recv()
+        if command == 'step':
+            connection.send(env.step(data))
+        elif command == 'reset':
+            connection.send(env.reset())
+        elif command == 'close':
+            connection.close()
+            return
+
+
+class ShardedVectorWorldEnv(object):
+    """ A VectorWorldEnv whose worlds are split across worker processes,
+        one shard per process, to use more than one core.
+        It has the same interface of VectorWorldEnv
+    """
+
+    def __init__(self, num_worlds, num_workers, config, seed=None, **env_kwargs):
+        """
+        :param num_worlds: total number of worlds
+        :param num_workers: number of worker processes
+        :param config: the game configuration. It must be picklable
+        :param seed: base seed; the shard i uses seed + i
+        :param env_kwargs: other VectorWorldEnv arguments
+        """
+        self.num_worlds = num_worlds
+        shard_sizes = [len(shard) for shard in np.array_split(np.arange(num_worlds), num_workers)]
+        self._split_points = np.cumsum(shard_sizes)[:-1]
+        self._connections = []
+        self._processes = []
+        for index, shard_size in enumerate(shard_sizes):
+            parent_connection, child_connection = multiprocessing.Pipe()
+            kwargs = dict(env_kwargs, seed=None if seed is None else seed + index)
+            process = multiprocessing.Process(target=_shard_worker,
+                                              args=(child_connection, shard_size, config, kwargs),
+                                              daemon=True)
+            process.start()
+            child_connection.close()
+            self._connections.append(parent_connection)
+            self._processes.append(process)
+
+    def reset(self):
+        for connection in self._connections:
+            connection.send(('reset', None))
+        return np.concatenate([connection.recv() for connection in self._connections])
+
+    def step(self, actions):
+        actions = np.asarray(actions).reshape(self.num_worlds, ACTION_SIZE)
+        for connection, shard_actions in zip(self._connections, np.split(actions, self._split_points)):
+            connection.send(('step', shard_actions))
+        results = [connection.recv() for connection in self._connections]
+        observations, rewards, dones = zip(*results)
+        return np.concatenate(observations), np.concatenate(rewards), np.concatenate(dones)
+
+    def close(self):
+        for connection in self._connections:
+            connection.send(('close', None))
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
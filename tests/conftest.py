@@ -153,6 +153,7 @@ class MockWorld:
         self._objects_list = {}
         self._objects_counter = 0
         self.starship = None
+        self.tick = 0
         
     def add_object(self, obj):
         """Add an object to the mock world."""
@@ -168,6 +169,14 @@ class MockWorld:
         """Remove an object by ID."""
         if obj_id in self._objects_list:
             del self._objects_list[obj_id]
+    
+    def despawn_object(self, obj_id):
+        """Remove an object by ID; the mock world has no tick to defer it to."""
+        self.remove_object(obj_id)
+    
+    def get_object(self, obj_id):
+        """Return the object with the ID, or None."""
+        return self._objects_list.get(obj_id)
 
 
 class MockConfiguration:
@@ -254,6 +263,9 @@ class MockSystemFactory:
     
     def create_collision_handler(self, world):
         return self._collision_handler
+    
+    def get_world_margin(self):
+        return 0
 
 
 # =============================================================================
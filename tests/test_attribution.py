@@ -0,0 +1,132 @@
+"""
+Tests for the attribution module.
+"""
+
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockWorld, MockGameObjectFactory, MockSystemFactory
+
+from attribution import CostAttribution
+from profiling import ProfileCapture
+from graphicobjects import GraphicObject, Asteroid, Bullet
+from geometrytransformation2d import Vector2D
+from collisions import CollisionHandler
+from engines import World
+
+
+class FakeClock:
+    """A clock advancing by one millisecond at each call."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 0.001
+        return self.now
+
+
+class CostAttributionTests(unittest.TestCase):
+    """Tests for CostAttribution class."""
+
+    def test_add_aggregates_time_and_calls_per_key(self):
+        """add() should sum the time and the calls of the same key."""
+        attribution = CostAttribution()
+
+        attribution.add('process', 'Bullet', 0.002)
+        attribution.add('process', 'Bullet', 0.003)
+        attribution.add('process', 'Asteroid', 0.001)
+
+        costs = attribution.get_costs('process')
+        self.assertAlmostEqual(costs['Bullet'][0], 0.005)
+        self.assertEqual(costs['Bullet'][1], 2)
+        self.assertEqual(costs['Asteroid'][1], 1)
+
+    def test_format_sorts_by_time_and_subtracts_snapshot(self):
+        """format() should list the most expensive keys first, only after the snapshot."""
+        attribution = CostAttribution()
+        attribution.add('process', 'StarShip', 0.010)
+        since = attribution.snapshot()
+        attribution.add('process', 'Asteroid', 0.001)
+        attribution.add('broad_phase', ('Asteroid', 'Bullet'), 0.004)
+        attribution.add('process', 'Bullet', 0.003)
+
+        report = attribution.format(since)
+
+        self.assertNotIn('StarShip', report)
+        self.assertIn('Asteroid x Bullet', report)
+        self.assertLess(report.index('Bullet '), report.index('Asteroid '))
+
+
+class WorldAttributionTests(unittest.TestCase):
+    """Tests for the cost attribution of World and CollisionHandler."""
+
+    def _create_square_object(self, object_class, x, y, size=20):
+        """Helper to create a square object of the given class."""
+        half = size / 2
+        vertexes = [
+            Vector2D(half, half), Vector2D(half, -half),
+            Vector2D(-half, -half), Vector2D(-half, half)
+        ]
+        return object_class(x, y, 0, 0, vertexes)
+
+    def test_world_process_times_each_object_class(self):
+        """World.process should attribute the processing time to each object class."""
+        world = World((1000, 1000), MockGameObjectFactory(), MockSystemFactory())
+        world.add_object(GraphicObject())
+        world.add_object(GraphicObject())
+        attribution = CostAttribution(FakeClock())
+        world.set_cost_attribution(attribution)
+
+        world.process(1 / 30)
+
+        # The mock starship is a GraphicObject too
+        seconds, calls = attribution.get_costs('process')['GraphicObject']
+        self.assertEqual(calls, 3)
+        self.assertAlmostEqual(seconds, 0.003)
+
+    def test_collision_handler_times_type_pairs_and_handlers(self):
+        """The broad phase should be attributed per unordered pair and the handlers per class."""
+        world = MockWorld()
+        world.add_object(self._create_square_object(Asteroid, 0, 0))
+        world.add_object(self._create_square_object(Bullet, 5, 5))
+        world.add_object(self._create_square_object(Asteroid, 300, 300))
+        handler = CollisionHandler(world)
+        attribution = CostAttribution(FakeClock())
+        handler.cost_attribution = attribution
+
+        handler.handle()
+
+        pairs = attribution.get_costs('broad_phase')
+        self.assertEqual(pairs[('Asteroid', 'Bullet')][1], 1)
+        self.assertEqual(pairs[('Asteroid', 'Asteroid')][1], 1)
+        handlers = attribution.get_costs('collision_handler')
+        self.assertEqual(handlers['Asteroid'][1] + handlers.get('Bullet', (0, 0))[1], 2)
+
+    def test_profile_summary_contains_cost_of_the_window(self):
+        """A profile capture should add the cost per object type of its frames to the summary."""
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir)
+        capture = ProfileCapture(output_dir, frames=1)
+        attribution = CostAttribution()
+        attribution.add('process', 'StarShip', 0.5)
+        capture.cost_attribution = attribution
+        capture.request()
+
+        capture.frame_started()
+        attribution.add('process', 'Bullet', 0.001)
+        capture.frame_finished()
+
+        with open(capture.last_dump[1]) as summary_file:
+            summary = summary_file.read()
+        self.assertIn('Cost per object type', summary)
+        self.assertIn('Bullet', summary)
+        self.assertNotIn('StarShip', summary)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Tests for the bots module.
+"""
+
+import unittest
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockWorld
+
+from bots import SpinAndFireStrategy, AimAtNearestAsteroidStrategy, BotInputHandler, BotSwarm
+from graphicobjects import StarShip, Bullet, Asteroid
+import constants
+
+
+class BotsTests(unittest.TestCase):
+    """Tests for the bot input handlers and strategies."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.world = MockWorld()
+        self.starship = StarShip(0, 0, constants.WHITE)
+        self.world.starship = self.starship
+        self.world.add_object(self.starship)
+
+    def _count_bullets(self):
+        return len([obj for obj in self.world.get_objects_list().values() if isinstance(obj, Bullet)])
+
+    def test_spin_and_fire_rotates_and_fires(self):
+        """The spin-and-fire bot should rotate each tick and add its bullets to the world."""
+        handler = BotInputHandler(self.world, SpinAndFireStrategy(turn_angle=15))
+        self.starship.reload_counter = 0
+
+        handler.handle_input()
+
+        self.assertEqual(self.starship.head_angle, 15)
+        self.assertEqual(self._count_bullets(), 1)
+        self.assertFalse(handler.is_exit_requested())
+
+    def test_aim_turns_toward_the_nearest_asteroid(self):
+        """The aiming bot should turn toward the nearest asteroid, by the shortest arc."""
+        self.world.add_object(Asteroid(0, -50, 0, 0))
+        self.world.add_object(Asteroid(0, 30, 0, 0))
+        handler = BotInputHandler(self.world, AimAtNearestAsteroidStrategy(turn_angle=10))
+
+        handler.handle_input()
+
+        self.assertEqual(self.starship.head_angle, 10)
+        self.assertEqual(self._count_bullets(), 0)
+
+    def test_aim_fires_when_pointing_at_the_target(self):
+        """The aiming bot should fire once the remaining angle is within the tolerance."""
+        self.world.add_object(Asteroid(100, 5, 0, 0))
+        self.starship.reload_counter = 0
+        handler = BotInputHandler(self.world, AimAtNearestAsteroidStrategy(turn_angle=10, aim_tolerance=5))
+
+        handler.handle_input()
+
+        self.assertEqual(self.starship.head_angle, 3)
+        self.assertEqual(self._count_bullets(), 1)
+
+    def test_aim_idles_without_targets_in_range(self):
+        """The aiming bot should neither rotate nor fire when no asteroid is in range."""
+        self.world.add_object(Asteroid(500, 0, 0, 0))
+        handler = BotInputHandler(self.world, AimAtNearestAsteroidStrategy(max_distance=100))
+
+        handler.handle_input()
+
+        self.assertEqual(self.starship.head_angle, 0)
+        self.assertEqual(self._count_bullets(), 0)
+
+    def test_swarm_drives_many_starships(self):
+        """A swarm should add its starships to the world and pilot each of them."""
+        swarm = BotSwarm(self.world)
+        self.world.add_object(Asteroid(0, 100, 0, 0))
+        left = StarShip(-100, 100, constants.WHITE)
+        right = StarShip(100, 100, constants.WHITE)
+        swarm.add_bot(left, AimAtNearestAsteroidStrategy(turn_angle=180))
+        swarm.add_bot(right, AimAtNearestAsteroidStrategy(turn_angle=180))
+
+        swarm.handle_input()
+
+        self.assertIn(left.id, self.world.get_objects_list())
+        self.assertIn(right.id, self.world.get_objects_list())
+        self.assertEqual(left.head_angle, 0)
+        self.assertEqual(right.head_angle, 180)
+        self.assertEqual(len(swarm.bots), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
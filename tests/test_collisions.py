@@ -89,6 +89,19 @@ class CollisionHandlerTests(unittest.TestCase):
         self.assertTrue(obj1.collision_handler.called)
         self.assertTrue(obj2.collision_handler.called)
     
+    def test_handle_bullet_hitting_asteroid_removes_only_the_asteroid(self):
+        """handle() should skip the asteroid removed by the bullet collision handler."""
+        world = MockWorld()
+        bullet = Bullet(0, 0, angle_of_direction=0)
+        asteroid = Asteroid(0, 0, angle_of_direction=0, speed=0)
+        world.add_object(bullet)
+        world.add_object(asteroid)
+        handler = CollisionHandler(world)
+        
+        handler.handle()
+        
+        self.assertEqual(list(world.get_objects_list()), [bullet.id])
+    
     def test_build_collision_list_returns_empty_for_no_collisions(self):
         """_build_collision_list should return empty dict when no collisions."""
         world = MockWorld()
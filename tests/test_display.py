@@ -11,6 +11,8 @@ import tests.conftest
 from geometrytransformation2d import Vector2D
 import constants
 import display as display_module
+import graphicobjects
+from rendercommands import RenderCommandBuffer
 
 
 class DisplayTests(unittest.TestCase):
@@ -115,5 +117,170 @@ class DisplayTests(unittest.TestCase):
         self.assertEqual(disp.draw_surface, mock_surface)
 
 
+
+class DirtyRectTests(unittest.TestCase):
+    """Tests for the dirty rectangle mode of Display."""
+    
+    def setUp(self):
+        """Set up a 100x100 display pushing only the dirty rectangles."""
+        self.surface = unittest.mock.MagicMock()
+        self.disp = display_module.Display(100, 100, self.surface, dirty_rects=True)
+        self.square = [Vector2D(0, 0), Vector2D(10, 0), Vector2D(10, 10), Vector2D(0, 10)]
+    
+    def _draw_frame(self, shapes):
+        """Helper drawing a frame of (vertexes, color) shapes; return the pushed rects."""
+        self.disp.begin_frame()
+        for vertexes, color in shapes:
+            self.disp.draw_world_vertexes(vertexes, color)
+        with unittest.mock.patch('pygame.display.update') as mock_update:
+            self.disp.end_frame()
+        self.pushed = mock_update.call_args[0][0] if mock_update.called else None
+        return self.disp.last_update_rects
+    
+    def test_full_mode_pushes_whole_window(self):
+        """Without dirty rects, a frame should clear and push the whole surface."""
+        disp = display_module.Display(100, 50, self.surface)
+        
+        disp.begin_frame()
+        with unittest.mock.patch('pygame.display.update') as mock_update:
+            pixels = disp.end_frame()
+        
+        self.surface.fill.assert_called_once_with(constants.BLACK)
+        mock_update.assert_called_once_with()
+        self.assertEqual(pixels, 5000)
+    
+    def test_new_shape_pushes_its_bounding_rect(self):
+        """The first frame of a shape should push the rectangle around its lines."""
+        rects = self._draw_frame([(self.square, constants.WHITE)])
+        
+        # The square covers 50..60 on both axes, with one pixel around the lines
+        self.assertEqual(rects, [(49, 49, 13, 13)])
+        self.assertEqual(self.pushed, rects)
+        self.assertEqual(self.disp.last_pixels_pushed, 169)
+    
+    def test_unchanged_shape_pushes_nothing(self):
+        """A shape drawn again at the same place and color should not be pushed."""
+        self._draw_frame([(self.square, constants.WHITE)])
+        
+        rects = self._draw_frame([(self.square, constants.WHITE)])
+        
+        self.assertEqual(rects, [])
+        self.assertIsNone(self.pushed)
+    
+    def test_moved_shape_erases_and_pushes_old_and_new_rects(self):
+        """A moved shape should be erased in black and push its old and new rectangles."""
+        self._draw_frame([(self.square, constants.WHITE)])
+        moved = [Vector2D(vertex.x + 20, vertex.y) for vertex in self.square]
+        
+        with unittest.mock.patch('pygame.draw.lines') as mock_lines:
+            rects = self._draw_frame([(moved, constants.WHITE)])
+        
+        erase = mock_lines.call_args_list[0][0]
+        self.assertEqual((erase[1], erase[3]), (constants.BLACK, ((50, 50), (60, 50), (60, 60), (50, 60))))
+        self.assertEqual(sorted(rects), [(49, 49, 13, 13), (69, 49, 13, 13)])
+    
+    def test_color_change_and_labels_are_pushed(self):
+        """A shape changing color, and the labels, should be pushed."""
+        self._draw_frame([(self.square, constants.WHITE)])
+        label = unittest.mock.MagicMock()
+        label.get_size.return_value = (30, 12)
+        
+        self.disp.begin_frame()
+        self.disp.draw_world_vertexes(self.square, constants.RED)
+        self.disp.blit(label, (0, 0))
+        with unittest.mock.patch('pygame.display.update'):
+            self.disp.end_frame()
+        
+        self.assertIn((0, 0, 30, 12), self.disp.last_update_rects)
+        self.assertIn((49, 49, 13, 13), self.disp.last_update_rects)
+    
+    def test_shape_out_of_the_surface_pushes_nothing(self):
+        """The rectangles should be clipped to the surface; a shape out of it pushes nothing."""
+        far = [Vector2D(vertex.x + 500, vertex.y) for vertex in self.square]
+        
+        rects = self._draw_frame([(far, constants.WHITE)])
+        
+        self.assertEqual(rects, [])
+
+
+class RenderCommandsDrawTests(unittest.TestCase):
+    """Tests for the drawing of a RenderCommandBuffer by the displays."""
+    
+    def setUp(self):
+        """Set up a buffer with a 10x10 square at the origin."""
+        self.commands = RenderCommandBuffer()
+        square = (Vector2D(0, 0), Vector2D(10, 0), Vector2D(10, 10), Vector2D(0, 10))
+        self.commands.add_instances(square, [0], [0], [0], [self.commands.get_color_id(constants.WHITE)], [1])
+    
+    def test_display_draws_each_range_in_screen_coordinates(self):
+        """Display should draw the lines of each object, with the dirty rect of draw_world_vertexes."""
+        disp = display_module.Display(100, 100, unittest.mock.MagicMock(), dirty_rects=True)
+        disp.begin_frame()
+        
+        with unittest.mock.patch('pygame.draw.lines') as mock_lines:
+            disp.draw_commands(self.commands)
+        
+        args = mock_lines.call_args[0]
+        self.assertEqual(args[1], constants.WHITE)
+        self.assertEqual(args[3], [(50, 50), (60, 50), (60, 60), (50, 60)])
+        self.assertEqual(list(disp._shapes.values()), [(49, 49, 13, 13)])
+    
+    def test_recording_display_keeps_the_frames(self):
+        """RecordingDisplay should record the outlines of each frame in world coordinates."""
+        disp = display_module.RecordingDisplay(100, 100, max_frames=1)
+        
+        for _ in range(2):
+            disp.begin_frame()
+            disp.draw_commands(self.commands)
+            disp.end_frame()
+        
+        self.assertEqual(len(disp.frames), 1)
+        self.assertEqual(disp.frames[0], [(constants.WHITE, [(0, 0), (10, 0), (10, 10), (0, 10)])])
+        self.assertEqual(disp.objects_drawn, 1)
+
+
+class SpriteDrawTests(unittest.TestCase):
+    """Tests for the drawing of the objects with a sprite atlas."""
+    
+    def setUp(self):
+        """Set up a 100x100 display with an atlas returning 13x13 sprites."""
+        self.surface = unittest.mock.MagicMock()
+        self.sprite = unittest.mock.MagicMock()
+        self.sprite.get_size.return_value = (13, 13)
+        self.atlas = unittest.mock.MagicMock()
+        self.atlas.get_sprite.return_value = (self.sprite, -6, -6)
+        self.ship = graphicobjects.GraphicObject(10, -20, constants.WHITE, graphicobjects.ASTEROID_VERTEXES)
+        self.ship.rotation_angle = 30
+    
+    def test_objects_are_blitted_in_one_batch(self):
+        """Each object with vertexes should be one blit of its sprite at its screen position."""
+        disp = display_module.Display(100, 100, self.surface, sprite_atlas=self.atlas)
+        empty = graphicobjects.GraphicObject(0, 0)
+        
+        disp.draw_objects([self.ship, empty])
+        
+        self.atlas.get_sprite.assert_called_once_with(graphicobjects.ASTEROID_VERTEXES, constants.WHITE, 30)
+        self.surface.blits.assert_called_once_with([(self.sprite, (54, 24))], False)
+    
+    def test_dirty_mode_pushes_and_erases_sprite_rects(self):
+        """In dirty mode a sprite should be pushed when it appears and erased when it moves."""
+        disp = display_module.Display(100, 100, self.surface, dirty_rects=True, sprite_atlas=self.atlas)
+        disp.begin_frame()
+        disp.draw_objects([self.ship])
+        with unittest.mock.patch('pygame.display.update'):
+            disp.end_frame()
+        first_rects = disp.last_update_rects
+        self.surface.fill.reset_mock()
+        
+        self.ship.position = Vector2D(30, -20)
+        disp.begin_frame()
+        disp.draw_objects([self.ship])
+        with unittest.mock.patch('pygame.display.update'):
+            disp.end_frame()
+        
+        self.assertEqual(first_rects, [(54, 24, 13, 13)])
+        self.surface.fill.assert_called_once_with(constants.BLACK, (54, 24, 13, 13))
+        self.assertEqual(sorted(disp.last_update_rects), [(54, 24, 13, 13), (74, 24, 13, 13)])
+
 if __name__ == "__main__":
     unittest.main()
@@ -14,6 +14,13 @@ from Infrastructure.factories.game_object_factory import GameObjectFactory
 from Infrastructure.factories.physics_factory import PhysicsFactory
 from Main.collisions import CollisionHandler
 from Main.logic import AsteroidGenerator
+from Main.snapshot import SnapshotEncoder
+from Main.interest import InterestManager
+from Main.bots import BotSwarm, SpinAndFireStrategy, AimAtNearestAsteroidStrategy
+from Main.soak import SoakRunner
+from Main.profiling import ProfileCapture
+from Main.metrics import MetricsServer
+from Main.gccontrol import GarbageCollectorControl
 from Main.graphicobjects import StarShip, Bullet, Asteroid
 from Main.geometrytransformation2d import Vector2D, Circle
 
@@ -62,6 +69,150 @@ class SystemFactoryTests(unittest.TestCase):
         self.assertEqual(generator._countdown_counter, 50)
         self.assertEqual(generator._max_number_asteroid, 5)
     
+    def test_create_snapshot_encoder_uses_config_values(self):
+        """create_snapshot_encoder() should use the network configuration."""
+        config = MockConfiguration({
+            'network.position_scale': 4,
+            'network.snapshot_history': 16,
+        })
+        factory = SystemFactory(config)
+        
+        encoder = factory.create_snapshot_encoder(MockWorld())
+        
+        self.assertIsInstance(encoder, SnapshotEncoder)
+        self.assertEqual(encoder._position_scale, 4)
+        self.assertEqual(encoder._history_size, 16)
+    
+    def test_create_interest_manager_uses_config_values(self):
+        """create_interest_manager() should use the network configuration."""
+        config = MockConfiguration({
+            'network.interest_radius': 250,
+            'network.interest_cell_size': 32,
+        })
+        factory = SystemFactory(config)
+        
+        interest_manager = factory.create_interest_manager(MockWorld())
+        
+        self.assertIsInstance(interest_manager, InterestManager)
+        self.assertEqual(interest_manager.radius, 250)
+        self.assertEqual(interest_manager.grid.cell_size, 32)
+    
+    def test_create_bot_swarm_uses_config_values(self):
+        """create_bot_swarm() should use the bots configuration."""
+        config = MockConfiguration({'bots.cell_size': 32})
+        factory = SystemFactory(config)
+        
+        swarm = factory.create_bot_swarm(MockWorld())
+        
+        self.assertIsInstance(swarm, BotSwarm)
+        self.assertEqual(swarm._targets.cell_size, 32)
+    
+    def test_create_bot_strategy_by_name(self):
+        """create_bot_strategy() should build the named strategy and reject unknown names."""
+        config = MockConfiguration({'bots.strategy': 'spin_and_fire'})
+        factory = SystemFactory(config)
+        
+        self.assertIsInstance(factory.create_bot_strategy(), SpinAndFireStrategy)
+        self.assertIsInstance(factory.create_bot_strategy('aim_nearest'), AimAtNearestAsteroidStrategy)
+        with self.assertRaises(ValueError):
+            factory.create_bot_strategy('kamikaze')
+    
+    def test_create_soak_runner_uses_config_values(self):
+        """create_soak_runner() should use the soak configuration and the FPS."""
+        config = MockConfiguration({'soak.sample_every': 50, 'soak.top_allocators': 0, 'display.fps': 20})
+        factory = SystemFactory(config)
+        
+        runner = factory.create_soak_runner(MockWorld())
+        
+        self.assertIsInstance(runner, SoakRunner)
+        self.assertEqual(runner._sample_every, 50)
+        self.assertEqual(runner._top_allocators, 0)
+        self.assertEqual(runner._tick_seconds, 0.05)
+    
+    def test_create_profile_capture_uses_config_values(self):
+        """create_profile_capture() should use the profiling configuration."""
+        config = MockConfiguration({'profiling.frames': 60, 'profiling.top_n': 5,
+                                    'profiling.output_dir': 'captures'})
+        factory = SystemFactory(config)
+        
+        capture = factory.create_profile_capture()
+        
+        self.assertIsInstance(capture, ProfileCapture)
+        self.assertEqual(capture._frames, 60)
+        self.assertEqual(capture._top_n, 5)
+        self.assertEqual(capture._output_dir, 'captures')
+        self.assertFalse(capture.is_capturing)
+    
+    def test_create_metrics_server_uses_config_values(self):
+        """create_metrics_server() should use the metrics configuration."""
+        config = MockConfiguration({'metrics.host': '0.0.0.0', 'metrics.port': 9200})
+        factory = SystemFactory(config)
+        
+        server = factory.create_metrics_server()
+        
+        self.assertIsInstance(server, MetricsServer)
+        self.assertEqual(server._host, '0.0.0.0')
+        self.assertEqual(server._port, 9200)
+        self.assertIsNone(server.address)
+    
+    def test_create_gc_control_uses_config_values(self):
+        """create_gc_control() should use the gc configuration, unless the mode is given."""
+        config = MockConfiguration({'gc.control': True, 'gc.gen0_threshold': 5000,
+                                    'gc.gen1_threshold': 15, 'gc.full_collection_frames': 120})
+        factory = SystemFactory(config)
+        
+        gc_control = factory.create_gc_control()
+        measure_only = factory.create_gc_control(control=False)
+        
+        self.assertIsInstance(gc_control, GarbageCollectorControl)
+        self.assertTrue(gc_control.control)
+        self.assertEqual(gc_control._gen0_threshold, 5000)
+        self.assertEqual(gc_control._gen1_threshold, 15)
+        self.assertEqual(gc_control._full_collection_frames, 120)
+        self.assertFalse(measure_only.control)
+    
+    def test_create_display_uses_dirty_rects_config(self):
+        """create_display() should enable the dirty rectangles from the display configuration."""
+        factory = SystemFactory(MockConfiguration({'display.dirty_rects': True}))
+        surface = unittest.mock.MagicMock()
+        
+        disp = factory.create_display(200, 100, surface)
+        
+        self.assertTrue(disp.dirty_rects)
+        self.assertFalse(self.factory.create_display(200, 100, surface).dirty_rects)
+        self.assertEqual((disp.width, disp.height), (200, 100))
+    
+    def test_create_display_with_sprite_atlas_config(self):
+        """create_display() should give the display a sprite atlas capped by the configuration."""
+        factory = SystemFactory(MockConfiguration({'display.sprite_atlas.enabled': True,
+                                                   'display.sprite_atlas.max_bytes': 4096}))
+        
+        disp = factory.create_display(200, 100, unittest.mock.MagicMock())
+        
+        self.assertEqual(disp.sprite_atlas.max_bytes, 4096)
+        self.assertIsNone(self.factory.create_display(200, 100, unittest.mock.MagicMock()).sprite_atlas)
+    
+    def test_create_input_handler_uses_event_driven_config(self):
+        """create_input_handler() should read the events when input.event_driven is set."""
+        factory = SystemFactory(MockConfiguration({'input.event_driven': True}))
+        world = MockWorld()
+        
+        handler = factory.create_input_handler(world)
+        
+        self.assertEqual(type(handler).__name__, 'EventInputHandler')
+        self.assertEqual(type(self.factory.create_input_handler(world)).__name__, 'KeyboardInputHandler')
+        self.assertEqual(type(factory.create_input_handler(world, False)).__name__, 'KeyboardInputHandler')
+    
+    def test_create_input_handler_binds_the_configured_profile_key(self):
+        """The input handlers should request the profiles with the controls.profile key."""
+        factory = SystemFactory(MockConfiguration({'controls.profile': 'f12'}))
+        
+        with unittest.mock.patch('pygame.key.key_code', return_value=293) as key_code:
+            handler = factory.create_input_handler(MockWorld())
+        
+        key_code.assert_called_once_with('f12')
+        self.assertEqual(handler._profile_key, 293)
+    
     def test_get_fps_returns_configured_value(self):
         """get_fps() should return the configured FPS value."""
         fps = self.factory.get_fps()
@@ -90,6 +241,13 @@ class SystemFactoryTests(unittest.TestCase):
         
         self.assertEqual(width, 800)
         self.assertEqual(height, 600)
+    
+    def test_get_world_margin_uses_config_value(self):
+        """get_world_margin() should return the world bounds margin, 0 when not configured."""
+        factory = SystemFactory(MockConfiguration({'physics.world_bounds.margin': 50}))
+        
+        self.assertEqual(factory.get_world_margin(), 50.0)
+        self.assertEqual(self.factory.get_world_margin(), 0.0)
 
 
 # --- GameObjectFactory Tests ---
@@ -0,0 +1,102 @@
+"""
+Tests for the forkserver module.
+"""
+
+import os
+import unittest
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockConfiguration
+
+from server import SharedResources
+from forkserver import PreforkServer
+
+
+def _count_objects_after_ticks(world, ticks):
+    """Match main function used by the tests."""
+    for _ in range(ticks):
+        world.process(1 / 30)
+    return len(world.get_objects_list())
+
+
+def _file_inode(world, fd):
+    """Match main function returning the inode of a file descriptor of the worker, or None if closed."""
+    try:
+        return os.fstat(fd).st_ino
+    except OSError:
+        return None
+
+
+def _failing_match(world, match_spec):
+    """Match main function that raises."""
+    raise ValueError(match_spec)
+
+
+@unittest.skipUnless(hasattr(os, 'fork'), "os.fork() is not available")
+class PreforkServerTests(unittest.TestCase):
+    """Tests for PreforkServer class."""
+
+    def _create_server(self, match_main):
+        """Helper to create a server that is shut down at the end of the test."""
+        config = MockConfiguration({'game.asteroid.spawn_countdown': 1})
+        server = PreforkServer(match_main, pool_size=1, resources=SharedResources(config))
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_start_match_runs_match_in_forked_worker(self):
+        """The match should run in another process and return its result."""
+        server = self._create_server(_count_objects_after_ticks)
+
+        worker = server.start_match(5)
+        worker_pid = worker.wait_ready()
+        result = worker.join()
+
+        self.assertNotEqual(worker_pid, os.getpid())
+        # The starship and the asteroid spawned by the generator
+        self.assertEqual(result, 2)
+
+    def test_start_match_keeps_the_pool_full(self):
+        """A new idle worker should replace the one that took the match."""
+        server = self._create_server(_count_objects_after_ticks)
+        server.start()
+
+        worker = server.start_match(0)
+        idle_after_start = server.idle_workers
+        forked = server.refill()
+        result = worker.join()
+
+        # The replacement is forked by refill(), not on the match start path
+        self.assertEqual(idle_after_start, 0)
+        self.assertEqual(forked, 1)
+        self.assertEqual(server.idle_workers, 1)
+        # join() without wait_ready() should skip the READY message: only the starship
+        self.assertEqual(result, 1)
+
+    def test_new_worker_closes_the_connections_of_running_matches(self):
+        """A worker forked while a match runs should not keep the parent side of its pipe."""
+        server = self._create_server(_file_inode)
+        running = server.start_match(-1)
+        server.refill()
+        fd = running._connection.fileno()
+        parent_inode = os.fstat(fd).st_ino
+
+        inode = server.start_match(fd).join()
+        running.join()
+
+        # Closed in the worker, or reused by another file
+        self.assertNotEqual(inode, parent_inode)
+
+    def test_join_raises_when_match_fails(self):
+        """An exception in the worker should be reported to the parent."""
+        server = self._create_server(_failing_match)
+
+        worker = server.start_match('boom')
+        worker.wait_ready()
+
+        with self.assertRaises(RuntimeError):
+            worker.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
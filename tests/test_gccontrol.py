@@ -0,0 +1,109 @@
+"""
+Tests for the gccontrol module.
+"""
+
+import gc
+import threading
+import unittest
+import unittest.mock
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+
+from gccontrol import GarbageCollectorControl
+from metrics import REGISTRY
+
+
+def get_value(name, labels=()):
+    """Helper returning the current value of a metric of the process registry."""
+    return REGISTRY.get_values()[(name, labels)]
+
+
+class GarbageCollectorControlTests(unittest.TestCase):
+    """Tests for GarbageCollectorControl class."""
+
+    def setUp(self):
+        """Save the collector state restored by each test."""
+        self.thresholds = gc.get_threshold()
+
+    def _start(self, **kwargs):
+        """Helper starting a control closed at the end of the test."""
+        gc_control = GarbageCollectorControl(**kwargs)
+        gc_control.start()
+        self.addCleanup(gc_control.close)
+        return gc_control
+
+    def test_measure_mode_counts_frame_pauses_only(self):
+        """Without control, the pauses are measured and the collector is unchanged."""
+        gc_control = self._start()
+        collections_before = get_value('gc_collections_total', (('generation', '0'),))
+
+        gc_control.frame_started()
+        gc.collect(0)
+        pause = gc_control.frame_finished()
+
+        self.assertGreater(pause, 0)
+        self.assertEqual(get_value('gc_frame_pause_seconds'), pause)
+        self.assertEqual(get_value('gc_collections_total', (('generation', '0'),)), collections_before + 1)
+        self.assertEqual(gc.get_threshold(), self.thresholds)
+        self.assertEqual(gc.get_freeze_count(), 0)
+
+    def test_frame_pause_ignores_the_collections_of_other_threads(self):
+        """A collection on another thread (the simulation one) should not be a pause of the frame."""
+        gc_control = self._start()
+
+        gc_control.frame_started()
+        collector = threading.Thread(target=gc.collect, args=(0,))
+        collector.start()
+        collector.join()
+        pause = gc_control.frame_finished()
+
+        self.assertEqual(pause, 0)
+
+    def test_control_mode_freezes_and_restores_on_close(self):
+        """In control mode, start() should freeze the heap and raise the thresholds; close() restore them."""
+        gc_control = GarbageCollectorControl(control=True, gen0_threshold=5000, gen1_threshold=15)
+
+        gc_control.start()
+        frozen = gc.get_freeze_count()
+        thresholds = gc.get_threshold()
+        gc_control.close()
+
+        self.assertGreater(frozen, 0)
+        self.assertEqual(thresholds[:2], (5000, 15))
+        self.assertGreater(thresholds[2], 1000000)
+        self.assertEqual(gc.get_threshold(), self.thresholds)
+        self.assertEqual(gc.get_freeze_count(), 0)
+        self.assertNotIn(gc_control._on_collection, gc.callbacks)
+
+    def test_full_collection_runs_in_idle_time_when_due(self):
+        """run_idle() should run the full collection after N frames, out of the frame pause."""
+        gc_control = self._start(control=True, full_collection_frames=3)
+        full_before = get_value('gc_collections_total', (('generation', '2'),))
+
+        for _ in range(3):
+            gc_control.frame_started()
+            gc_control.run_idle(1.0)
+            gc_control.frame_finished()
+
+        self.assertEqual(get_value('gc_collections_total', (('generation', '2'),)), full_before + 1)
+        self.assertEqual(gc_control.frame_pause, 0)
+
+    def test_full_collection_waits_for_enough_idle_time(self):
+        """Without idle time, the full collection should only be forced after 4 times N frames."""
+        gc_control = self._start(control=True, full_collection_frames=2)
+        # A full collection that took longer than the idle time of the frames
+        gc_control._last_duration[2] = 0.5
+        full_before = get_value('gc_collections_total', (('generation', '2'),))
+
+        for _ in range(7):
+            gc_control.run_idle(0.001)
+        full_skipped = get_value('gc_collections_total', (('generation', '2'),))
+        gc_control.run_idle(0.001)
+
+        self.assertEqual(full_skipped, full_before)
+        self.assertEqual(get_value('gc_collections_total', (('generation', '2'),)), full_before + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -139,6 +139,18 @@ class StarShipTests(unittest.TestCase):
         self.assertIsNotNone(bullet)
         self.assertIsInstance(bullet, Bullet)
 
+    def test_fire_should_start_bullet_at_nose_of_ship_away_from_origin(self):
+        """The bullet should start at the nose of the starship, wherever the starship is."""
+        ship = StarShip(-100, 100, constants.WHITE)
+        ship.rotate_object(90)
+        ship.reload_counter = 0
+        
+        bullet = ship.fire()
+        
+        # The nose (20, 0) rotated by 90 degrees is (0, 20) from the ship position
+        self.assertAlmostEqual(bullet.position.x, -100)
+        self.assertAlmostEqual(bullet.position.y, 120)
+    
     def test_fire_should_reset_reload_counter(self):
         """Firing should reset the reload counter."""
         ship = StarShip(0, 0, constants.WHITE)
@@ -205,6 +217,20 @@ class BulletTests(unittest.TestCase):
         bullet = Bullet(0, 0, angle_of_direction=0, speed=200)
         
         self.assertEqual(bullet.speed, 200)
+    
+    def test_bullet_collision_with_removed_object_should_do_nothing(self):
+        """A collision with an object already removed in the same tick should be ignored."""
+        bullet = Bullet(0, 0, angle_of_direction=0)
+        mock_world = MockWorld()
+        mock_world.add_object(bullet)
+        
+        class MockCollisionInfo:
+            first_collider_object_id = 1
+            second_collider_object_id = 99
+        
+        bullet.collision_handler(MockCollisionInfo(), mock_world)
+        
+        self.assertEqual(list(mock_world.get_objects_list()), [bullet.id])
 
 
 class AsteroidTests(unittest.TestCase):
@@ -247,6 +273,18 @@ class GraphicObjectEdgeCaseTests(unittest.TestCase):
         result = obj._compute_collision_circle()
         self.assertIsNone(result)
     
+    def test_bounding_radius_is_computed_once_and_kept_by_rotation(self):
+        """bounding_radius should be the max vertex distance, unchanged by rotation and moves."""
+        obj = GraphicObject(x=0, y=0, vertexes_local=(Vector2D(3, 4), Vector2D(-1, 0)))
+        obj.speed = 100
+        
+        obj.rotate_object(45)
+        obj.process(1)
+        
+        self.assertEqual(obj.bounding_radius, 5.0)
+        self.assertEqual(obj.collision_circle.radius, 5.0)
+        self.assertIsNone(GraphicObject().bounding_radius)
+    
     def test_rotate_object_should_wrap_around_360(self):
         """rotate_object() should wrap angle at 360 degrees."""
         obj = GraphicObject()
@@ -0,0 +1,83 @@
+"""
+Tests for the handles module.
+"""
+
+import unittest
+import unittest.mock
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+
+from handles import HandleAllocator, make_handle, handle_index, handle_generation, GENERATION_BITS
+
+
+class HandleAllocatorTests(unittest.TestCase):
+    """Tests for HandleAllocator class."""
+
+    def test_allocate_returns_distinct_non_zero_handles(self):
+        """The first handles should use consecutive slots and never be 0."""
+        allocator = HandleAllocator()
+
+        handles = [allocator.allocate() for _ in range(3)]
+
+        self.assertEqual([handle_index(handle) for handle in handles], [0, 1, 2])
+        self.assertNotIn(0, handles)
+        self.assertEqual(len(allocator), 3)
+
+    def test_released_slot_is_reused_with_a_new_generation(self):
+        """A released slot should come back with a different handle, the old one stale."""
+        allocator = HandleAllocator()
+        old = allocator.allocate()
+
+        self.assertTrue(allocator.release(old))
+        new = allocator.allocate()
+
+        self.assertEqual(handle_index(new), handle_index(old))
+        self.assertEqual(handle_generation(new), handle_generation(old) + 1)
+        self.assertFalse(allocator.is_alive(old))
+        self.assertTrue(allocator.is_alive(new))
+        self.assertFalse(allocator.release(old))
+        self.assertEqual(allocator.slot_count, 1)
+
+    def test_free_slots_are_reused_in_fifo_order(self):
+        """The slot released first should be reused first."""
+        allocator = HandleAllocator()
+        handles = [allocator.allocate() for _ in range(3)]
+        allocator.release(handles[2])
+        allocator.release(handles[0])
+
+        reused = [handle_index(allocator.allocate()) for _ in range(2)]
+
+        self.assertEqual(reused, [2, 0])
+
+    def test_generation_wraps_without_zero(self):
+        """After the last generation, a slot should start again from generation 1."""
+        allocator = HandleAllocator()
+        handle = allocator.allocate()
+        last_generation = (1 << GENERATION_BITS) - 1
+        allocator._generations[handle_index(handle)] = last_generation
+        handle = make_handle(handle_index(handle), last_generation)
+
+        allocator.release(handle)
+
+        self.assertEqual(handle_generation(allocator.allocate()), 1)
+
+    def test_allocate_beyond_max_slots_raises(self):
+        """With every slot live, allocate() should raise OverflowError."""
+        allocator = HandleAllocator(max_slots=2)
+        allocator.allocate()
+        allocator.allocate()
+
+        with self.assertRaises(OverflowError):
+            allocator.allocate()
+
+    def test_unknown_handle_is_not_alive(self):
+        """A handle of a slot never used should not be alive."""
+        allocator = HandleAllocator()
+
+        self.assertFalse(allocator.is_alive(make_handle(5, 1)))
+        self.assertFalse(allocator.release(make_handle(5, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,7 +11,7 @@ from tests.conftest import MockWorld
 
 import pygame
 import pygame.locals
-from input_handler import KeyboardInputHandler
+from input_handler import KeyboardInputHandler, EventInputHandler
 from graphicobjects import StarShip, Bullet
 from geometrytransformation2d import Vector2D
 import constants
@@ -27,6 +27,8 @@ if not hasattr(pygame.locals, 'K_SPACE'):
     pygame.locals.K_SPACE = 32
 if not hasattr(pygame.locals, 'K_ESCAPE'):
     pygame.locals.K_ESCAPE = 27
+if not hasattr(pygame.locals, 'K_p'):
+    pygame.locals.K_p = 112
 
 
 class KeyboardInputHandlerTests(unittest.TestCase):
@@ -169,6 +171,137 @@ class KeyboardInputHandlerTests(unittest.TestCase):
         
         # Both rotations should have been applied (-10 + 10 = 0)
         self.assertEqual(self.starship.rotation_angle, 0)
+    
+    @unittest.mock.patch('pygame.key.get_pressed')
+    def test_handle_input_profile_key_requests_one_capture_per_press(self, mock_get_pressed):
+        """Holding P should request a single profile capture, reported once."""
+        mock_get_pressed.return_value = self._mock_keys([pygame.locals.K_p])
+        
+        self.handler.handle_input()
+        first_request = self.handler.is_profile_requested()
+        self.handler.handle_input()
+        
+        self.assertTrue(first_request)
+        self.assertFalse(self.handler.is_profile_requested())
+    
+    @unittest.mock.patch('pygame.key.get_pressed')
+    def test_profile_key_follows_the_binding(self, mock_get_pressed):
+        """With another profile key bound, that key should request the capture and P should not."""
+        handler = KeyboardInputHandler(self.mock_world, profile_key=293)  # K_F12
+        
+        mock_get_pressed.return_value = self._mock_keys([pygame.locals.K_p])
+        handler.sample_input()
+        p_request = handler.is_profile_requested()
+        mock_get_pressed.return_value = self._mock_keys([293])
+        handler.sample_input()
+        
+        self.assertFalse(p_request)
+        self.assertTrue(handler.is_profile_requested())
+
+    
+    @unittest.mock.patch('pygame.key.get_pressed')
+    def test_sample_input_queues_a_command_without_touching_the_world(self, mock_get_pressed):
+        """sample_input() should only queue the command; the command handler applies it."""
+        mock_get_pressed.return_value = self._mock_keys([100, 32])  # K_d, K_SPACE
+        self.starship.reload_counter = 0
+        
+        with unittest.mock.patch.multiple(pygame.locals, K_a=97, K_d=100, K_SPACE=32):
+            self.handler.sample_input()
+        queued = len(self.handler.commands)
+        angle_before = self.starship.rotation_angle
+        self.handler.get_command_handler().handle_input()
+        
+        self.assertEqual(queued, 1)
+        self.assertEqual(angle_before, 0)
+        self.assertEqual(self.starship.rotation_angle, 10)
+        self.assertEqual(len(self.mock_world.get_objects_list()), 2)
+
+
+# The real key and event codes, the mocked pygame.locals having none
+KEY_CODES = {'K_a': 97, 'K_d': 100, 'K_SPACE': 32, 'K_q': 113, 'K_ESCAPE': 27, 'K_p': 112, 'K_F12': 293,
+             'KEYDOWN': 768, 'KEYUP': 769, 'QUIT': 256}
+
+
+def key_event(event_type, key=None):
+    """Helper creating a keyboard event."""
+    return unittest.mock.Mock(type=KEY_CODES[event_type], key=KEY_CODES.get(key))
+
+
+class EventInputHandlerTests(unittest.TestCase):
+    """Tests for EventInputHandler class."""
+    
+    def setUp(self):
+        """Set up a world with a starship and a handler with a manual clock."""
+        patcher = unittest.mock.patch.multiple(pygame.locals, **KEY_CODES)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_world = MockWorld()
+        self.starship = StarShip(0, 0, constants.WHITE)
+        self.mock_world.starship = self.starship
+        self.mock_world.add_object(self.starship)
+        self.now = 0.0
+        self.handler = EventInputHandler(self.mock_world, clock=lambda: self.now)
+    
+    def test_held_key_acts_every_tick_and_ignores_repeats(self):
+        """A held key should act once per tick, whatever the repeated KEYDOWN, until its KEYUP."""
+        self.handler.handle_events([key_event('KEYDOWN', 'K_d')])
+        self.handler.handle_input()
+        self.handler.handle_events([key_event('KEYDOWN', 'K_d'), key_event('KEYDOWN', 'K_d')])
+        self.handler.handle_input()
+        self.handler.handle_events([key_event('KEYUP', 'K_d')])
+        self.handler.handle_input()
+        
+        self.assertEqual(self.starship.rotation_angle, 20)
+        self.assertEqual(self.handler.held_actions, 0)
+    
+    def test_key_tapped_between_two_ticks_acts_once(self):
+        """A key pressed and released before the tick should still give its action, once."""
+        self.handler.handle_events([key_event('KEYDOWN', 'K_a'), key_event('KEYUP', 'K_a')])
+        
+        self.handler.handle_input()
+        self.handler.handle_input()
+        
+        self.assertEqual(self.starship.rotation_angle, 350)
+    
+    def test_latency_of_a_press_starts_at_its_keydown(self):
+        """The command of a new press should be stamped when its KEYDOWN was received."""
+        command_handler = self.handler.get_command_handler()
+        command_handler.history = []
+        self.now = 1.0
+        self.handler.handle_events([key_event('KEYDOWN', 'K_SPACE')])
+        
+        self.now = 1.025
+        self.handler.sample_input()
+        self.now = 1.03
+        command_handler.handle_input()
+        self.handler.sample_input()
+        command_handler.handle_input()
+        
+        pressed, held = command_handler.history
+        self.assertTrue(pressed.fire)
+        self.assertAlmostEqual(pressed.latency, 0.03)
+        self.assertEqual(held.timestamp, 1.03)
+        self.assertEqual(held.latency, 0)
+    
+    def test_exit_on_quit_event_and_exit_keys(self):
+        """The window QUIT event and the Q/ESCAPE keys should request the exit."""
+        for events in ([key_event('QUIT')], [key_event('KEYDOWN', 'K_q')], [key_event('KEYDOWN', 'K_ESCAPE')]):
+            handler = EventInputHandler(self.mock_world)
+            
+            handler.handle_events(events)
+            
+            self.assertTrue(handler.is_exit_requested())
+    
+    def test_profile_key_follows_the_binding(self):
+        """With another profile key bound, its KEYDOWN should request the capture and P should not."""
+        handler = EventInputHandler(self.mock_world, profile_key=KEY_CODES['K_F12'])
+        
+        handler.handle_events([key_event('KEYDOWN', 'K_p')])
+        p_request = handler.is_profile_requested()
+        handler.handle_events([key_event('KEYDOWN', 'K_F12')])
+        
+        self.assertFalse(p_request)
+        self.assertTrue(handler.is_profile_requested())
 
 
 if __name__ == "__main__":
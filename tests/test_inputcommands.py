@@ -0,0 +1,113 @@
+"""
+Tests for the inputcommands module.
+"""
+
+import threading
+import time
+import unittest
+import unittest.mock
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockWorld
+
+from graphicobjects import StarShip
+import constants
+from inputcommands import InputCommand, SPSCQueue, CommandInputHandler, ReplayInputHandler
+
+
+def create_world():
+    """Helper creating a mock world with a starship ready to fire."""
+    world = MockWorld()
+    world.starship = StarShip(0, 0, constants.WHITE)
+    world.starship.reload_counter = 0
+    world.add_object(world.starship)
+    return world
+
+
+class SPSCQueueTests(unittest.TestCase):
+    """Tests for SPSCQueue class."""
+
+    def test_items_are_drained_in_order_across_the_wrap(self):
+        """drain() should return the pushed items oldest first, also after the ring wrapped."""
+        queue = SPSCQueue(capacity=3)
+        queue.push(1)
+        queue.push(2)
+        queue.drain()
+
+        for item in (3, 4, 5):
+            queue.push(item)
+
+        self.assertEqual(queue.drain(), [3, 4, 5])
+        self.assertEqual(len(queue), 0)
+
+    def test_full_queue_drops_the_item(self):
+        """push() should return False and keep the queue unchanged when it is full."""
+        queue = SPSCQueue(capacity=2)
+        queue.push(1)
+        queue.push(2)
+
+        self.assertFalse(queue.push(3))
+        self.assertEqual(queue.drain(), [1, 2])
+
+    def test_producer_and_consumer_threads(self):
+        """Items pushed by a thread should all be drained by another one, in order."""
+        queue = SPSCQueue(capacity=16)
+        count = 5000
+
+        def produce():
+            for item in range(count):
+                while not queue.push(item):
+                    time.sleep(0)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        received = []
+        while len(received) < count:
+            received.extend(queue.drain())
+            time.sleep(0)
+        producer.join()
+
+        self.assertEqual(received, list(range(count)))
+
+
+class CommandInputHandlerTests(unittest.TestCase):
+    """Tests for CommandInputHandler and ReplayInputHandler classes."""
+
+    def test_commands_are_applied_and_stamped_with_the_tick(self):
+        """handle_input() should apply the queued commands and record them with the world tick."""
+        world = create_world()
+        world.tick = 7
+        queue = SPSCQueue()
+        history = []
+        handler = CommandInputHandler(world, queue, history)
+        queue.push(InputCommand(1.0, rotation=10))
+        queue.push(InputCommand(1.1, fire=True))
+
+        handler.handle_input()
+
+        self.assertEqual(world.starship.rotation_angle, 10)
+        self.assertEqual(len(world.get_objects_list()), 2)
+        self.assertEqual([command.tick for command in history], [7, 7])
+        self.assertEqual(len(queue), 0)
+
+    def test_replay_applies_the_commands_at_their_ticks(self):
+        """A replay of the history should rotate the starship as the recorded run did."""
+        history = [InputCommand(0.0, rotation=10), InputCommand(0.1, rotation=-30)]
+        history[0].tick = 0
+        history[1].tick = 2
+        world = create_world()
+        replay = ReplayInputHandler(world, history)
+
+        angles = []
+        for tick in range(3):
+            world.tick = tick
+            replay.handle_input()
+            angles.append(world.starship.rotation_angle)
+
+        self.assertEqual(angles, [10, 10, 340])
+        self.assertTrue(replay.is_exit_requested())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Tests for the interest module.
+"""
+
+import unittest
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockWorld
+
+from graphicobjects import StarShip, Asteroid
+import constants
+from interest import InterestManager
+
+
+class InterestManagerTests(unittest.TestCase):
+    """Tests for InterestManager class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.world = MockWorld()
+        self.first_starship = StarShip(0, 0, constants.WHITE)
+        self.second_starship = StarShip(1000, 0, constants.WHITE)
+        self.world.add_object(self.first_starship)
+        self.world.add_object(self.second_starship)
+        self.interest_manager = InterestManager(self.world, radius=100, cell_size=32)
+        self.interest_manager.register_client('first', self.first_starship)
+        self.interest_manager.register_client('second', self.second_starship)
+
+    def test_interest_set_contains_only_objects_near_the_starship(self):
+        """Each client should receive only the objects around its starship."""
+        near_asteroid = Asteroid(50, 50, 0, 10)
+        far_asteroid = Asteroid(950, 0, 0, 10)
+        self.world.add_object(near_asteroid)
+        self.world.add_object(far_asteroid)
+
+        self.interest_manager.update()
+
+        self.assertEqual(sorted(self.interest_manager.get_interest_set('first')),
+                         sorted([self.first_starship.id, near_asteroid.id]))
+        self.assertEqual(sorted(self.interest_manager.get_interest_set('second')),
+                         sorted([self.second_starship.id, far_asteroid.id]))
+
+    def test_interest_set_follows_moved_objects_after_update(self):
+        """The grid should reflect the object positions at the last update()."""
+        asteroid = Asteroid(500, 0, 180, 450)
+        self.world.add_object(asteroid)
+        self.interest_manager.update()
+        self.assertNotIn(asteroid.id, self.interest_manager.get_interest_set('first'))
+
+        asteroid.process(1)
+        self.interest_manager.update()
+
+        self.assertIn(asteroid.id, self.interest_manager.get_interest_set('first'))
+
+    def test_interest_set_always_contains_own_starship(self):
+        """The client starship should be sent even before the first update()."""
+        result = self.interest_manager.get_interest_set('first')
+
+        self.assertEqual(result, [self.first_starship.id])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests for the latency module.
+"""
+
+import unittest
+import unittest.mock
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockGameObjectFactory, MockSystemFactory
+
+from engines import Engine, World
+from inputcommands import InputCommand, SPSCQueue, CommandInputHandler
+from latency import InputLatencyTracker
+from pipeline import SimulationLoop
+
+
+def create_command(timestamp, tick, latency=0.0):
+    """Helper creating a command applied by a tick."""
+    command = InputCommand(timestamp, 10)
+    command.tick = tick
+    command.latency = latency
+    return command
+
+
+class InputLatencyTrackerTests(unittest.TestCase):
+    """Tests for InputLatencyTracker class."""
+
+    def setUp(self):
+        """Set up a tracker."""
+        self.tracker = InputLatencyTracker()
+
+    def test_frame_records_the_inputs_of_the_ticks_it_shows(self):
+        """frame_presented() should time the commands consumed before its tick, from their timestamp."""
+        self.tracker.commands_applied([create_command(1.0, 4, 0.02)])
+        self.tracker.commands_applied([create_command(1.03, 5)])
+
+        shown = self.tracker.frame_presented(5, presented_time=1.1)
+
+        self.assertEqual(shown, 1)
+        self.assertEqual(len(self.tracker.samples), 1)
+        self.assertEqual(self.tracker.samples[0][0], 0.02)
+        self.assertAlmostEqual(self.tracker.samples[0][1], 0.1)
+
+    def test_inputs_wait_for_the_frame_of_their_tick(self):
+        """A command not shown yet should be timed by a later frame, and only once."""
+        self.tracker.commands_applied([create_command(2.0, 7)])
+
+        before = self.tracker.frame_presented(7, presented_time=2.05)
+        shown = self.tracker.frame_presented(9, presented_time=2.1)
+        after = self.tracker.frame_presented(10, presented_time=2.2)
+
+        self.assertEqual((before, shown, after), (0, 1, 0))
+        self.assertAlmostEqual(self.tracker.samples[0][1], 0.1)
+
+    def test_format_reports_the_percentiles(self):
+        """format() should give the distribution of both stages, in milliseconds."""
+        for index in range(100):
+            self.tracker.commands_applied([create_command(0.0, index, 0.001)])
+            self.tracker.frame_presented(index + 1, presented_time=(index + 1) / 1000)
+
+        action, photon = self.tracker.get_percentiles()
+        text = self.tracker.format()
+
+        self.assertEqual(action, [0.001] * 4)
+        self.assertAlmostEqual(photon[0], 0.05, places=2)
+        self.assertEqual(photon[3], 0.1)
+        self.assertIn("input to photon       100     51.0     95.0     99.0    100.0", text)
+        self.assertEqual(InputLatencyTracker().format(), "No input presented")
+
+    def test_pipelined_render_frame_presents_the_applied_input(self):
+        """The command applied by the simulation tick should be timed by the render frame showing the tick."""
+        world = World((100, 100), MockGameObjectFactory(), MockSystemFactory())
+        commands = SPSCQueue()
+        command_handler = CommandInputHandler(world, commands)
+        command_handler.input_latency = self.tracker
+        engine = Engine(unittest.mock.MagicMock(), world, command_handler, input_latency=self.tracker)
+        simulation = SimulationLoop(world, command_handler, 30)
+        commands.push(InputCommand(self.tracker.clock(), 10))
+
+        simulation.run_tick()
+        engine.run_render_frame(simulation.frames, 0, unittest.mock.MagicMock())
+
+        self.assertEqual(len(self.tracker.samples), 1)
+        self.assertGreaterEqual(self.tracker.samples[0][1], self.tracker.samples[0][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+Tests for the metrics module.
+"""
+
+import unittest
+import unittest.mock
+import urllib.request
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockWorld, MockGameObjectFactory, MockSystemFactory
+
+import constants
+import metrics
+import Main.metrics
+from metrics import MetricsRegistry, MetricsServer, REGISTRY
+from graphicobjects import GraphicObject, StarShip
+from geometrytransformation2d import Vector2D
+from collisions import CollisionHandler
+from engines import World
+
+
+def get_value(name, labels=()):
+    """Helper returning the current value of a metric of the process registry."""
+    return REGISTRY.get_values()[(name, labels)]
+
+
+class MetricsRegistryTests(unittest.TestCase):
+    """Tests for MetricsRegistry class."""
+
+    def test_counter_is_created_once_per_name_and_labels(self):
+        """counter() should return the same counter for the same name and labels."""
+        registry = MetricsRegistry()
+
+        first = registry.counter('spawns_total', 'Spawns', {'kind': 'asteroid'})
+        second = registry.counter('spawns_total', 'Spawns', {'kind': 'asteroid'})
+        other = registry.counter('spawns_total', 'Spawns', {'kind': 'bullet'})
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_name_registered_with_another_type_raises(self):
+        """A gauge with the name of a counter should raise ValueError."""
+        registry = MetricsRegistry()
+        registry.counter('objects', 'Objects')
+
+        with self.assertRaises(ValueError):
+            registry.gauge('objects', 'Objects')
+
+    def test_render_prometheus_text_format(self):
+        """render_prometheus() should write HELP, TYPE and a line per labelled value."""
+        registry = MetricsRegistry()
+        registry.counter('spawns_total', 'Spawns', {'kind': 'asteroid'}).inc(3)
+        registry.counter('spawns_total', 'Spawns', {'kind': 'bullet'}).inc()
+        registry.gauge('world_objects', 'Objects').set(7)
+
+        text = registry.render_prometheus()
+
+        self.assertEqual(text,
+                         '# HELP spawns_total Spawns\n'
+                         '# TYPE spawns_total counter\n'
+                         'spawns_total{kind="asteroid"} 3\n'
+                         'spawns_total{kind="bullet"} 1\n'
+                         '# HELP world_objects Objects\n'
+                         '# TYPE world_objects gauge\n'
+                         'world_objects 7\n')
+
+    def test_reset_sets_values_to_zero(self):
+        """reset() should set all the values to zero and keep the metrics."""
+        registry = MetricsRegistry()
+        counter = registry.counter('spawns_total', 'Spawns')
+        counter.inc(5)
+
+        registry.reset()
+
+        self.assertEqual(counter.value, 0)
+        self.assertEqual(registry.get_values(), {('spawns_total', ()): 0})
+
+    def test_registry_is_shared_by_both_module_names(self):
+        """The game modules and the factories should increment the same registry."""
+        self.assertIs(metrics.REGISTRY, Main.metrics.REGISTRY)
+
+
+class HotPathCountersTests(unittest.TestCase):
+    """Tests for the counters incremented by the game code."""
+
+    def _create_square_object(self, x, y, size=10):
+        """Helper to create a square GraphicObject."""
+        half = size / 2
+        vertexes = [
+            Vector2D(half, half), Vector2D(half, -half),
+            Vector2D(-half, -half), Vector2D(-half, half)
+        ]
+        return GraphicObject(x=x, y=y, vertexes_local=vertexes)
+
+    def test_collision_handler_counts_pair_tests_and_intersections(self):
+        """Each pair tested and each intersecting pair should be counted."""
+        world = MockWorld()
+        world.add_object(self._create_square_object(0, 0, size=20))
+        world.add_object(self._create_square_object(5, 5, size=20))
+        world.add_object(self._create_square_object(100, 100))
+        tests_before = get_value('collision_pair_tests_total')
+        intersecting_before = get_value('collision_intersecting_pairs_total')
+
+        CollisionHandler(world)._build_collision_list()
+
+        # 1-2 collide, then 1-3; the objects already colliding are not tested again
+        self.assertEqual(get_value('collision_pair_tests_total') - tests_before, 2)
+        self.assertEqual(get_value('collision_intersecting_pairs_total') - intersecting_before, 1)
+
+    def test_world_counts_spawns_ticks_and_objects(self):
+        """add_object and process should update the world counters and the gauge."""
+        world = World((1000, 1000), MockGameObjectFactory(), MockSystemFactory())
+        spawned_before = get_value('objects_spawned_total')
+        ticks_before = get_value('world_ticks_total')
+
+        world.add_object(GraphicObject())
+        world.add_object(GraphicObject())
+        world.process(1 / 30)
+
+        self.assertEqual(get_value('objects_spawned_total') - spawned_before, 2)
+        self.assertEqual(get_value('world_ticks_total') - ticks_before, 1)
+        self.assertEqual(get_value('world_objects'), len(world.get_objects_list()))
+
+    def test_world_counts_culled_objects(self):
+        """The objects removed out of the world bounds should be counted."""
+        world = World((100, 100), MockGameObjectFactory(), MockSystemFactory())
+        world.add_object(GraphicObject(x=5000, y=5000))
+        culled_before = get_value('objects_culled_total')
+
+        world.process(1 / 30)
+
+        self.assertEqual(get_value('objects_culled_total') - culled_before, 1)
+
+    def test_world_counts_the_bullets_entering_it(self):
+        """A bullet should be counted when added or spawned in the world, not when fired."""
+        world = World((100, 100), MockGameObjectFactory(), MockSystemFactory())
+        starship = StarShip(0, 0, constants.WHITE)
+        starship.reload_counter = 0
+        fired_before = get_value('bullets_fired_total')
+
+        bullet = starship.fire()
+        fired_only = get_value('bullets_fired_total')
+        world.add_object(bullet)
+        starship.reload_counter = 0
+        world.spawn_object(starship.fire())
+        world.add_object(GraphicObject())
+        world.apply_pending_changes()
+
+        self.assertEqual(fired_only, fired_before)
+        self.assertEqual(get_value('bullets_fired_total') - fired_before, 2)
+
+
+class MetricsServerTests(unittest.TestCase):
+    """Tests for MetricsServer class."""
+
+    def test_server_serves_registry_on_metrics_path(self):
+        """GET /metrics should return the registry in the Prometheus text format."""
+        registry = MetricsRegistry()
+        registry.counter('frames_total', 'Frames').inc(42)
+        server = MetricsServer(registry, port=0)
+        server.start()
+        self.addCleanup(server.stop)
+        host, port = server.address[:2]
+
+        with urllib.request.urlopen('http://%s:%d/metrics' % (host, port), timeout=5) as response:
+            content_type = response.headers['Content-Type']
+            body = response.read().decode('utf-8')
+
+        self.assertTrue(content_type.startswith('text/plain'))
+        self.assertIn('frames_total 42\n', body)
+
+
+if __name__ == '__main__':
+    unittest.main()
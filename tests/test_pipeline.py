@@ -0,0 +1,152 @@
+"""
+Tests for the pipeline module.
+"""
+
+import unittest
+import unittest.mock
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockGameObjectFactory, MockSystemFactory
+
+from engines import Engine, World
+from gccontrol import GarbageCollectorControl
+from metrics import REGISTRY
+from pipeline import TripleBuffer, SimulationLoop
+
+
+def create_input_handler(exit_after=None):
+    """Helper creating an input handler requesting the exit after a number of calls."""
+    input_handler = unittest.mock.MagicMock()
+    if exit_after is None:
+        input_handler.is_exit_requested.return_value = False
+    else:
+        input_handler.is_exit_requested.side_effect = lambda: input_handler.handle_input.call_count >= exit_after
+    return input_handler
+
+
+class TripleBufferTests(unittest.TestCase):
+    """Tests for TripleBuffer class."""
+
+    def setUp(self):
+        """Set up a triple buffer of plain objects."""
+        self.frames = TripleBuffer(factory=object)
+
+    def test_consumer_gets_the_published_buffer(self):
+        """acquire_latest() should return the buffer written before publish()."""
+        written = self.frames.begin_write()
+
+        self.frames.publish()
+        read = self.frames.acquire_latest(timeout=0)
+
+        self.assertIs(read, written)
+        self.assertIsNot(self.frames.begin_write(), read)
+
+    def test_producer_never_writes_the_buffer_being_read(self):
+        """While the consumer holds a buffer, the producer should alternate between the two others."""
+        self.frames.publish()
+        read = self.frames.acquire_latest(timeout=0)
+
+        written = []
+        for _ in range(4):
+            written.append(self.frames.begin_write())
+            self.frames.publish()
+
+        self.assertNotIn(read, written)
+        self.assertEqual(len(set(map(id, written))), 2)
+
+    def test_consumer_gets_the_newest_frame(self):
+        """A frame published before the previous one was read should replace it."""
+        self.frames.publish()
+        newest = self.frames.begin_write()
+        self.frames.publish()
+
+        self.assertIs(self.frames.acquire_latest(timeout=0), newest)
+        self.assertIsNone(self.frames.acquire_latest(timeout=0))
+
+
+class SimulationLoopTests(unittest.TestCase):
+    """Tests for SimulationLoop class."""
+
+    def setUp(self):
+        """Set up a world with the mock factories."""
+        self.world = World((100, 100), MockGameObjectFactory(), MockSystemFactory())
+
+    def test_tick_updates_the_world_and_publishes_a_snapshot(self):
+        """run_tick() should handle the input, process the world and publish its outlines."""
+        input_handler = create_input_handler()
+        simulation = SimulationLoop(self.world, input_handler, 30)
+
+        simulation.run_tick()
+        snapshot = simulation.frames.acquire_latest(timeout=0)
+
+        input_handler.handle_input.assert_called_once()
+        self.assertEqual(snapshot.tick, 1)
+        self.assertEqual(snapshot.object_count, len(self.world.get_objects_list()))
+        self.assertEqual(snapshot.commands.object_ids.tolist(), [self.world.starship.id])
+
+    def test_thread_stops_on_exit_request(self):
+        """The simulation thread should end by itself when the input handler requests the exit."""
+        simulation = SimulationLoop(self.world, create_input_handler(exit_after=3), 1000)
+
+        simulation.start()
+        simulation._thread.join(timeout=5)
+
+        self.assertFalse(simulation.running)
+        self.assertTrue(simulation.exit_requested)
+        self.assertEqual(simulation.ticks, 3)
+        simulation.stop()
+
+    def test_stop_raises_the_error_of_the_thread(self):
+        """An exception in the simulation thread should request the exit and be raised by stop()."""
+        input_handler = create_input_handler()
+        input_handler.handle_input.side_effect = RuntimeError("broken input")
+        simulation = SimulationLoop(self.world, input_handler, 1000)
+
+        simulation.start()
+        simulation._thread.join(timeout=5)
+
+        self.assertTrue(simulation.exit_requested)
+        with self.assertRaises(RuntimeError):
+            simulation.stop()
+
+    def test_full_collections_run_in_the_wait_between_ticks(self):
+        """In control mode, the simulation thread should run the full collections in its idle time."""
+        gc_control = GarbageCollectorControl(control=True, full_collection_frames=2)
+        gc_control.start()
+        self.addCleanup(gc_control.close)
+        simulation = SimulationLoop(self.world, create_input_handler(exit_after=4), 20, gc_control=gc_control)
+        full_key = ('gc_collections_total', (('generation', '2'),))
+        full_before = REGISTRY.get_values()[full_key]
+
+        simulation.start()
+        simulation._thread.join(timeout=5)
+        simulation.stop()
+
+        self.assertEqual(simulation.ticks, 4)
+        self.assertEqual(REGISTRY.get_values()[full_key], full_before + 2)
+
+
+class RenderFrameTests(unittest.TestCase):
+    """Tests for the render frames of the pipelined Engine."""
+
+    def test_render_frame_draws_the_snapshot(self):
+        """run_render_frame() should draw the latest snapshot, with its object count on the label."""
+        world = World((100, 100), MockGameObjectFactory(), MockSystemFactory())
+        display = unittest.mock.MagicMock()
+        engine = Engine(display, world, create_input_handler())
+        simulation = SimulationLoop(world, create_input_handler(), 30)
+        simulation.run_tick()
+        font = unittest.mock.MagicMock()
+
+        snapshot = engine.run_render_frame(simulation.frames, 0, font)
+        missing = engine.run_render_frame(simulation.frames, 0, font)
+
+        display.draw_commands.assert_called_once_with(snapshot.commands)
+        font.render.assert_called_once_with("Objects: 1", 1, (255, 255, 255))
+        display.end_frame.assert_called_once()
+        self.assertIsNone(missing)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Tests for the prediction module.
+"""
+
+import unittest
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockWorld
+
+from graphicobjects import StarShip
+import constants
+from snapshot import SnapshotEncoder, EntityState, ENTITY_KINDS
+from prediction import ClientPrediction, SnapshotInterpolator, NetworkClient
+from metrics import REGISTRY
+
+TICK_SECONDS = 1 / 30
+
+
+def _ship_state(x, y, rotation_angle):
+    """Helper to build the server state of a starship."""
+    return EntityState(1, ENTITY_KINDS['StarShip'], x, y, rotation_angle, rotation_angle)
+
+
+class ClientPredictionTests(unittest.TestCase):
+    """Tests for ClientPrediction class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.starship = StarShip(0, 0, constants.WHITE)
+        self.prediction = ClientPrediction(self.starship, TICK_SECONDS)
+
+    def test_apply_input_rotates_starship_immediately(self):
+        """The local input should be visible without waiting for the server."""
+        self.prediction.apply_input(1, 10, False)
+
+        self.assertEqual(self.starship.rotation_angle, 10)
+        self.assertEqual(self.prediction.pending_inputs, 1)
+
+    def test_apply_input_returns_predicted_bullet(self):
+        """Firing should return the bullet when the starship is not reloading."""
+        self.starship.reload_counter = 0
+
+        bullet = self.prediction.apply_input(1, 0, True)
+
+        self.assertIsNotNone(bullet)
+
+    def test_reconcile_with_correct_prediction_skips_replay(self):
+        """A server state equal to the prediction should not re-simulate."""
+        for tick in range(1, 4):
+            self.prediction.apply_input(tick, 10, False)
+
+        self.prediction.reconcile(1, _ship_state(0, 0, 10))
+
+        self.assertEqual(self.prediction.replayed_ticks, 0)
+        self.assertEqual(self.prediction.pending_inputs, 2)
+        self.assertEqual(self.starship.rotation_angle, 30)
+
+    def test_reconcile_with_wrong_prediction_replays_pending_inputs(self):
+        """The pending inputs should be applied again on top of the server state."""
+        for tick in range(1, 4):
+            self.prediction.apply_input(tick, 10, False)
+
+        self.prediction.reconcile(1, _ship_state(5, 0, 20))
+
+        self.assertEqual(self.prediction.replayed_ticks, 2)
+        self.assertEqual(self.starship.rotation_angle, 40)
+        self.assertAlmostEqual(self.starship.position.x, 5)
+
+    def test_reconcile_restores_reload_counter_of_first_pending_input(self):
+        """The re-simulated fire should respect the reload state at that tick."""
+        self.starship.reload_counter = 0
+        self.prediction.apply_input(1, 0, False)
+        self.prediction.apply_input(2, 0, True)
+
+        self.prediction.reconcile(1, _ship_state(1, 0, 0))
+
+        # Fired again during the replay, then one tick of reload
+        self.assertEqual(self.starship.reload_counter, StarShip.RELOAD_COUNTER_DEFAULT_VALUE - 1)
+
+    def test_replayed_fire_is_not_counted_again(self):
+        """The bullets of the replayed inputs should not be added to bullets_fired_total."""
+        bullets_fired = REGISTRY.counter('bullets_fired_total', 'Bullets fired by the starships')
+        self.starship.reload_counter = 0
+        self.prediction.apply_input(1, 0, False)
+        self.prediction.apply_input(2, 0, True)
+        fired_before = bullets_fired.value
+
+        self.prediction.reconcile(1, _ship_state(1, 0, 0))
+
+        self.assertEqual(self.prediction.replayed_ticks, 1)
+        self.assertEqual(bullets_fired.value, fired_before)
+
+
+class SnapshotInterpolatorTests(unittest.TestCase):
+    """Tests for SnapshotInterpolator class."""
+
+    def test_sample_interpolates_between_snapshots(self):
+        """Position and angles should be interpolated at the delayed tick."""
+        interpolator = SnapshotInterpolator(delay_ticks=2)
+        interpolator.push(10, {7: EntityState(7, 3, 0, 0, 350, 350)})
+        interpolator.push(12, {7: EntityState(7, 3, 20, 10, 10, 10)})
+
+        result = interpolator.sample(13)
+
+        self.assertAlmostEqual(result[7].x, 10)
+        self.assertAlmostEqual(result[7].y, 5)
+        self.assertEqual(result[7].rotation_angle, 0)
+
+    def test_sample_after_last_snapshot_returns_last_state(self):
+        """Without newer snapshots the entities should not be extrapolated."""
+        interpolator = SnapshotInterpolator(delay_ticks=0)
+        interpolator.push(10, {7: EntityState(7, 3, 0, 0, 0, 0)})
+        interpolator.push(11, {7: EntityState(7, 3, 10, 0, 0, 0)})
+
+        result = interpolator.sample(20)
+
+        self.assertAlmostEqual(result[7].x, 10)
+
+
+class NetworkClientTests(unittest.TestCase):
+    """Tests for NetworkClient class."""
+
+    def test_receive_reconciles_own_starship_and_returns_ack(self):
+        """The own starship should come from the prediction, not from the snapshot."""
+        world = MockWorld()
+        server_starship = StarShip(0, 0, constants.WHITE)
+        world.add_object(server_starship)
+        encoder = SnapshotEncoder(world)
+        encoder.add_client(1)
+        client = NetworkClient(StarShip(0, 0, constants.WHITE), server_starship.id, TICK_SECONDS)
+
+        client.apply_input(1, 10, False)
+        server_starship.rotate_object(10)
+        encoder.begin_tick(1)
+        ack = client.receive(bytes(encoder.encode_for_client(1)))
+
+        self.assertEqual(ack, 1)
+        self.assertEqual(client.prediction.starship.rotation_angle, 10)
+        self.assertNotIn(server_starship.id, client.get_entities(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Tests for the profiling module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockGameObjectFactory, MockSystemFactory
+
+from profiling import ProfileCapture
+from engines import Engine, World
+
+
+def busy_function():
+    """A function that should appear in the profile."""
+    return sum(range(1000))
+
+
+class ProfileCaptureTests(unittest.TestCase):
+    """Tests for ProfileCapture class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir)
+        self.capture = ProfileCapture(self.output_dir, frames=3, top_n=10)
+
+    def _run_frames(self, count):
+        """Helper running frames of busy work around the capture."""
+        for _ in range(count):
+            self.capture.frame_started()
+            busy_function()
+            self.capture.frame_finished()
+
+    def test_no_capture_until_requested(self):
+        """Frames should not be profiled without a request."""
+        self._run_frames(5)
+
+        self.assertFalse(self.capture.is_capturing)
+        self.assertEqual(os.listdir(self.output_dir), [])
+
+    def test_capture_dumps_profile_and_summary_after_n_frames(self):
+        """A capture should last N frames, then write the .prof and the cumulative summary."""
+        self.capture.request(2)
+
+        self._run_frames(1)
+        self.assertTrue(self.capture.is_capturing)
+        self._run_frames(1)
+
+        self.assertFalse(self.capture.is_capturing)
+        profile_path, summary_path = self.capture.last_dump
+        self.assertTrue(os.path.isfile(profile_path))
+        with open(summary_path) as summary_file:
+            summary = summary_file.read()
+        self.assertIn('cumulative', summary)
+        self.assertIn('busy_function', summary)
+
+    def test_request_is_ignored_while_capturing(self):
+        """A request during a capture should not extend it."""
+        self.capture.request()
+        self._run_frames(1)
+
+        self.capture.request(100)
+        self._run_frames(2)
+
+        self.assertFalse(self.capture.is_capturing)
+        self.assertEqual(len(os.listdir(self.output_dir)), 2)
+
+    def test_close_dumps_a_running_capture(self):
+        """close() should write the frames captured so far."""
+        self.capture.request(100)
+        self._run_frames(1)
+
+        self.capture.close()
+
+        self.assertFalse(self.capture.is_capturing)
+        self.assertIsNotNone(self.capture.last_dump)
+
+    def test_engine_starts_capture_on_the_frame_after_the_request(self):
+        """The profile request of the input handler should start a capture at the next frame."""
+        world = World((100, 100), MockGameObjectFactory(), MockSystemFactory())
+        input_handler = unittest.mock.MagicMock()
+        input_handler.is_exit_requested.return_value = False
+        input_handler.is_profile_requested.side_effect = [True, False]
+        engine = Engine(unittest.mock.MagicMock(), world, input_handler, profile_capture=self.capture)
+        fps_clock = unittest.mock.MagicMock()
+        fps_clock.tick.return_value = 33
+
+        engine.run_frame(fps_clock, 30, unittest.mock.MagicMock())
+        self.assertFalse(self.capture.is_capturing)
+        engine.run_frame(fps_clock, 30, unittest.mock.MagicMock())
+
+        self.assertTrue(self.capture.is_capturing)
+        self.capture.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Tests for the rasterizer module.
+"""
+
+import unittest
+import unittest.mock
+
+import numpy as np
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockGameObjectFactory, MockSystemFactory
+
+from graphicobjects import GraphicObject, StarShip, Bullet
+from geometrytransformation2d import Vector2D
+from engines import World
+from rasterizer import ObservationRasterizer, OUTLINE_VALUE
+import constants
+
+
+class ObservationRasterizerTests(unittest.TestCase):
+    """Tests for ObservationRasterizer class."""
+
+    def _create_world(self):
+        """Helper to create a 100x100 World without objects."""
+        world = World((100, 100), MockGameObjectFactory(), MockSystemFactory())
+        world.get_objects_list().clear()
+        return world
+
+    def _add_square(self, world, x, y, half_size):
+        """Helper to add a square object to the world."""
+        world.add_object(GraphicObject(x=x, y=y, vertexes_local=(
+            Vector2D(half_size, half_size), Vector2D(-half_size, half_size),
+            Vector2D(-half_size, -half_size), Vector2D(half_size, -half_size))))
+
+    def test_render_draws_outline_and_leaves_inside_empty(self):
+        """The square outline should be drawn, not filled."""
+        world = self._create_world()
+        self._add_square(world, 0, 0, 20)
+        rasterizer = ObservationRasterizer((100, 100), grid_size=(100, 100))
+        out = np.zeros((1, 100, 100), dtype=np.uint8)
+
+        rasterizer.render([world], out)
+
+        # Top side from (30, 30) to (70, 30) in grid coordinates
+        self.assertTrue((out[0, 30, 30:70] == OUTLINE_VALUE).all())
+        self.assertEqual(out[0, 50, 50], 0)
+        self.assertEqual(out[0, 10, 10], 0)
+
+    def test_render_scales_world_to_grid(self):
+        """The world should be scaled to the grid size."""
+        world = self._create_world()
+        self._add_square(world, 0, 0, 20)
+        rasterizer = ObservationRasterizer((100, 100), grid_size=(10, 10))
+        out = np.zeros((1, 10, 10), dtype=np.uint8)
+
+        rasterizer.render([world], out)
+
+        self.assertEqual(out[0, 3, 5], OUTLINE_VALUE)
+        self.assertEqual(out[0, 5, 5], 0)
+
+    def test_render_clips_outlines_outside_the_grid(self):
+        """Parts of the outline out of the grid should not wrap around."""
+        world = self._create_world()
+        self._add_square(world, 50, 0, 20)
+        rasterizer = ObservationRasterizer((100, 100), grid_size=(100, 100))
+        out = np.zeros((1, 100, 100), dtype=np.uint8)
+
+        rasterizer.render([world], out)
+
+        self.assertEqual(out[0, 30, 90], OUTLINE_VALUE)
+        self.assertFalse(out[0, :, :20].any())
+
+    def test_render_batches_worlds_in_separate_images(self):
+        """Each world should be drawn only in its own image."""
+        first = self._create_world()
+        second = self._create_world()
+        self._add_square(first, -30, 0, 5)
+        self._add_square(second, 30, 0, 5)
+        rasterizer = ObservationRasterizer((100, 100), grid_size=(100, 100))
+        out = np.full((2, 100, 100), 7, dtype=np.uint8)
+
+        rasterizer.render([first, second], out)
+
+        self.assertTrue(out[0, :, :50].any())
+        self.assertFalse(out[0, :, 50:].any())
+        self.assertTrue(out[1, :, 50:].any())
+        self.assertFalse(out[1, :, :50].any())
+
+    def test_render_grows_segment_buffers(self):
+        """More segments than the initial capacity should be drawn."""
+        world = self._create_world()
+        for index in range(10):
+            self._add_square(world, -40 + index * 9, 0, 2)
+        rasterizer = ObservationRasterizer((100, 100), grid_size=(100, 100), initial_segments=4)
+        out = np.zeros((1, 100, 100), dtype=np.uint8)
+
+        rasterizer.render([world], out)
+
+        self.assertEqual(out[0, 48, 91], OUTLINE_VALUE)
+
+    def test_render_reads_the_render_commands_in_place(self):
+        """render() should draw the outlines of the render commands, as the segments of the world objects."""
+        world = self._create_world()
+        self._add_square(world, -20, 10, 8)
+        world.add_object(StarShip(15, -5, constants.WHITE))
+        world.add_object(Bullet(30, 30, 45))
+        coordinates = []
+        world_indexes = []
+        for world_object in world.get_world_objects_list():
+            vertexes = world_object.vertexes
+            for index in range(len(vertexes) if len(vertexes) > 2 else 1):
+                end = vertexes[(index + 1) % len(vertexes)]
+                coordinates.extend((vertexes[index].x, vertexes[index].y, end.x, end.y))
+                world_indexes.append(0)
+        rasterizer = ObservationRasterizer((100, 100), grid_size=(100, 100), initial_segments=4)
+        expected = np.zeros((1, 100, 100), dtype=np.uint8)
+        rasterizer.render_segments(coordinates, world_indexes, expected)
+        out = np.zeros((1, 100, 100), dtype=np.uint8)
+
+        with unittest.mock.patch.object(world, 'get_world_objects_list') as get_world_objects_list:
+            rasterizer.render([world], out)
+            segments = rasterizer._segments
+            rasterizer.render([world], out)
+
+        get_world_objects_list.assert_not_called()
+        self.assertIs(rasterizer._segments, segments)
+        self.assertTrue((out == expected).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests for the rendercommands module.
+"""
+
+import unittest
+import unittest.mock
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+
+from geometrytransformation2d import Vector2D, from_local_to_world_coordinates
+import constants
+from rendercommands import RenderCommandBuffer
+
+SEGMENT = (Vector2D(-3, 0), Vector2D(3, 0))
+TRIANGLE = (Vector2D(10, 0), Vector2D(-5, -5), Vector2D(-5, 5))
+
+
+class RenderCommandBufferTests(unittest.TestCase):
+    """Tests for RenderCommandBuffer class."""
+
+    def test_instances_are_rotated_and_translated(self):
+        """The vertexes should match from_local_to_world_coordinates for each instance."""
+        commands = RenderCommandBuffer()
+
+        commands.add_instances(TRIANGLE, [10, -20], [5, 7], [0, 90], [0, 0], [1, 2])
+
+        expected = [from_local_to_world_coordinates(vertex, Vector2D(x, y), angle)
+                    for (x, y, angle) in ((10, 5, 0), (-20, 7, 90))
+                    for vertex in TRIANGLE]
+        for vertex, expected_vertex in zip(commands.vertexes.tolist(), expected):
+            self.assertAlmostEqual(vertex[0], expected_vertex.x)
+            self.assertAlmostEqual(vertex[1], expected_vertex.y)
+        self.assertEqual(commands.starts.tolist(), [0, 3])
+        self.assertEqual(commands.ends.tolist(), [3, 6])
+        self.assertEqual(commands.object_ids.tolist(), [1, 2])
+
+    def test_arrays_grow_and_keep_the_previous_instances(self):
+        """Adding more than the capacity should grow the arrays, keeping what was written."""
+        commands = RenderCommandBuffer(initial_vertexes=2, initial_objects=1)
+
+        commands.add_instances(SEGMENT, [0], [0], [0], [0], [7])
+        commands.add_instances(TRIANGLE, [1, 2], [0, 0], [0, 0], [1, 1], [8, 9])
+
+        self.assertEqual(commands.object_count, 3)
+        self.assertEqual(commands.vertex_count, 8)
+        self.assertEqual(commands.vertexes[:2].tolist(), [[-3, 0], [3, 0]])
+        self.assertEqual(commands.starts.tolist(), [0, 2, 5])
+        self.assertEqual(commands.object_ids.tolist(), [7, 8, 9])
+
+    def test_shape_cache_drops_the_shapes_no_longer_drawn(self):
+        """A shape should stay cached while drawn in the last frame, and be released after a frame without it."""
+        commands = RenderCommandBuffer()
+        shared = list(TRIANGLE)
+        removed = [Vector2D(1, 0), Vector2D(0, 1)]
+        commands.add_instances(shared, [0], [0], [0], [0], [1])
+        commands.add_instances(removed, [0], [0], [0], [0], [2])
+        shared_arrays = commands._get_local_shape(shared)
+
+        commands.clear()
+        commands.add_instances(shared, [0], [0], [0], [0], [1])
+        commands.clear()
+        commands.add_instances(shared, [0], [0], [0], [0], [1])
+        commands.clear()
+
+        self.assertIs(commands._get_local_shape(shared)[0], shared_arrays[0])
+        cached = [local_shape[0] for cache in (commands._local_shapes, commands._previous_shapes)
+                  for local_shape in cache.values()]
+        self.assertFalse(any(shape is removed for shape in cached))
+
+    def test_clear_keeps_capacity_and_palette(self):
+        """clear() should empty the frame without reallocating, keeping the color ids."""
+        commands = RenderCommandBuffer()
+        white = commands.get_color_id(constants.WHITE)
+        commands.add_instances(SEGMENT, [0], [0], [0], [white], [1])
+        vertex_array = commands._vertexes
+
+        commands.clear()
+
+        self.assertEqual((commands.object_count, commands.vertex_count), (0, 0))
+        self.assertIs(commands._vertexes, vertex_array)
+        self.assertEqual(commands.get_color_id(constants.RED), 1)
+        self.assertEqual(commands.get_color_id(constants.WHITE), white)
+        self.assertEqual(commands.colors, [constants.WHITE, constants.RED])
+
+
+if __name__ == '__main__':
+    unittest.main()
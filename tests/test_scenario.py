@@ -0,0 +1,110 @@
+"""
+Tests for the scenario module.
+"""
+
+import unittest
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockConfiguration
+
+from server import SharedResources
+from scenario import Scenario, load_scenario, list_scenarios, build_scenario
+
+
+def _count(world, kind_name):
+    return len([obj for obj in world.get_objects_list().values() if type(obj).__name__ == kind_name])
+
+
+class ScenarioTests(unittest.TestCase):
+    """Tests for the scenario definitions and the scenario driver."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.resources = SharedResources(MockConfiguration({'display.fps': 10}))
+
+    def test_shipped_scenarios_are_valid(self):
+        """Every shipped scenario should load and build."""
+        names = list_scenarios()
+
+        self.assertIn('bullet_storm', names)
+        for name in names:
+            scenario = load_scenario(name)
+            world, driver = build_scenario(scenario, self.resources)
+            self.assertEqual(scenario.name, name)
+            self.assertGreater(len(world.get_objects_list()), 1)
+
+    def test_invalid_definitions_raise_value_error(self):
+        """Unknown kinds, distributions, bots and bad ranges should be rejected."""
+        invalid_populations = [
+            {'kind': 'comet'},
+            {'kind': 'asteroid', 'distribution': {'type': 'spiral'}},
+            {'kind': 'asteroid', 'bot': 'aim_nearest'},
+            {'kind': 'asteroid', 'speed': [20, 10]},
+            {'kind': 'bullet', 'rate': -1},
+        ]
+        for population in invalid_populations:
+            with self.assertRaises(ValueError):
+                Scenario({'populations': [population]})
+        with self.assertRaises(ValueError):
+            load_scenario('no_such_scenario')
+
+    def test_populate_spawns_counts_through_the_factory(self):
+        """build_scenario() should spawn the initial counts, without the default asteroid."""
+        scenario = Scenario({'world_size': [400, 400], 'populations': [
+            {'kind': 'asteroid', 'count': 5, 'speed': [1, 2]},
+            {'kind': 'starship', 'count': 3, 'bot': 'spin_and_fire'},
+        ]})
+
+        world, driver = build_scenario(scenario, self.resources)
+        for _ in range(40):
+            world.process(0.1)
+
+        self.assertEqual(_count(world, 'Asteroid'), 5)
+        self.assertEqual(_count(world, 'StarShip'), 4)
+        self.assertEqual(len(driver.swarm.bots), 3)
+
+    def test_rate_and_respawn_keep_the_load(self):
+        """Rate populations should spawn per second; respawn should refill removed objects."""
+        scenario = Scenario({'world_size': [400, 400], 'populations': [
+            {'kind': 'asteroid', 'count': 4, 'respawn': True, 'speed': 0},
+            {'kind': 'bullet', 'rate': 25, 'speed': 0},
+        ]})
+        world, driver = build_scenario(scenario, self.resources)
+        asteroid_id = next(object_id for object_id, obj in world.get_objects_list().items()
+                           if type(obj).__name__ == 'Asteroid')
+
+        world.remove_object(asteroid_id)
+        driver.handle_input()
+        driver.handle_input()
+
+        self.assertEqual(_count(world, 'Asteroid'), 4)
+        self.assertEqual(_count(world, 'Bullet'), 5)
+
+    def test_same_seed_gives_the_same_world(self):
+        """Two builds with the same seed should place the objects at the same positions."""
+        scenario = Scenario({'seed': 7, 'populations': [
+            {'kind': 'asteroid', 'count': 20, 'distribution': {'type': 'clusters', 'clusters': 3, 'spread': 30}},
+        ]})
+
+        first, _ = build_scenario(scenario, self.resources)
+        second, _ = build_scenario(scenario, self.resources)
+        other, _ = build_scenario(scenario, self.resources, seed=8)
+
+        def positions(world):
+            return [(obj.position.x, obj.position.y) for obj in world.get_objects_list().values()]
+        self.assertEqual(positions(first), positions(second))
+        self.assertNotEqual(positions(first), positions(other))
+
+    def test_exit_is_requested_after_the_duration(self):
+        """The driver should request the exit when the scenario duration is over."""
+        world, driver = build_scenario(Scenario({'duration_ticks': 2}), self.resources)
+
+        driver.handle_input()
+        self.assertFalse(driver.is_exit_requested())
+        driver.handle_input()
+        self.assertTrue(driver.is_exit_requested())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Tests for the server module.
+"""
+
+import unittest
+import unittest.mock
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockConfiguration
+
+from server import SharedResources, Match, MatchScheduler, MatchServer
+
+
+class FakeClock:
+    """A clock that only moves when a fake world is processed."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class MatchSchedulerTests(unittest.TestCase):
+    """Tests for MatchScheduler class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+
+    def _create_match(self, match_id, tick_seconds):
+        """Helper to create a match whose tick takes tick_seconds on the fake clock."""
+        world = unittest.mock.MagicMock()
+
+        def process(time_passed):
+            self.clock.now += tick_seconds
+        world.process = unittest.mock.MagicMock(side_effect=process)
+        return Match(match_id, world)
+
+    def test_run_round_ticks_every_match_without_frame_budget(self):
+        """Without a frame budget all the matches should be ticked."""
+        scheduler = MatchScheduler(tick_budget_seconds=1, clock=self.clock)
+        matches = [self._create_match(i, 0.001) for i in range(3)]
+        for match in matches:
+            scheduler.add_match(match)
+
+        scheduler.run_round(0.033)
+
+        for match in matches:
+            match.world.process.assert_called_once_with(0.033)
+
+    def test_run_round_reports_matches_over_tick_budget(self):
+        """The matches slower than the tick budget should be reported."""
+        scheduler = MatchScheduler(tick_budget_seconds=0.002, clock=self.clock)
+        fast_match = self._create_match(1, 0.001)
+        slow_match = self._create_match(2, 0.005)
+        scheduler.add_match(fast_match)
+        scheduler.add_match(slow_match)
+
+        overrunning = scheduler.run_round(0.033)
+
+        self.assertEqual(overrunning, [slow_match])
+        self.assertEqual(slow_match.overruns, 1)
+        self.assertEqual(scheduler.get_overrun_report(), [slow_match])
+
+    def test_run_round_logs_one_warning_for_all_the_overruns(self):
+        """A round with many overrunning matches should log a single warning, naming the worst."""
+        scheduler = MatchScheduler(tick_budget_seconds=0.002, clock=self.clock)
+        for match_id in range(50):
+            scheduler.add_match(self._create_match(match_id, 0.005))
+        scheduler.add_match(self._create_match(99, 0.009))
+
+        with self.assertLogs(level='WARNING') as logs:
+            overrunning = scheduler.run_round(0.033)
+
+        self.assertEqual(len(overrunning), 51)
+        self.assertEqual(logs.output, ["WARNING:root:51 matches overran the tick budget, the worst 99: 9.00 ms"])
+
+    def test_skipped_matches_go_first_and_receive_accumulated_time(self):
+        """A match skipped for the frame budget should be ticked first in the next round."""
+        scheduler = MatchScheduler(tick_budget_seconds=1, frame_budget_seconds=0.010,
+                                   clock=self.clock)
+        first = self._create_match(1, 0.010)
+        second = self._create_match(2, 0.010)
+        scheduler.add_match(second)
+        scheduler.add_match(first)
+
+        scheduler.run_round(0.033)
+        scheduler.run_round(0.033)
+
+        first.world.process.assert_called_once_with(0.033)
+        second.world.process.assert_called_once_with(0.066)
+
+    def test_remove_match_stops_ticking_it(self):
+        """A removed match should not be processed anymore."""
+        scheduler = MatchScheduler(tick_budget_seconds=1, clock=self.clock)
+        match = self._create_match(1, 0.001)
+        scheduler.add_match(match)
+
+        removed = scheduler.remove_match(1)
+        scheduler.run_round(0.033)
+
+        self.assertIs(removed, match)
+        match.world.process.assert_not_called()
+
+
+class MatchServerTests(unittest.TestCase):
+    """Tests for MatchServer class."""
+
+    def test_matches_share_factories_and_shapes(self):
+        """Worlds hosted by the same server should share the read-only resources."""
+        config = MockConfiguration({'game.asteroid.vertexes': [(5, 5), (-5, 5), (-5, -5)]})
+        server = MatchServer(SharedResources(config))
+        first = server.create_match()
+        second = server.create_match()
+
+        first_asteroid = server.resources.game_object_factory.create_asteroid(0, 0, 0, 10)
+        second_asteroid = server.resources.game_object_factory.create_asteroid(5, 5, 0, 10)
+
+        self.assertIsNot(first.world, second.world)
+        self.assertNotEqual(first.match_id, second.match_id)
+        self.assertIs(first_asteroid.object_vertexes, second_asteroid.object_vertexes)
+
+    def test_run_processes_matches(self):
+        """run() should tick every hosted match."""
+        server = MatchServer(SharedResources(MockConfiguration({'display.fps': 1000})))
+        match = server.create_match()
+
+        server.run(rounds=2)
+
+        self.assertEqual(match.ticks, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+Tests for the snapshot module.
+"""
+
+import unittest
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockWorld
+
+from graphicobjects import StarShip, Asteroid
+import constants
+from snapshot import (SnapshotEncoder, SnapshotDecoder, SnapshotError,
+                      HEADER, SPAWN_RECORD, UPDATE_RECORD, DESPAWN_RECORD, NO_BASELINE)
+
+
+class SnapshotTests(unittest.TestCase):
+    """Tests for SnapshotEncoder and SnapshotDecoder."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.world = MockWorld()
+        self.starship = StarShip(0, 0, constants.WHITE)
+        self.asteroid = Asteroid(-100, 25.5, 0, 10)
+        self.world.add_object(self.starship)
+        self.world.add_object(self.asteroid)
+        self.encoder = SnapshotEncoder(self.world)
+        self.encoder.add_client(1)
+        self.decoder = SnapshotDecoder()
+
+    def _send(self, tick, object_ids=None):
+        """Helper to encode a tick, decode it on the client and acknowledge it."""
+        self.encoder.begin_tick(tick)
+        payload = bytes(self.encoder.encode_for_client(1, object_ids))
+        self.decoder.decode(payload)
+        self.encoder.acknowledge(1, tick)
+        return payload
+
+    def test_first_snapshot_is_full_and_spawns_every_object(self):
+        """Without an acknowledged tick the snapshot should spawn all the objects."""
+        payload = self._send(1)
+
+        header = HEADER.unpack_from(payload, 0)
+        self.assertEqual(header[2], NO_BASELINE)
+        self.assertEqual(header[3:], (2, 0, 0))
+        self.assertEqual(len(payload), HEADER.size + 2 * SPAWN_RECORD.size)
+
+    def test_decoder_rebuilds_quantized_positions_and_angles(self):
+        """The decoded state should match the world within the quantization step."""
+        self.starship.rotate_object(30)
+
+        self._send(1)
+        entities = self.decoder.get_entities()
+
+        asteroid_state = entities[self.asteroid.id]
+        self.assertEqual(asteroid_state.kind_name, 'Asteroid')
+        self.assertAlmostEqual(asteroid_state.x, -100, places=5)
+        self.assertAlmostEqual(asteroid_state.y, 25.5, places=5)
+        self.assertEqual(entities[self.starship.id].rotation_angle, 30)
+        self.assertEqual(entities[self.starship.id].head_angle, 30)
+
+    def test_unchanged_objects_are_not_sent_again(self):
+        """After an acknowledged snapshot, an unchanged world should produce an empty delta."""
+        self._send(1)
+
+        payload = self._send(2)
+
+        self.assertEqual(HEADER.unpack_from(payload, 0)[2:], (1, 0, 0, 0))
+        self.assertEqual(len(payload), HEADER.size)
+
+    def test_moved_object_is_sent_as_update(self):
+        """Only the objects that changed should be in the delta."""
+        self._send(1)
+        self.asteroid.process(1)
+
+        payload = self._send(2)
+
+        self.assertEqual(HEADER.unpack_from(payload, 0)[3:], (0, 1, 0))
+        self.assertEqual(len(payload), HEADER.size + UPDATE_RECORD.size)
+        self.assertAlmostEqual(self.decoder.get_entities()[self.asteroid.id].x, -90, places=5)
+
+    def test_removed_object_is_sent_as_despawn(self):
+        """Objects removed from the world should be despawned on the client."""
+        self._send(1)
+        self.world.remove_object(self.asteroid.id)
+
+        payload = self._send(2)
+
+        self.assertEqual(len(payload), HEADER.size + DESPAWN_RECORD.size)
+        self.assertNotIn(self.asteroid.id, self.decoder.get_entities())
+
+    def test_delta_is_against_last_acknowledged_tick(self):
+        """A lost snapshot should not break the client state."""
+        self._send(1)
+        self.asteroid.process(1)
+        # Tick 2 is lost: encoded but never received nor acknowledged
+        self.encoder.begin_tick(2)
+        self.encoder.encode_for_client(1)
+        self.world.remove_object(self.asteroid.id)
+
+        self._send(3)
+
+        self.assertEqual(list(self.decoder.get_entities()), [self.starship.id])
+
+    def test_object_ids_restrict_the_snapshot(self):
+        """Only the requested objects should be encoded."""
+        self._send(1, object_ids=[self.starship.id])
+
+        self.assertEqual(list(self.decoder.get_entities()), [self.starship.id])
+
+    def test_decode_with_unknown_baseline_raises(self):
+        """A delta against a tick the client never received should be rejected."""
+        self._send(1)
+        self.asteroid.process(1)
+        self.encoder.begin_tick(2)
+        payload = bytes(self.encoder.encode_for_client(1))
+
+        with self.assertRaises(SnapshotError):
+            SnapshotDecoder().decode(payload)
+
+    def test_sparse_snapshots_keep_the_baseline_on_both_ends(self):
+        """Snapshots sent every few ticks, acknowledged late, should always find their baseline."""
+        encoder = SnapshotEncoder(self.world, history_size=4)
+        encoder.add_client(1)
+        decoder = SnapshotDecoder(history_size=4)
+
+        for tick in range(0, 100, 5):
+            self.asteroid.process(1)
+            encoder.begin_tick(tick)
+            decoder.decode(bytes(encoder.encode_for_client(1)))
+            # The acknowledgement arrives after the next snapshot is sent
+            if tick >= 5:
+                encoder.acknowledge(1, tick - 5)
+
+        self.assertEqual(decoder.tick, 95)
+        self.assertAlmostEqual(decoder.get_entities()[self.asteroid.id].x, self.asteroid.position.x, places=2)
+
+    def test_float_and_negative_angles_are_quantized(self):
+        """Angles should be rounded to integer degrees in [0, 360) before being packed."""
+        self.starship.rotation_angle = -30.4
+        self.starship.head_angle = 359.6
+
+        self._send(1)
+        starship_state = self.decoder.get_entities()[self.starship.id]
+
+        self.assertEqual(starship_state.rotation_angle, 330)
+        self.assertEqual(starship_state.head_angle, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
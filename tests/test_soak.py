@@ -0,0 +1,98 @@
+"""
+Tests for the soak module.
+"""
+
+import unittest
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockGameObjectFactory, MockSystemFactory
+
+from engines import World
+from graphicobjects import GraphicObject, Asteroid
+from soak import SoakRunner, SoakSample, SoakReport, LeakAuditor, percentile, is_growing
+
+
+class SoakTests(unittest.TestCase):
+    """Tests for the soak harness."""
+
+    def _create_world(self):
+        """Helper to create a World with mocked dependencies."""
+        return World((100, 100), MockGameObjectFactory(), MockSystemFactory())
+
+    def test_percentile_uses_nearest_rank(self):
+        """percentile() should pick the value at the nearest rank."""
+        values = list(range(101))
+
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_is_growing_flags_only_monotonic_growth(self):
+        """is_growing() should ignore noise, short series and growth within the tolerance."""
+        self.assertTrue(is_growing([100, 110, 120, 130, 140]))
+        self.assertFalse(is_growing([100, 130, 90, 140, 100]))
+        self.assertFalse(is_growing([100, 101, 102, 103, 104], tolerance=0.1))
+        self.assertFalse(is_growing([100, 200, 300]))
+
+    def test_leak_auditor_reports_removed_objects_still_referenced(self):
+        """A removed object kept alive for two checks should be reported as leaked."""
+        world = self._create_world()
+        auditor = LeakAuditor(world)
+        kept, released = Asteroid(0, 0, 0, 0), Asteroid(0, 0, 0, 0)
+        world.add_object(kept)
+        world.add_object(released)
+        world.remove_object(kept.id)
+        world.remove_object(released.id)
+        del released
+
+        first_check = auditor.check()
+        second_check = auditor.check()
+
+        self.assertEqual(first_check, {})
+        self.assertEqual(second_check, {'Asteroid': 1})
+
+    def test_run_samples_every_window(self):
+        """run() should tick the world and take a sample for each window, the last one partial."""
+        world = self._create_world()
+        runner = SoakRunner(world, tick_seconds=0.01, sample_every=4, top_allocators=0)
+        on_sample = []
+
+        report = runner.run(ticks=10, on_sample=on_sample.append)
+
+        self.assertEqual([sample.tick for sample in report.samples], [4, 8, 10])
+        self.assertEqual(len(on_sample), 2)
+        self.assertEqual(world.asteroid_generator.process.call_count, 10)
+        self.assertEqual(report.samples[0].object_count, 1)
+        self.assertGreaterEqual(report.samples[0].tick_p99_ms, report.samples[0].tick_p50_ms)
+
+    def test_run_reports_top_allocators(self):
+        """With tracemalloc enabled, the samples should include the top allocators."""
+        world = self._create_world()
+        runner = SoakRunner(world, sample_every=5, top_allocators=3)
+        objects = []
+        world.process = lambda time_passed: objects.append(GraphicObject())
+
+        report = runner.run(ticks=5)
+
+        self.assertTrue(0 < len(report.samples[-1].top_allocators) <= 3)
+        self.assertGreater(report.samples[-1].traced_bytes, 0)
+
+    def test_report_flags_growth_and_leaks(self):
+        """The report should list the growing series and the leaked objects."""
+        samples = []
+        for index in range(5):
+            sample = SoakSample(index, index, 10 + index)
+            sample.rss_bytes = 1000
+            samples.append(sample)
+        samples[-1].leaked_objects = {'Bullet': 2}
+
+        report = SoakReport(samples)
+
+        self.assertEqual(report.growing, ['object_count'])
+        self.assertTrue(report.has_problems)
+        self.assertIn("2 removed Bullet objects", report.format())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests for the spatial module.
+"""
+
+import unittest
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockWorld, create_test_graphic_object
+
+from spatial import SpatialHashGrid
+
+
+class SpatialHashGridTests(unittest.TestCase):
+    """Tests for SpatialHashGrid class."""
+
+    def test_query_range_returns_objects_within_radius(self):
+        """query_range() should return only the objects closer than the radius."""
+        grid = SpatialHashGrid(cell_size=10)
+        grid.insert(1, 0, 0)
+        grid.insert(2, 15, 0)
+        grid.insert(3, 100, 100)
+
+        result = grid.query_range(0, 0, 20)
+
+        self.assertEqual(sorted(result), [1, 2])
+
+    def test_query_range_handles_negative_coordinates(self):
+        """Objects in negative cells should be found."""
+        grid = SpatialHashGrid(cell_size=10)
+        grid.insert(1, -5, -5)
+        grid.insert(2, -25, -25)
+
+        result = grid.query_range(-1, -1, 10)
+
+        self.assertEqual(result, [1])
+
+    def test_query_range_excludes_objects_in_visited_cell_but_out_of_radius(self):
+        """The cell corners outside the circle should be filtered out."""
+        grid = SpatialHashGrid(cell_size=100)
+        grid.insert(1, 90, 90)
+
+        result = grid.query_range(0, 0, 100)
+
+        self.assertEqual(result, [])
+
+    def test_query_nearest_returns_the_closest_object(self):
+        """query_nearest() should find the closest object, also in a farther ring of cells."""
+        grid = SpatialHashGrid(cell_size=10)
+        grid.insert(1, 38, 0)
+        grid.insert(2, 0, 25)
+        grid.insert(3, -30, -30)
+
+        result = grid.query_nearest(1, 1, 100)
+
+        self.assertEqual(result, 2)
+
+    def test_query_nearest_ignores_objects_beyond_max_radius(self):
+        """query_nearest() should return None when no object is within the radius."""
+        grid = SpatialHashGrid(cell_size=10)
+        grid.insert(1, 50, 50)
+
+        self.assertIsNone(grid.query_nearest(0, 0, 60))
+        self.assertEqual(grid.query_nearest(0, 0, 80), 1)
+
+    def test_rebuild_indexes_world_objects_by_position(self):
+        """rebuild() should replace the content of the grid with the world objects."""
+        grid = SpatialHashGrid(cell_size=10)
+        grid.insert(99, 0, 0)
+        world = MockWorld()
+        obj = create_test_graphic_object(x=30, y=40)
+        world.add_object(obj)
+
+        grid.rebuild(world.get_objects_list())
+
+        self.assertEqual(grid.query_range(0, 0, 10), [])
+        self.assertEqual(grid.query_range(30, 40, 1), [obj.id])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests for the spriteatlas module.
+"""
+
+import unittest
+import unittest.mock
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+
+from geometrytransformation2d import Vector2D
+import constants
+from spriteatlas import SpriteAtlas, BYTES_PER_PIXEL
+
+SQUARE = (Vector2D(-5, -5), Vector2D(5, -5), Vector2D(5, 5), Vector2D(-5, 5))
+
+
+class SpriteAtlasTests(unittest.TestCase):
+    """Tests for SpriteAtlas class."""
+
+    def setUp(self):
+        """Set up an atlas creating mock surfaces, recording their sizes."""
+        self.sizes = []
+        self.atlas = SpriteAtlas(surface_factory=self._create_surface)
+
+    def _create_surface(self, size):
+        """Helper standing for pygame.Surface."""
+        self.sizes.append(size)
+        return unittest.mock.MagicMock()
+
+    def test_sprite_is_rasterized_once(self):
+        """The second request of a sprite should return the cached surface."""
+        first = self.atlas.get_sprite(SQUARE, constants.WHITE, 0)
+
+        second = self.atlas.get_sprite(SQUARE, constants.WHITE, 0)
+
+        self.assertIs(first[0], second[0])
+        self.assertEqual(len(self.sizes), 1)
+        self.assertEqual(len(self.atlas), 1)
+
+    def test_sprite_covers_the_outline_with_its_offset(self):
+        """The sprite should be the bounding box of the lines, one pixel around them."""
+        with unittest.mock.patch('pygame.draw.lines') as mock_lines:
+            surface, offset_x, offset_y = self.atlas.get_sprite(SQUARE, constants.RED, 0)
+
+        self.assertEqual((offset_x, offset_y), (-6, -6))
+        self.assertEqual(self.sizes, [(13, 13)])
+        args = mock_lines.call_args[0]
+        self.assertIs(args[0], surface)
+        self.assertEqual(args[1], constants.RED)
+        self.assertEqual(args[3], [(1, 1), (11, 1), (11, 11), (1, 11)])
+        surface.set_colorkey.assert_called_once()
+
+    def test_each_color_and_angle_has_its_sprite(self):
+        """A different color or angle of the same shape should be a new sprite."""
+        self.atlas.get_sprite(SQUARE, constants.WHITE, 0)
+
+        self.atlas.get_sprite(SQUARE, constants.RED, 0)
+        self.atlas.get_sprite(SQUARE, constants.WHITE, 45)
+
+        self.assertEqual(len(self.atlas), 3)
+        # The square rotated by 45 degrees is larger
+        self.assertGreater(self.sizes[2][0], self.sizes[0][0])
+
+    def test_memory_cap_evicts_least_recently_used(self):
+        """Over max_bytes, the sprite used the longest time ago should be evicted."""
+        sprite_bytes = 13 * 13 * BYTES_PER_PIXEL
+        atlas = SpriteAtlas(max_bytes=2 * sprite_bytes, surface_factory=self._create_surface)
+        atlas.get_sprite(SQUARE, constants.WHITE, 0)
+        atlas.get_sprite(SQUARE, constants.RED, 0)
+        atlas.get_sprite(SQUARE, constants.WHITE, 0)
+
+        atlas.get_sprite(SQUARE, constants.BLACK, 0)
+        atlas.get_sprite(SQUARE, constants.WHITE, 0)
+        atlas.get_sprite(SQUARE, constants.RED, 0)
+
+        # RED was evicted by BLACK, then rasterized again
+        self.assertEqual(len(self.sizes), 4)
+        self.assertEqual(len(atlas), 2)
+        self.assertEqual(atlas.bytes_used, 2 * sprite_bytes)
+
+    def test_invalid_max_bytes_raises(self):
+        """A cap that can't hold any sprite should be rejected."""
+        with self.assertRaises(ValueError):
+            SpriteAtlas(max_bytes=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Tests for the tracing module.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+import unittest.mock
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockGameObjectFactory, MockSystemFactory
+
+from tracing import TraceWriter, FrameTracer, NULL_TRACER
+from engines import Engine, World
+
+
+class FakeClock:
+    """A clock advanced by hand, in seconds."""
+
+    def __init__(self):
+        self.now = 10.0
+
+    def __call__(self):
+        return self.now
+
+
+class TracingTests(unittest.TestCase):
+    """Tests for FrameTracer and TraceWriter."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.writer = unittest.mock.MagicMock()
+        self.tracer = FrameTracer(self.writer, clock=self.clock)
+
+    def _get_events(self, name=None):
+        """Helper returning the complete events written so far."""
+        self.tracer.flush()
+        events = [event for (batch,), _ in self.writer.write.call_args_list for event in batch]
+        return [event for event in events if event['ph'] == 'X' and (name is None or event['name'] == name)]
+
+    def test_nested_spans_record_microseconds_from_origin(self):
+        """Each span should be a complete event with start and duration in microseconds."""
+        with self.tracer.span('frame'):
+            self.clock.now += 0.001
+            with self.tracer.span('draw'):
+                self.clock.now += 0.002
+
+        frame, = self._get_events('frame')
+        draw, = self._get_events('draw')
+        self.assertAlmostEqual(frame['ts'], 0)
+        self.assertAlmostEqual(frame['dur'], 3000)
+        self.assertAlmostEqual(draw['ts'], 1000)
+        self.assertAlmostEqual(draw['dur'], 2000)
+
+    def test_events_are_handed_to_the_writer_in_batches(self):
+        """The writer should receive the events only when a batch is full."""
+        tracer = FrameTracer(self.writer, batch_size=3, clock=self.clock)
+
+        tracer.add_complete_event('a', 10.0, 0.1)
+        self.writer.write.assert_not_called()
+        tracer.add_complete_event('b', 10.0, 0.1)
+
+        self.writer.write.assert_called_once()
+        self.assertEqual(len(self.writer.write.call_args[0][0]), 3)
+
+    def test_events_of_two_threads_are_written_once(self):
+        """The events recorded by two threads at once should all be written, each in a single batch."""
+        batches = []
+        # The batch is copied when handed: an event appended to it afterwards would be lost
+        self.writer.write.side_effect = lambda batch: batches.append(list(batch))
+        tracer = FrameTracer(self.writer, batch_size=7, clock=self.clock)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+        def record(thread_name):
+            for index in range(5000):
+                tracer.add_complete_event('%s-%d' % (thread_name, index), 10.0, 0.1)
+
+        threads = [threading.Thread(target=record, args=(thread_name,))
+                   for thread_name in ('render', 'simulation')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        tracer.flush()
+
+        names = [event['name'] for batch in batches for event in batch if event['ph'] == 'X']
+        self.assertEqual(len(names), 10000)
+        self.assertEqual(len(set(names)), 10000)
+
+    def test_writer_produces_a_chrome_trace_json_array(self):
+        """The trace file should be a JSON array with all the events of all the batches."""
+        path = os.path.join(tempfile.mkdtemp(), 'trace.json')
+        tracer = FrameTracer(TraceWriter(path), batch_size=2, clock=self.clock)
+
+        for name in ('input', 'process', 'draw'):
+            with tracer.span(name):
+                self.clock.now += 0.001
+        tracer.add_counter('objects', 5)
+        tracer.close()
+
+        with open(path) as trace_file:
+            events = json.load(trace_file)
+        self.assertEqual([event['name'] for event in events if event['ph'] == 'X'], ['input', 'process', 'draw'])
+        self.assertEqual(events[-1]['args'], {'objects': 5})
+
+    def test_null_tracer_records_nothing(self):
+        """The disabled tracer should accept spans without recording anything."""
+        with NULL_TRACER.span('frame'):
+            NULL_TRACER.add_counter('objects', 1)
+        NULL_TRACER.close()
+
+    def test_world_process_records_its_phases(self):
+        """World.process() should record the spawn, process, cull and collide phases."""
+        world = World((100, 100), MockGameObjectFactory(), MockSystemFactory())
+        world.tracer = self.tracer
+
+        world.process(0.1)
+
+        self.assertEqual([event['name'] for event in self._get_events()],
+                         ['spawn', 'process', 'cull', 'collide', 'apply_changes'])
+
+    def test_engine_frame_records_its_phases(self):
+        """Engine.run_frame() should record the frame and its phases, with the world ones nested."""
+        world = World((100, 100), MockGameObjectFactory(), MockSystemFactory())
+        input_handler = unittest.mock.MagicMock()
+        input_handler.is_exit_requested.return_value = False
+        engine = Engine(unittest.mock.MagicMock(), world, input_handler, self.tracer)
+        fps_clock = unittest.mock.MagicMock()
+        fps_clock.tick.return_value = 33
+
+        engine.run_frame(fps_clock, 30, unittest.mock.MagicMock())
+
+        names = [event['name'] for event in self._get_events()]
+        self.assertEqual(names, ['input', 'wait', 'spawn', 'process', 'cull', 'collide', 'apply_changes', 'update',
+                                 'draw', 'display_update', 'frame'])
+        input_handler.handle_input.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Tests for the vecenv module.
+"""
+
+import unittest
+
+import numpy as np
+
+# Import test configuration (sets up paths and mocks)
+import tests.conftest
+from tests.conftest import MockConfiguration
+
+from vecenv import (VectorWorldEnv, ShardedVectorWorldEnv, KIND_ASTEROID, KIND_BULLET,
+                    ACTION_ROTATE_LEFT, ACTION_ROTATE_RIGHT, ACTION_FIRE)
+
+
+def _config(**values):
+    """Helper to build a configuration with the default game values."""
+    config = {
+        'display.width': 500,
+        'display.height': 500,
+        'game.starship.reload_counter': 0,
+        'game.asteroid.spawn_countdown': 2,
+        'game.asteroid.max_count': 1,
+    }
+    config.update(values)
+    return MockConfiguration(config)
+
+
+class VectorWorldEnvTests(unittest.TestCase):
+    """Tests for VectorWorldEnv class."""
+
+    def _actions(self, *rows):
+        """Helper to build the action array, one row of pressed actions per world."""
+        actions = np.zeros((len(rows), 3), dtype=np.int8)
+        for world, pressed in enumerate(rows):
+            for action in pressed:
+                actions[world, action] = 1
+        return actions
+
+    def test_reset_returns_observation_per_world(self):
+        """reset() should return one observation row per world."""
+        env = VectorWorldEnv(3, _config(), max_bullets=4)
+
+        observations = env.reset()
+
+        self.assertEqual(observations.shape, (3, 1 + 1 + 4, 4))
+
+    def test_rotation_is_applied_per_world(self):
+        """Each world should rotate its starship with its own action."""
+        env = VectorWorldEnv(2, _config())
+        env.reset()
+
+        observations, _, _ = env.step(self._actions([ACTION_ROTATE_LEFT], [ACTION_ROTATE_RIGHT]))
+
+        self.assertAlmostEqual(observations[0, 0, 3], 350 / 360, places=5)
+        self.assertAlmostEqual(observations[1, 0, 3], 10 / 360, places=5)
+
+    def test_fire_spawns_bullet_only_when_not_reloading(self):
+        """The reload counter should prevent firing at every tick."""
+        env = VectorWorldEnv(1, _config(**{'game.starship.reload_counter': 10}))
+        env.reset()
+        env._reload_counter[:] = 0
+
+        first, _, _ = env.step(self._actions([ACTION_FIRE]))
+        second, _, _ = env.step(self._actions([ACTION_FIRE]))
+
+        self.assertEqual((first[0, :, 0] == KIND_BULLET).sum(), 1)
+        self.assertEqual((second[0, :, 0] == KIND_BULLET).sum(), 1)
+
+    def test_asteroid_is_spawned_after_countdown(self):
+        """The asteroid should appear on the left border as AsteroidGenerator does."""
+        env = VectorWorldEnv(1, _config())
+        env.reset()
+
+        first, _, _ = env.step(self._actions([]))
+        second, _, _ = env.step(self._actions([]))
+
+        self.assertEqual(first[0, 1, 0], 0)
+        self.assertEqual(second[0, 1, 0], KIND_ASTEROID)
+        self.assertAlmostEqual(second[0, 1, 1], -1, places=2)
+
+    def test_bullet_hitting_asteroid_gives_reward_and_removes_asteroid(self):
+        """A bullet overlapping an asteroid should destroy it."""
+        env = VectorWorldEnv(1, _config(**{'game.asteroid.spawn_countdown': 100}))
+        env.reset()
+        env._asteroid_alive[0, 0] = True
+        env._asteroid_position[0, 0] = (30, 0)
+        env._asteroid_angle[0, 0] = 180
+        env._spawned[0] = 1
+
+        observations, rewards, dones = env.step(self._actions([ACTION_FIRE]))
+
+        self.assertEqual(rewards[0], 1)
+        self.assertFalse(dones[0])
+        self.assertEqual(observations[0, 1, 0], 0)
+
+    def test_starship_hit_ends_episode_and_resets_world(self):
+        """An asteroid on the starship should end the episode with a penalty."""
+        env = VectorWorldEnv(2, _config(**{'game.asteroid.spawn_countdown': 100}))
+        env.reset()
+        env._asteroid_alive[1, 0] = True
+        env._asteroid_position[1, 0] = (5, 0)
+        env._starship_angle[1] = 90
+
+        observations, rewards, dones = env.step(self._actions([], []))
+
+        self.assertEqual(list(dones), [False, True])
+        self.assertEqual(rewards[1], -1)
+        self.assertEqual(observations[1, 0, 3], 0)
+
+    def test_objects_are_removed_beyond_the_world_margin(self):
+        """An asteroid off the screen but inside the margin should be kept, as World does."""
+        env = VectorWorldEnv(2, _config(**{'game.asteroid.spawn_countdown': 100,
+                                           'physics.world_bounds.margin': 50}))
+        env.reset()
+        env._asteroid_alive[:, 0] = True
+        env._asteroid_position[0, 0] = (-280, 0)
+        env._asteroid_position[1, 0] = (-320, 0)
+        env._asteroid_angle[:, 0] = 180
+
+        observations, _, _ = env.step(self._actions([], []))
+
+        self.assertEqual(observations[0, 1, 0], KIND_ASTEROID)
+        self.assertEqual(observations[1, 1, 0], 0)
+
+    def test_sharded_env_matches_single_process_env(self):
+        """Splitting the worlds across processes should not change the results."""
+        config = _config(**{'game.asteroid.max_count': 3})
+        actions_rng = np.random.default_rng(1)
+        single = VectorWorldEnv(5, config, max_asteroids=3)
+        sharded = ShardedVectorWorldEnv(5, 2, config, max_asteroids=3)
+        self.addCleanup(sharded.close)
+
+        np.testing.assert_array_equal(single.reset(), sharded.reset())
+        for _ in range(40):
+            actions = actions_rng.integers(0, 2, (5, 3))
+            single_result = single.step(actions)
+            sharded_result = sharded.step(actions)
+            for single_array, sharded_array in zip(single_result, sharded_result):
+                np.testing.assert_array_equal(single_array, sharded_array)
+
+
+if __name__ == "__main__":
+    unittest.main()
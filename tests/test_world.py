@@ -14,6 +14,8 @@ from geometrytransformation2d import Vector2D
 
 # Import World after mocks are set up
 from engines import World
+from handles import INDEX_MASK
+from rendercommands import RenderCommandBuffer
 
 
 class WorldTests(unittest.TestCase):
@@ -32,6 +34,12 @@ class WorldTests(unittest.TestCase):
             self.system_factory
         )
 
+    def test_world_size_is_the_size_given_at_creation(self):
+        """world_size should give the (width, height) of the world."""
+        world = self._create_world(320, 200)
+        
+        self.assertEqual(world.world_size, (320, 200))
+
     def test_add_object_should_add_object_to_list(self):
         """add_object should add the object to the world's object list."""
         world = self._create_world()
@@ -119,6 +127,28 @@ class WorldTests(unittest.TestCase):
         # Should have at least the starship
         self.assertGreaterEqual(len(result), 1)
     
+    def test_write_render_commands_matches_world_objects(self):
+        """write_render_commands() should write the outlines of get_world_objects_list()."""
+        world = self._create_world()
+        square = (Vector2D(5, 5), Vector2D(-5, 5), Vector2D(-5, -5), Vector2D(5, -5))
+        asteroid = GraphicObject(x=20, y=-10, vertexes_local=square)
+        asteroid.rotation_angle = 45
+        world.add_object(asteroid)
+        world.add_object(GraphicObject())
+        commands = RenderCommandBuffer()
+        
+        world.write_render_commands(commands)
+        
+        # The object without vertexes is not drawn
+        self.assertEqual(commands.object_count, 2)
+        index = commands.object_ids.tolist().index(asteroid.id)
+        start, end = commands.starts[index], commands.ends[index]
+        expected = world._get_world_vertexes_for_object(asteroid)
+        for vertex, expected_vertex in zip(commands.vertexes[start:end].tolist(), expected):
+            self.assertAlmostEqual(vertex[0], expected_vertex.x)
+            self.assertAlmostEqual(vertex[1], expected_vertex.y)
+        self.assertEqual(commands.colors[commands.color_ids[index]], asteroid.color)
+    
     def test_process_adds_new_asteroid_from_generator(self):
         """process() should add new asteroid when generator provides one."""
         world = self._create_world()
@@ -157,6 +187,167 @@ class WorldTests(unittest.TestCase):
         # Object should be removed
         self.assertNotIn(far_object_id, world._objects_list)
     
+    def test_remove_objects_not_visible_uses_world_margin(self):
+        """An object just beyond the screen edge should be kept while it is inside the margin."""
+        self.system_factory.get_world_margin = lambda: 50
+        world = self._create_world(100, 100)
+        square = [Vector2D(1, 1), Vector2D(-1, 1), Vector2D(-1, -1), Vector2D(1, -1)]
+        in_margin = GraphicObject(x=80, y=0, vertexes_local=square)
+        beyond_margin = GraphicObject(x=110, y=0, vertexes_local=square)
+        world.add_object(in_margin)
+        world.add_object(beyond_margin)
+        
+        world._remove_objects_not_visible()
+        
+        self.assertIn(in_margin.id, world._objects_list)
+        self.assertNotIn(beyond_margin.id, world._objects_list)
+    
+    def test_remove_objects_not_visible_compares_y_with_height(self):
+        """In a wide world, an object below the bottom edge should be removed."""
+        world = self._create_world(1000, 100)
+        square = [Vector2D(1, 1), Vector2D(-1, 1), Vector2D(-1, -1), Vector2D(1, -1)]
+        below = GraphicObject(x=0, y=200, vertexes_local=square)
+        world.add_object(below)
+        
+        world._remove_objects_not_visible()
+        
+        self.assertNotIn(below.id, world._objects_list)
+    
+    def test_remove_objects_not_visible_tests_vertexes_across_a_bound(self):
+        """An object across a bound should be kept only if one of its vertexes is inside."""
+        world = self._create_world(100, 100)
+        # The bounding circle crosses the right edge (x = 50), only one vertex is inside
+        across = GraphicObject(x=55, y=0, vertexes_local=[Vector2D(-10, 0), Vector2D(0, 2)])
+        # The bounding circle crosses the corner, no vertex is inside
+        corner = GraphicObject(x=56, y=56, vertexes_local=[Vector2D(0, 8), Vector2D(8, 0)])
+        world.add_object(across)
+        world.add_object(corner)
+        
+        world._remove_objects_not_visible()
+        
+        self.assertIn(across.id, world._objects_list)
+        self.assertNotIn(corner.id, world._objects_list)
+    
+    def test_process_culls_from_the_positions_of_the_slots(self):
+        """process() should cull an object its move takes beyond the bounds, and never a free or reused slot."""
+        world = self._create_world(100, 100)
+        square = [Vector2D(1, 1), Vector2D(-1, 1), Vector2D(-1, -1), Vector2D(1, -1)]
+        leaving = GraphicObject(x=45, y=0, vertexes_local=square)
+        leaving.speed = 100
+        removed = GraphicObject(x=1000, y=0, vertexes_local=square)
+        world.add_objects([leaving, removed])
+        world.remove_object(removed.id)
+        reusing = GraphicObject(x=10, y=10, vertexes_local=square)
+        world.add_object(reusing)
+
+        world.process(1)
+
+        self.assertNotIn(leaving.id, world.get_objects_list())
+        self.assertIn(reusing.id, world.get_objects_list())
+        self.assertIn(world.starship.id, world.get_objects_list())
+        self.assertEqual(world._slot_x[leaving.id & INDEX_MASK], 0.0)
+
+    def test_add_objects_and_remove_objects_in_bulk(self):
+        """add_objects() should give consecutive ids; remove_objects() should ignore unknown ids."""
+        world = self._create_world()
+        objects = [GraphicObject() for _ in range(3)]
+        removed = []
+        world.add_removal_listener(removed.append)
+        
+        world.add_objects(objects)
+        count = world.remove_objects([objects[0].id, objects[2].id, 12345])
+        
+        self.assertEqual([obj.id for obj in objects], [objects[0].id, objects[0].id + 1, objects[0].id + 2])
+        self.assertEqual(count, 2)
+        self.assertEqual(removed, [objects[0], objects[2]])
+        self.assertIn(objects[1].id, world.get_objects_list())
+    
+    def test_spawn_object_is_added_when_changes_are_applied(self):
+        """spawn_object() should give the id at once and add the object at the end of the tick."""
+        world = self._create_world()
+        obj = GraphicObject()
+        
+        world.spawn_object(obj)
+        pending = obj.id in world.get_objects_list()
+        world.apply_pending_changes()
+        
+        self.assertGreater(obj.id, 0)
+        self.assertFalse(pending)
+        self.assertIs(world.get_object(obj.id), obj)
+    
+    def test_despawn_object_hides_object_until_removed_once(self):
+        """despawn_object() should hide the object at once and remove it once at the end of the tick."""
+        world = self._create_world()
+        obj = GraphicObject()
+        world.add_object(obj)
+        removed = []
+        world.add_removal_listener(removed.append)
+        
+        world.despawn_object(obj.id)
+        world.despawn_object(obj.id)
+        hidden = world.get_object(obj.id)
+        world.apply_pending_changes()
+        
+        self.assertIsNone(hidden)
+        self.assertNotIn(obj.id, world.get_objects_list())
+        self.assertEqual(removed, [obj])
+        self.assertIsNone(world.get_object(obj.id))
+    
+    def test_stale_id_of_a_reused_slot_finds_nothing(self):
+        """The id of a removed object should stay invalid when its slot is reused."""
+        world = self._create_world()
+        removed = GraphicObject()
+        world.add_object(removed)
+        stale_id = removed.id
+        world.remove_object(stale_id)
+        
+        reusing = GraphicObject()
+        world.add_object(reusing)
+        
+        self.assertEqual(reusing.id & 0xFFFFF, stale_id & 0xFFFFF)
+        self.assertNotEqual(reusing.id, stale_id)
+        self.assertIsNone(world.get_object(stale_id))
+        self.assertIs(world.get_slots()[reusing.id & 0xFFFFF], reusing)
+    
+    def test_despawn_of_a_pending_spawn_never_adds_it(self):
+        """An object spawned and despawned in the same tick should not enter the world."""
+        world = self._create_world()
+        obj = GraphicObject()
+        removed = []
+        world.add_removal_listener(removed.append)
+        
+        world.spawn_object(obj)
+        world.despawn_object(obj.id)
+        world.apply_pending_changes()
+        
+        self.assertNotIn(obj.id, world.get_objects_list())
+        self.assertEqual(removed, [])
+    
+    def test_process_applies_despawns_of_collision_handlers(self):
+        """A despawn requested during the tick should be applied by process()."""
+        world = self._create_world()
+        obj = GraphicObject(vertexes_local=[Vector2D(1, 1), Vector2D(-1, -1)])
+        world.add_object(obj)
+        world.collision_handler.handle.side_effect = lambda: world.despawn_object(obj.id)
+        
+        world.process(1 / 30)
+        
+        self.assertNotIn(obj.id, world.get_objects_list())
+    
+    def test_remove_object_notifies_removal_listeners(self):
+        """remove_object() should remove the object and call the removal listeners once."""
+        world = self._create_world()
+        obj = GraphicObject()
+        world.add_object(obj)
+        removed = []
+        world.add_removal_listener(removed.append)
+        
+        world.remove_object(obj.id)
+        world.remove_object(obj.id)
+        
+        self.assertNotIn(obj.id, world.get_objects_list())
+        self.assertEqual(removed, [obj])
+    
     def test_remove_objects_not_visible_keeps_visible_objects(self):
         """_remove_objects_not_visible() should keep objects inside bounds."""
         world = self._create_world(100, 100)